@@ -1,26 +1,48 @@
 import sys
 import re
 import os
-import subprocess
+import time
+import threading
 from pathlib import Path
+
+# Reference point for --profile-startup; everything below counts as imports.
+_STARTED = time.perf_counter()
+
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QCheckBox, QFileDialog,
     QTextEdit, QMessageBox, QTabWidget, QScrollArea, QFrame,
     QFormLayout, QGroupBox, QSplitter, QTableWidget, QTableWidgetItem,
-    QHeaderView, QAbstractItemView
+    QHeaderView, QAbstractItemView, QSpinBox, QProgressBar, QPlainTextEdit,
+    QDialog, QDialogButtonBox, QTableView, QGridLayout, QComboBox
+)
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QObject, QThread, QSize, QUrl, QTimer, QAbstractTableModel, QModelIndex, QPointF, QEvent
+)
+from PySide6.QtGui import (
+    QFont, QColor, QPalette, QIcon, QPixmap, QPainter, QSyntaxHighlighter, QTextCharFormat,
+    QTextCursor, QDesktopServices, QTextBlockUserData, QPen, QPolygonF
 )
-from PySide6.QtCore import Qt, Signal, QObject, QThread, QSize, QRegularExpression
-from PySide6.QtGui import QFont, QColor, QPalette, QIcon, QPixmap, QPainter, QSyntaxHighlighter, QTextCharFormat
 from PySide6.QtSvg import QSvgRenderer
 
-# Attempt to import Windows-specific libraries for title bar theming
-try:
-    import ctypes
-    from ctypes import wintypes
-    IS_WINDOWS = sys.platform == "win32"
-except ImportError:
-    IS_WINDOWS = False
+from build_core import execute_build
+from build_queue import BuildQueue, BuildJob, default_concurrency
+from build_log import RotatingLogFile
+from build_history import default_history, DEFAULT_TREND_BUILDS
+from build_tuner import AutoTuner, TuneCandidate
+from bundle_report import format_size
+from import_analyzer import ImportAnalyzer
+from import_trace import trace_build
+from process_tree import BuildCancelled
+from warm_worker import shutdown_workers
+from python_env import environment_info, describe_environment
+from asset_rules import make_rule
+from asset_pipeline import TRANSFORMS as ASSET_TRANSFORMS
+from project_file import save_project, load_project, PROJECT_SUFFIX, PROJECT_FILTER
+from artifact_benchmark import DEFAULT_RUNS as DEFAULT_BENCHMARK_RUNS, DEFAULT_TIMEOUT as DEFAULT_BENCHMARK_TIMEOUT
+
+# Windows-specific libraries for title bar theming are imported on first use.
+IS_WINDOWS = sys.platform == "win32"
 
 # =================================================================================
 # Constants: SVG Icons
@@ -60,42 +82,107 @@ fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke
 # =================================================================================
 # Class: LogSyntaxHighlighter
 # =================================================================================
+class _ThemeGeneration(QTextBlockUserData):
+    # Tags each block with the theme generation it was last styled for. Block user
+    # state is not used for this because changing it makes Qt re-highlight the
+    # following block, cascading through the whole document.
+    def __init__(self, generation):
+        super().__init__()
+        self.generation = generation
+
 class LogSyntaxHighlighter(QSyntaxHighlighter):
+    # One pass per block: Py2Exe's own "[TAG]" markers and PyInstaller's
+    # "INFO:"/"WARNING:"/"ERROR:" level prefixes in a single alternation.
+    TAG_PATTERN = re.compile(r"\[(ERROR|SUCCESS|WARNING|INFO|PROCESS|CONFIG)\]|\b(INFO|WARNING|ERROR|CRITICAL):")
+    PYINSTALLER_LEVELS = {'INFO': 'info', 'WARNING': 'warning', 'ERROR': 'error', 'CRITICAL': 'error'}
+
     def __init__(self, parent, theme_colors):
         super().__init__(parent)
-        self.highlighting_rules = []
+        self.formats = {}
+        self.generation = 0
         self.update_theme(theme_colors)
 
     def update_theme(self, theme_colors):
-        self.highlighting_rules = []
-
-        keywords = {
-            'error': r'\[ERROR\]',
-            'success': r'\[SUCCESS\]',
-            'warning': r'\[WARNING\]',
-            'info': r'\[INFO\]',
-            'process': r'\[PROCESS\]',
-            'config': r'\[CONFIG\]',
-        }
-
-        for key, pattern in keywords.items():
+        self.generation += 1
+        self.formats = {}
+        for key in ('error', 'success', 'warning', 'info', 'process', 'config'):
             color = theme_colors.get(key, theme_colors['text'])
             text_format = QTextCharFormat()
             text_format.setForeground(QColor(color))
             text_format.setFontWeight(QFont.Weight.Bold)
-            self.highlighting_rules.append((QRegularExpression(pattern), text_format))
+            self.formats[key] = text_format
     
     def highlightBlock(self, text):
-        for pattern, text_format in self.highlighting_rules:
-            it = pattern.globalMatch(text)
-            while it.hasNext():
-                match = it.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), text_format)
+        self.setCurrentBlockUserData(_ThemeGeneration(self.generation))
+        if '[' not in text and ':' not in text:
+            return
+        is_ascii = text.isascii()
+        for match in self.TAG_PATTERN.finditer(text):
+            tag = match.group(1)
+            key = tag.lower() if tag else self.PYINSTALLER_LEVELS[match.group(2)]
+            start, end = match.span()
+            if not is_ascii:
+                # Qt positions are UTF-16 code units.
+                start = len(text[:start].encode('utf-16-le')) // 2
+                end = len(text[:end].encode('utf-16-le')) // 2
+            self.setFormat(start, end - start, self.formats[key])
+
+    def restyle_visible(self, log_view):
+        """Re-highlight on-screen blocks still styled for an older theme.
+
+        Theme switches call this instead of rehighlight(); off-screen blocks are
+        restyled when they are scrolled into view.
+        """
+        block = log_view.firstVisibleBlock()
+        remaining = log_view.viewport().height() // max(1, log_view.fontMetrics().lineSpacing()) + 1
+        while block.isValid() and remaining > 0:
+            data = block.userData()
+            if data is None or data.generation != self.generation:
+                self.rehighlightBlock(block)
+            block = block.next()
+            remaining -= 1
+
+def attach_log_highlighter(log_view, theme_colors):
+    highlighter = LogSyntaxHighlighter(log_view.document(), theme_colors)
+    log_view.verticalScrollBar().valueChanged.connect(lambda _value: highlighter.restyle_visible(log_view))
+    return highlighter
+
+def restyle_log_highlighter(highlighter, log_view, theme_colors):
+    highlighter.update_theme(theme_colors)
+    highlighter.restyle_visible(log_view)
+
+# =================================================================================
+# Helpers: Log views
+# =================================================================================
+
+# Log views keep only the most recent lines; the full output goes to a
+# RotatingLogFile on disk.
+DEFAULT_LOG_VIEW_LINES = 5000
+
+def create_log_view(max_lines=DEFAULT_LOG_VIEW_LINES):
+    log_view = QPlainTextEdit()
+    log_view.setReadOnly(True)
+    log_view.setFont(QFont("Consolas", 9))
+    log_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+    log_view.setMaximumBlockCount(max_lines)
+    return log_view
+
+def append_to_log_view(log_view, text):
+    # Output arrives in multi-line chunks; insert each chunk with a single edit at
+    # the end of the document and scroll once, without moving the view's cursor.
+    cursor = QTextCursor(log_view.document())
+    cursor.movePosition(QTextCursor.MoveOperation.End)
+    cursor.insertText(text)
+    scroll_bar = log_view.verticalScrollBar()
+    scroll_bar.setValue(scroll_bar.maximum())
 
 # =================================================================================
 # Class: BuildWorker (Background process handler)
 # =================================================================================
 
+# How long closing the window waits for a cancelled build to stop and clean up.
+STOP_TIMEOUT_MS = 10000
+
 class BuildWorker(QObject):
     output_signal = Signal(str)
     finished_signal = Signal(bool, str)
@@ -104,125 +191,113 @@ class BuildWorker(QObject):
         super().__init__()
         self.script_path = script_path
         self.options = options
-        self._is_running = True
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        success, message = execute_build(self.script_path, self.options, self.output_signal.emit, self.cancel_event)
+        self.finished_signal.emit(success, message)
+
+    def cancel(self):
+        # Called from the GUI thread; execute_build polls the event.
+        self.cancel_event.set()
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+# =================================================================================
+# Class: QueueWorker (Runs the build queue in the background)
+# =================================================================================
+
+class QueueWorker(QObject):
+    job_output_signal = Signal(int, str)
+    job_finished_signal = Signal(int)
+    finished_signal = Signal(bool)
+
+    def __init__(self, build_queue):
+        super().__init__()
+        self.build_queue = build_queue
+
+    def run(self):
+        success = self.build_queue.run(
+            lambda job, text: self.job_output_signal.emit(job.job_id, text),
+            lambda job: self.job_finished_signal.emit(job.job_id)
+        )
+        self.finished_signal.emit(success)
+
+# =================================================================================
+# Class: TuneWorker (Runs the auto-tuner in the background)
+# =================================================================================
+
+class TuneWorker(QObject):
+    output_signal = Signal(str)
+    candidate_signal = Signal(int)
+    finished_signal = Signal()
+
+    def __init__(self, tuner):
+        super().__init__()
+        self.tuner = tuner
+
+    def run(self):
+        self.tuner.run(
+            lambda candidate, text: self.output_signal.emit(
+                "".join(f"[{candidate.label}] {line}" for line in text.splitlines(keepends=True))),
+            lambda candidate: self.candidate_signal.emit(candidate.candidate_id)
+        )
+        self.finished_signal.emit()
+
+# =================================================================================
+# Class: TraceWorker (Runs the runtime import trace in the background)
+# =================================================================================
+
+class TraceWorker(QObject):
+    output_signal = Signal(str)
+    finished_signal = Signal(object)
+
+    def __init__(self, script_path, options, refresh):
+        super().__init__()
+        self.script_path = script_path
+        self.options = options
+        self.refresh = refresh
+        self.cancel_event = threading.Event()
 
     def run(self):
         try:
-            self.output_signal.emit("[INFO] Starting PyInstaller build process...\n")
+            proposals = trace_build(self.script_path, self.options, self.output_signal.emit, self.cancel_event,
+                                    self.refresh)
+        except BuildCancelled:
+            self.output_signal.emit("[WARNING] Import trace cancelled\n")
+            proposals = None
+        except Exception as e:
+            # The worker must always report back, or the trace button stays disabled.
+            self.output_signal.emit(f"[ERROR] Import trace failed: {e}\n")
+            proposals = None
+        self.finished_signal.emit(proposals)
 
-            cmd = ["pyinstaller"]
+    def cancel(self):
+        self.cancel_event.set()
 
-            if self.options.get('one_file'):
-                cmd.append("--onefile")
-                self.output_signal.emit("[CONFIG] One-file mode enabled\n")
-            else:
-                cmd.append("--onedir")
-                self.output_signal.emit("[CONFIG] One-directory mode enabled\n")
-
-            if self.options.get('windowed'):
-                cmd.append("--windowed")
-                self.output_signal.emit("[CONFIG] Windowed mode enabled\n")
-            else: # PyInstaller defaults to console, but explicit is better
-                cmd.append("--console")
-                self.output_signal.emit("[CONFIG] Console mode enabled\n")
-
-            icon_path = self.options.get('icon')
-            if icon_path:
-                if Path(icon_path).is_file():
-                    cmd.extend(["--icon", icon_path])
-                    self.output_signal.emit(f"[CONFIG] Icon: {icon_path}\n")
-                else:
-                    self.output_signal.emit(f"[WARNING] Icon file not found at: {icon_path}. Build will proceed with the default icon.\n")
-
-            cmd.extend(["-n", self.options['name']])
-            self.output_signal.emit(f"[CONFIG] Output name: {self.options['name']}\n")
-
-            if self.options.get('distpath'):
-                cmd.extend(["--distpath", self.options['distpath']])
-                self.output_signal.emit(f"[CONFIG] Distribution path: {self.options['distpath']}\n")
-
-            if self.options.get('workpath'):
-                cmd.extend(["--workpath", self.options['workpath']])
-                self.output_signal.emit(f"[CONFIG] Work path: {self.options['workpath']}\n")
-
-            if self.options.get('specpath'):
-                cmd.extend(["--specpath", self.options['specpath']])
-                self.output_signal.emit(f"[CONFIG] Spec path: {self.options['specpath']}\n")
-
-            if self.options.get('clean'):
-                cmd.append("--clean")
-                self.output_signal.emit("[CONFIG] Clean build enabled\n")
-
-            if self.options.get('strip'):
-                cmd.append("--strip")
-                self.output_signal.emit("[CONFIG] Binary stripping enabled\n")
-            
-            if self.options.get('upx_dir'):
-                cmd.append("--upx-dir=" + self.options['upx_dir'])
-                self.output_signal.emit(f"[CONFIG] UPX directory: {self.options['upx_dir']}\n")
-            elif self.options.get('noupx'):
-                cmd.append("--noupx")
-                self.output_signal.emit("[CONFIG] UPX disabled\n")
-
-            if self.options.get('hidden_imports'):
-                for imp in self.options['hidden_imports']:
-                    cmd.extend(["--hidden-import", imp])
-                self.output_signal.emit(f"[CONFIG] Hidden imports: {', '.join(self.options['hidden_imports'])}\n")
-
-            if self.options.get('collect_all'):
-                for pkg in self.options['collect_all']:
-                    cmd.extend(["--collect-all", pkg])
-                self.output_signal.emit(f"[CONFIG] Collect all: {', '.join(self.options['collect_all'])}\n")
-
-            if self.options.get('exclude_modules'):
-                for mod in self.options['exclude_modules']:
-                    cmd.extend(["--exclude-module", mod])
-                self.output_signal.emit(f"[CONFIG] Excluded modules: {', '.join(self.options['exclude_modules'])}\n")
-
-            if self.options.get('add_data'):
-                data_separator = os.pathsep
-                for source, dest in self.options['add_data']:
-                    cmd.extend(["--add-data", f"{source}{data_separator}{dest}"])
-                self.output_signal.emit(f"[CONFIG] Added data files: {len(self.options['add_data'])}\n")
-
-            cmd.append(self.script_path)
-            self.output_signal.emit(f"[CONFIG] Script: {self.script_path}\n")
-            self.output_signal.emit("\n" + "="*80 + "\n")
-            self.output_signal.emit("[PROCESS] Executing PyInstaller...\n\n")
-
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                bufsize=1
-            )
+# =================================================================================
+# Class: AnalyzerWorker (Background import analysis)
+# =================================================================================
 
-            for line in iter(process.stdout.readline, ''):
-                if line:
-                    self.output_signal.emit(line)
+class AnalyzerWorker(QObject):
+    finished_signal = Signal(str, object)
 
-            process.wait()
+    def __init__(self):
+        super().__init__()
+        self.analyzer = ImportAnalyzer()
 
-            if process.returncode == 0:
-                self.output_signal.emit("\n" + "="*80 + "\n")
-                self.output_signal.emit("[SUCCESS] Build completed successfully!\n")
-                self.finished_signal.emit(True, "Build completed successfully!")
-            else:
-                self.output_signal.emit("\n" + "="*80 + "\n")
-                self.output_signal.emit(f"[ERROR] Build failed with return code {process.returncode}\n")
-                self.finished_signal.emit(False, f"Build failed with return code {process.returncode}")
-
-        except FileNotFoundError:
-            self.output_signal.emit("[ERROR] Critical: 'pyinstaller' command not found.\n"
-                                    "[ERROR] Please ensure PyInstaller is installed and accessible in your system's PATH.\n"
-                                    "[ERROR] Installation: pip install pyinstaller\n")
-            self.finished_signal.emit(False, "PyInstaller not found or not in PATH.")
+    @Slot(str, str)
+    def analyze(self, script_path, python):
+        try:
+            # The cached introspection only queries the interpreter when it changed.
+            environment = environment_info(python) if python else None
+            result = self.analyzer.analyze(script_path, environment)
+            if environment is not None:
+                result['environment'] = describe_environment(environment)
         except Exception as e:
-            self.output_signal.emit(f"[ERROR] An unexpected error occurred: {str(e)}\n")
-            self.finished_signal.emit(False, str(e))
+            result = {'error': str(e)}
+        self.finished_signal.emit(script_path, result)
 
 # =================================================================================
 # Class: ThemeManager (Handles application styling)
@@ -271,8 +346,17 @@ class ThemeManager:
         }
     }
 
+    _stylesheets = {}
+
     @staticmethod
     def get_stylesheet(theme_name="light"):
+        # Each theme's stylesheet is formatted once per process.
+        if theme_name not in ThemeManager._stylesheets:
+            ThemeManager._stylesheets[theme_name] = ThemeManager._format_stylesheet(theme_name)
+        return ThemeManager._stylesheets[theme_name]
+
+    @staticmethod
+    def _format_stylesheet(theme_name):
         colors = ThemeManager.THEMES.get(theme_name, ThemeManager.THEMES["light"])
         return f"""
             QWidget {{
@@ -322,17 +406,17 @@ class ThemeManager:
             QLabel {{
                 color: {colors['text']};
             }}
-            QLineEdit, QTextEdit, QTableWidget {{
+            QLineEdit, QTextEdit, QPlainTextEdit, QTableView {{
                 background-color: {colors['bg_sunken']};
                 color: {colors['text']};
                 border: 1px solid {colors['border']};
                 border-radius: 4px;
                 padding: 5px;
             }}
-            QTextEdit#logDisplay {{
+            QPlainTextEdit#logDisplay {{
                  color: {colors['text_dim']};
             }}
-            QLineEdit:focus, QTextEdit:focus, QTableWidget:focus {{
+            QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QTableView:focus {{
                 border: 1px solid {colors['primary']};
             }}
             QPushButton {{
@@ -453,6 +537,138 @@ class PathSelectorWidget(QWidget):
     def setText(self, text):
         self.line_edit.setText(text)
 
+# =================================================================================
+# Class: AssetTableModel
+# =================================================================================
+class AssetTableModel(QAbstractTableModel):
+    # Rows live in two parallel lists instead of one item object per cell, and
+    # every bulk operation is a single model notification, so tens of thousands
+    # of assets can be added, sorted, filtered or removed without freezing the UI.
+    HEADERS = ["Source Path", "Destination in App (e.g., '.', 'data/')"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sources = []
+        self._dests = []
+        self._known = set()
+        self._filter = ""
+        self._visible = None  # row -> asset index while a filter is active
+
+    def _asset_index(self, row):
+        return self._visible[row] if self._visible is not None else row
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._visible) if self._visible is not None else len(self._sources)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole, Qt.ItemDataRole.ToolTipRole):
+            i = self._asset_index(index.row())
+            return self._sources[i] if index.column() == 0 else self._dests[i]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        return flags | Qt.ItemFlag.ItemIsEditable if index.column() == 1 else flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() != 1:
+            return False
+        self._dests[self._asset_index(index.row())] = str(value).strip()
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def _matches(self, i):
+        return self._filter in self._sources[i].lower() or self._filter in self._dests[i].lower()
+
+    def add_assets(self, assets):
+        """Append ``(source, dest)`` pairs, skipping sources already listed. Returns the number added."""
+        new_sources, new_dests = [], []
+        for source, dest in assets:
+            if source and source not in self._known:
+                self._known.add(source)
+                new_sources.append(source)
+                new_dests.append(dest)
+        if not new_sources:
+            return 0
+
+        first = len(self._sources)
+        new_indexes = range(first, first + len(new_sources))
+        if self._visible is None:
+            self.beginInsertRows(QModelIndex(), first, first + len(new_sources) - 1)
+            self._sources.extend(new_sources)
+            self._dests.extend(new_dests)
+            self.endInsertRows()
+        else:
+            self._sources.extend(new_sources)
+            self._dests.extend(new_dests)
+            matching = [i for i in new_indexes if self._matches(i)]
+            if matching:
+                row = len(self._visible)
+                self.beginInsertRows(QModelIndex(), row, row + len(matching) - 1)
+                self._visible.extend(matching)
+                self.endInsertRows()
+        return len(new_sources)
+
+    def remove_rows(self, rows):
+        """Remove the given view rows in one pass."""
+        doomed = {self._asset_index(row) for row in rows}
+        if not doomed:
+            return
+        self.beginResetModel()
+        keep = [i for i in range(len(self._sources)) if i not in doomed]
+        self._sources = [self._sources[i] for i in keep]
+        self._dests = [self._dests[i] for i in keep]
+        self._known = set(self._sources)
+        self._apply_filter()
+        self.endResetModel()
+
+    def set_assets(self, assets):
+        self.beginResetModel()
+        self._sources, self._dests, self._known = [], [], set()
+        for source, dest in assets:
+            if source and source not in self._known:
+                self._known.add(source)
+                self._sources.append(source)
+                self._dests.append(dest)
+        self._apply_filter()
+        self.endResetModel()
+
+    def asset_count(self):
+        return len(self._sources)
+
+    def assets(self):
+        return [(source, dest) for source, dest in zip(self._sources, self._dests) if dest]
+
+    def _apply_filter(self):
+        self._visible = ([i for i in range(len(self._sources)) if self._matches(i)]
+                         if self._filter else None)
+
+    def set_filter(self, text):
+        self.beginResetModel()
+        self._filter = text.strip().lower()
+        self._apply_filter()
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        keys = self._sources if column == 0 else self._dests
+        order_indexes = sorted(range(len(keys)), key=keys.__getitem__,
+                               reverse=order == Qt.SortOrder.DescendingOrder)
+        self.beginResetModel()
+        self._sources = [self._sources[i] for i in order_indexes]
+        self._dests = [self._dests[i] for i in order_indexes]
+        self._apply_filter()
+        self.endResetModel()
+
 # =================================================================================
 # Classes: UI Tabs
 # =================================================================================
@@ -471,9 +687,12 @@ class BasicOptionsTab(QWidget):
         self.script_input.line_edit.textChanged.connect(self._auto_fill_app_name)
         self.app_name_input = QLineEdit("MyApp")
         self.icon_input = PathSelectorWidget("Icon File", "Select Icon File", "Icon Files (*.ico)")
+        self.python_input = PathSelectorWidget("Python Interpreter", "Select Python Interpreter")
+        self.python_input.line_edit.setPlaceholderText("Interpreter or virtualenv folder (default: pyinstaller on PATH)")
         main_layout.addRow("Script Path:", self.script_input)
         main_layout.addRow("Application Name:", self.app_name_input)
         main_layout.addRow("Icon (.ico):", self.icon_input)
+        main_layout.addRow("Python Interpreter:", self.python_input)
         layout.addWidget(main_group)
 
         # Output Directories Group
@@ -514,6 +733,7 @@ class BasicOptionsTab(QWidget):
         return {
             'script': self.script_input.text(),
             'name': self.app_name_input.text().strip() or "MyApp",
+            'python': self.python_input.text() or None,
             'icon': self.icon_input.text() or None,
             'distpath': self.distpath_input.text() or None,
             'workpath': self.workpath_input.text() or None,
@@ -522,6 +742,17 @@ class BasicOptionsTab(QWidget):
             'windowed': self.windowed_check.isChecked(),
         }
 
+    def set_options(self, script_path, options):
+        self.script_input.setText(script_path or "")
+        self.app_name_input.setText(options.get('name') or "MyApp")
+        self.python_input.setText(options.get('python') or "")
+        self.icon_input.setText(options.get('icon') or "")
+        self.distpath_input.setText(options.get('distpath') or "")
+        self.workpath_input.setText(options.get('workpath') or "")
+        self.specpath_input.setText(options.get('specpath') or "")
+        self.one_file_check.setChecked(bool(options.get('one_file')))
+        self.windowed_check.setChecked(bool(options.get('windowed')))
+
 class AdvancedOptionsTab(QWidget):
     def __init__(self):
         super().__init__()
@@ -531,14 +762,42 @@ class AdvancedOptionsTab(QWidget):
 
         # Build Options Group
         build_group = QGroupBox("Build Process")
-        build_layout = QHBoxLayout(build_group)
+        build_layout = QGridLayout(build_group)
         self.clean_check = QCheckBox("Clean Build")
         self.clean_check.setToolTip("Remove PyInstaller cache and temporary files before building.")
         self.strip_check = QCheckBox("Strip Binaries")
         self.strip_check.setToolTip("Apply a symbol-table strip to the executable and shared libraries.")
-        build_layout.addWidget(self.clean_check)
-        build_layout.addWidget(self.strip_check)
-        build_layout.addStretch()
+        self.cache_check = QCheckBox("Use Build Cache")
+        self.cache_check.setToolTip("Restore the previous artifact instead of rebuilding when the script, its imports, "
+                                    "assets, icon, options and toolchain are all unchanged.")
+        self.size_report_check = QCheckBox("Size Report")
+        self.size_report_check.setChecked(True)
+        self.size_report_check.setToolTip("After a successful build, log a per-package size breakdown and flag "
+                                          "growth compared with the previous build of the same application.")
+        self.reuse_spec_check = QCheckBox("Reuse Spec File")
+        self.reuse_spec_check.setToolTip("Generate <name>.spec once and build from it afterwards. The spec is only "
+                                         "regenerated when options change; a hand-written spec is always used as is.")
+        self.validate_check = QCheckBox("Validate Inputs")
+        self.validate_check.setChecked(True)
+        self.validate_check.setToolTip("Before PyInstaller starts, check the icon, UPX directory, asset sources and "
+                                       "that every hidden import, collect-all and exclude name can be found.")
+        self.timing_check = QCheckBox("Phase Timeline")
+        self.timing_check.setChecked(True)
+        self.timing_check.setToolTip("After each build, log how long every stage and PyInstaller phase took, the "
+                                     "slowest PyInstaller steps, CPU time and peak memory.")
+        self.incremental_check = QCheckBox("Incremental")
+        self.incremental_check.setToolTip("Keep a work directory next to the script and rebuild only what changed. "
+                                          "A clean build is forced automatically when hidden imports, collect-all, "
+                                          "excludes or the Python/PyInstaller version change.")
+        self.warm_worker_check = QCheckBox("Warm Worker")
+        self.warm_worker_check.setToolTip("Keep PyInstaller loaded in a background process and start each build as "
+                                          "a fork of it, skipping the interpreter and PyInstaller start-up. "
+                                          "Not available on Windows.")
+        self.warm_worker_check.setEnabled(hasattr(os, "fork"))
+        for position, check in enumerate((self.clean_check, self.strip_check, self.cache_check,
+                                          self.reuse_spec_check, self.incremental_check, self.size_report_check,
+                                          self.validate_check, self.timing_check, self.warm_worker_check)):
+            build_layout.addWidget(check, position // 3, position % 3)
         layout.addWidget(build_group)
         
         # UPX Compression Group
@@ -547,11 +806,69 @@ class AdvancedOptionsTab(QWidget):
         upx_layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
         self.upx_dir_input = PathSelectorWidget("UPX Directory", "Select UPX Directory", is_directory=True)
         self.noupx_check = QCheckBox("Disable UPX")
+        self.parallel_upx_check = QCheckBox("Compress in parallel (one-directory builds)")
+        self.parallel_upx_check.setToolTip("Skip PyInstaller's serial UPX step and compress the bundle's binaries "
+                                           "concurrently afterwards, reusing cached results for unchanged files.")
+        self.upx_exclude_input = QLineEdit()
+        self.upx_exclude_input.setPlaceholderText("e.g., libcrypto*.so*, *.pyd (comma-separated patterns)")
         upx_layout.addRow("UPX Path:", self.upx_dir_input)
         upx_layout.addRow("", self.noupx_check)
+        upx_layout.addRow("", self.parallel_upx_check)
+        upx_layout.addRow("Never compress:", self.upx_exclude_input)
         layout.addWidget(upx_group)
+
+        # Startup Benchmark Group
+        benchmark_group = QGroupBox("Startup Benchmark")
+        benchmark_layout = QFormLayout(benchmark_group)
+        self.benchmark_check = QCheckBox("Benchmark executable after build")
+        self.benchmark_check.setToolTip("Launch the built executable several times and log cold/warm start time "
+                                        "and peak memory, compared with previous configurations.")
+        self.benchmark_args_input = QLineEdit()
+        self.benchmark_args_input.setPlaceholderText("e.g., --version")
+        self.benchmark_runs_spin = QSpinBox()
+        self.benchmark_runs_spin.setRange(1, 100)
+        self.benchmark_runs_spin.setValue(DEFAULT_BENCHMARK_RUNS)
+        self.benchmark_timeout_spin = QSpinBox()
+        self.benchmark_timeout_spin.setRange(1, 600)
+        self.benchmark_timeout_spin.setSuffix(" s")
+        self.benchmark_timeout_spin.setValue(int(DEFAULT_BENCHMARK_TIMEOUT))
+        benchmark_layout.addRow("", self.benchmark_check)
+        benchmark_layout.addRow("Smoke-test arguments:", self.benchmark_args_input)
+        benchmark_layout.addRow("Warm runs:", self.benchmark_runs_spin)
+        benchmark_layout.addRow("Timeout per run:", self.benchmark_timeout_spin)
+        self.drop_caches_check = QCheckBox("Drop the page cache before the cold run")
+        self.drop_caches_check.setToolTip("Evict the whole machine's page cache so the cold run reads everything from "
+                                          "disk. Linux only, and only when running as root.")
+        benchmark_layout.addRow("", self.drop_caches_check)
+        layout.addWidget(benchmark_group)
+
+        # Build Agents Group
+        agents_group = QGroupBox("Build Agents")
+        agents_layout = QHBoxLayout(agents_group)
+        self.agents_input = QLineEdit()
+        self.agents_input.setPlaceholderText("e.g., buildbox1:8765, buildbox2:8765 (empty builds locally)")
+        self.agents_input.setToolTip("Send builds to the least-loaded of these agents (started with build_agent.py) "
+                                     "and pull the artifact back into the dist directory.")
+        self.check_agents_button = QPushButton("Check Agents")
+        self.check_agents_button.clicked.connect(self.check_agents)
+        agents_layout.addWidget(self.agents_input)
+        agents_layout.addWidget(self.check_agents_button)
+        layout.addWidget(agents_group)
         
         layout.addStretch()
+
+    def agent_addresses(self):
+        return [a.strip() for a in self.agents_input.text().split(',') if a.strip()]
+
+    def check_agents(self):
+        addresses = self.agent_addresses()
+        if not addresses:
+            QMessageBox.information(self, "Build Agents", "No build agents are configured.")
+            return
+        from remote_build import agent_statuses, describe_agent
+        statuses = agent_statuses(addresses)
+        QMessageBox.information(self, "Build Agents",
+                                "\n".join(describe_agent(address, status) for address, status in statuses.items()))
     
     def get_options(self):
         return {
@@ -559,15 +876,78 @@ class AdvancedOptionsTab(QWidget):
             'strip': self.strip_check.isChecked(),
             'upx_dir': self.upx_dir_input.text() or None,
             'noupx': self.noupx_check.isChecked(),
+            'parallel_upx': self.parallel_upx_check.isChecked(),
+            'upx_exclude': [p.strip() for p in self.upx_exclude_input.text().split(',') if p.strip()],
+            'use_cache': self.cache_check.isChecked(),
+            'reuse_spec': self.reuse_spec_check.isChecked(),
+            'incremental': self.incremental_check.isChecked(),
+            'warm_worker': self.warm_worker_check.isChecked(),
+            'size_report': self.size_report_check.isChecked(),
+            'validate': self.validate_check.isChecked(),
+            'phase_timing': self.timing_check.isChecked(),
+            'benchmark': self.benchmark_check.isChecked(),
+            'benchmark_args': self.benchmark_args_input.text().strip(),
+            'benchmark_runs': self.benchmark_runs_spin.value(),
+            'benchmark_timeout': self.benchmark_timeout_spin.value(),
+            'benchmark_drop_caches': self.drop_caches_check.isChecked(),
+            'agents': self.agent_addresses(),
         }
 
+    def set_options(self, options):
+        self.clean_check.setChecked(bool(options.get('clean')))
+        self.strip_check.setChecked(bool(options.get('strip')))
+        self.upx_dir_input.setText(options.get('upx_dir') or "")
+        self.noupx_check.setChecked(bool(options.get('noupx')))
+        self.parallel_upx_check.setChecked(bool(options.get('parallel_upx')))
+        self.upx_exclude_input.setText(", ".join(options.get('upx_exclude') or []))
+        self.cache_check.setChecked(bool(options.get('use_cache')))
+        self.reuse_spec_check.setChecked(bool(options.get('reuse_spec')))
+        self.incremental_check.setChecked(bool(options.get('incremental')))
+        self.warm_worker_check.setChecked(bool(options.get('warm_worker')))
+        self.size_report_check.setChecked(bool(options.get('size_report')))
+        self.validate_check.setChecked(options.get('validate', True))
+        self.timing_check.setChecked(options.get('phase_timing', True))
+        self.benchmark_check.setChecked(bool(options.get('benchmark')))
+        self.benchmark_args_input.setText(options.get('benchmark_args') or "")
+        self.benchmark_runs_spin.setValue(options.get('benchmark_runs') or DEFAULT_BENCHMARK_RUNS)
+        self.benchmark_timeout_spin.setValue(int(options.get('benchmark_timeout') or DEFAULT_BENCHMARK_TIMEOUT))
+        self.drop_caches_check.setChecked(bool(options.get('benchmark_drop_caches')))
+        self.agents_input.setText(", ".join(options.get('agents') or []))
+
 class PackagesTab(QWidget):
+    analyze_requested = Signal()
+    trace_requested = Signal(bool)
+    output_signal = Signal(str)
+
+    TRACE_COLUMNS = ["Exclude", "Confidence", "Saves", "Modules", "Reason"]
+
     def __init__(self):
         super().__init__()
+        self.suggestions = None
+        self.proposals = []
+        self.trace_thread = None
+        self.trace_worker = None
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
 
+        suggestions_group = QGroupBox("Suggestions from Script Analysis")
+        suggestions_layout = QVBoxLayout(suggestions_group)
+        self.suggestions_label = QLabel("Select a script to analyze its imports.")
+        self.suggestions_label.setWordWrap(True)
+        suggestions_button_layout = QHBoxLayout()
+        self.analyze_button = QPushButton("Analyze Script")
+        self.analyze_button.clicked.connect(self.analyze_requested)
+        self.apply_suggestions_button = QPushButton("Add Suggestions")
+        self.apply_suggestions_button.setEnabled(False)
+        self.apply_suggestions_button.clicked.connect(self.apply_suggestions)
+        suggestions_button_layout.addStretch()
+        suggestions_button_layout.addWidget(self.analyze_button)
+        suggestions_button_layout.addWidget(self.apply_suggestions_button)
+        suggestions_layout.addWidget(self.suggestions_label)
+        suggestions_layout.addLayout(suggestions_button_layout)
+        layout.addWidget(suggestions_group)
+
         hidden_group = QGroupBox("Hidden Imports")
         hidden_layout = QVBoxLayout(hidden_group)
         self.hidden_imports_edit = QTextEdit()
@@ -589,6 +969,138 @@ class PackagesTab(QWidget):
         exclude_layout.addWidget(self.exclude_modules_edit)
         layout.addWidget(exclude_group)
 
+        trace_group = QGroupBox("Runtime Import Trace")
+        trace_layout = QVBoxLayout(trace_group)
+        trace_label = QLabel("Runs the script with the smoke-test arguments from Advanced Options, records every "
+                             "module it imports and proposes excludes for what the last build bundled but the "
+                             "program never loaded. Build the script once before tracing.")
+        trace_label.setWordWrap(True)
+        self.trace_table = QTableWidget()
+        self.trace_table.setColumnCount(len(self.TRACE_COLUMNS))
+        self.trace_table.setHorizontalHeaderLabels(self.TRACE_COLUMNS)
+        self.trace_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.trace_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
+        self.trace_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.trace_table.verticalHeader().setVisible(False)
+        self.trace_table.setMinimumHeight(150)
+        self.retrace_check = QCheckBox("Re-run the smoke test")
+        self.retrace_check.setToolTip("Ignore the saved trace, which is otherwise reused until the script's "
+                                      "local modules, the interpreter or the smoke-test arguments change.")
+        self.trace_button = QPushButton("Trace Imports")
+        self.trace_button.clicked.connect(self._trace_button_clicked)
+        self.apply_trace_button = QPushButton("Add Checked Excludes")
+        self.apply_trace_button.setEnabled(False)
+        self.apply_trace_button.clicked.connect(self.apply_trace_excludes)
+        trace_button_layout = QHBoxLayout()
+        trace_button_layout.addWidget(self.retrace_check)
+        trace_button_layout.addStretch()
+        trace_button_layout.addWidget(self.trace_button)
+        trace_button_layout.addWidget(self.apply_trace_button)
+        trace_layout.addWidget(trace_label)
+        trace_layout.addWidget(self.trace_table)
+        trace_layout.addLayout(trace_button_layout)
+        layout.addWidget(trace_group)
+
+    def show_suggestions(self, result):
+        if 'error' in result:
+            self.suggestions = None
+            self.suggestions_label.setText(f"Analysis failed: {result['error']}")
+            self.apply_suggestions_button.setEnabled(False)
+            return
+
+        self.suggestions = result
+        lines = []
+        for key, label in (('hidden_imports', "Hidden imports"), ('collect_all', "Collect all"),
+                           ('exclude_modules', "Excludes")):
+            if result[key]:
+                lines.append(f"<b>{label}:</b> {', '.join(result[key])}")
+        if not lines:
+            lines.append("No suggestions.")
+        if result['missing']:
+            lines.append(f"<b>Not installed in the interpreter:</b> {', '.join(result['missing'])}")
+        if result.get('environment'):
+            lines.append(f"<i>{result['environment']}</i>")
+        lines.append(f"<i>{result['modules_scanned']} module(s) analyzed in {result['elapsed'] * 1000:.0f} ms</i>")
+        self.suggestions_label.setText("<br>".join(lines))
+        self.apply_suggestions_button.setEnabled(True)
+
+    def apply_suggestions(self):
+        if not self.suggestions:
+            return
+        for key, edit in (('hidden_imports', self.hidden_imports_edit), ('collect_all', self.collect_all_edit),
+                          ('exclude_modules', self.exclude_modules_edit)):
+            existing = [line.strip() for line in edit.toPlainText().split('\n') if line.strip()]
+            added = [name for name in self.suggestions[key] if name not in existing]
+            if added:
+                edit.setPlainText('\n'.join(existing + added))
+
+    def is_tracing(self):
+        return self.trace_thread is not None and self.trace_thread.isRunning()
+
+    def _trace_button_clicked(self):
+        if self.is_tracing():
+            self.trace_worker.cancel()
+            self.trace_button.setEnabled(False)
+            self.trace_button.setText("Cancelling...")
+        else:
+            self.trace_requested.emit(self.retrace_check.isChecked())
+
+    def start_trace(self, script_path, options, refresh):
+        if self.is_tracing():
+            return
+        self.trace_button.setText("Cancel Trace")
+        self.apply_trace_button.setEnabled(False)
+
+        self.trace_worker = TraceWorker(script_path, options, refresh)
+        self.trace_worker.output_signal.connect(self.output_signal)
+        self.trace_worker.finished_signal.connect(self._trace_finished)
+
+        self.trace_thread = QThread()
+        self.trace_worker.moveToThread(self.trace_thread)
+        self.trace_thread.started.connect(self.trace_worker.run)
+        self.trace_thread.start()
+
+    def stop_trace(self):
+        if self.is_tracing():
+            self.trace_worker.cancel()
+            self.trace_thread.quit()
+            self.trace_thread.wait(STOP_TIMEOUT_MS)
+
+    def _trace_finished(self, proposals):
+        self.trace_button.setEnabled(True)
+        self.trace_button.setText("Trace Imports")
+        if self.trace_thread:
+            self.trace_thread.quit()
+            self.trace_thread.wait()
+            self.trace_thread = None
+        if proposals is None:
+            return
+        self.proposals = proposals
+        self.trace_table.setRowCount(len(proposals))
+        for row, proposal in enumerate(proposals):
+            item = QTableWidgetItem(proposal['module'])
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            # Only the high-confidence proposals are safe to take without a look.
+            checked = proposal['confidence'] == "high"
+            item.setCheckState(Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked)
+            self.trace_table.setItem(row, 0, item)
+            for column, value in enumerate((proposal['confidence'], format_size(proposal['size']),
+                                            str(proposal['modules']), proposal['reason']), start=1):
+                self.trace_table.setItem(row, column, QTableWidgetItem(value))
+        self.apply_trace_button.setEnabled(bool(proposals))
+        if not proposals:
+            self.output_signal.emit("[SUCCESS] The last build bundles nothing the smoke test did not import\n")
+
+    def apply_trace_excludes(self):
+        checked = [self.trace_table.item(row, 0).text() for row in range(self.trace_table.rowCount())
+                   if self.trace_table.item(row, 0).checkState() == Qt.CheckState.Checked]
+        existing = [line.strip() for line in self.exclude_modules_edit.toPlainText().split('\n') if line.strip()]
+        added = [name for name in checked if name not in existing]
+        if added:
+            self.exclude_modules_edit.setPlainText('\n'.join(existing + added))
+            self.output_signal.emit(f"[INFO] Added {len(added)} exclude(s) from the import trace; rebuild to "
+                                    f"apply them\n")
+
     def get_options(self):
         hidden_imports = [line.strip() for line in self.hidden_imports_edit.toPlainText().split('\n') if line.strip()]
         collect_all = [line.strip() for line in self.collect_all_edit.toPlainText().split('\n') if line.strip()]
@@ -599,7 +1111,14 @@ class PackagesTab(QWidget):
             'exclude_modules': exclude_modules,
         }
 
+    def set_options(self, options):
+        self.hidden_imports_edit.setPlainText('\n'.join(options.get('hidden_imports') or []))
+        self.collect_all_edit.setPlainText('\n'.join(options.get('collect_all') or []))
+        self.exclude_modules_edit.setPlainText('\n'.join(options.get('exclude_modules') or []))
+
 class AssetsTab(QWidget):
+    RULE_COLUMNS = ["Folder", "Destination", "Include", "Exclude", "Max MiB", "Symlinks"]
+
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout(self)
@@ -619,76 +1138,682 @@ class AssetsTab(QWidget):
         button_layout.addStretch()
         button_layout.addWidget(self.remove_button)
 
-        self.assets_table = QTableWidget()
-        self.assets_table.setColumnCount(2)
-        self.assets_table.setHorizontalHeaderLabels(["Source Path", "Destination in App (e.g., '.', 'data/')"])
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter assets...")
+        self.filter_input.setClearButtonEnabled(True)
+        self.count_label = QLabel()
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(self.filter_input, 1)
+        filter_layout.addWidget(self.count_label)
+
+        self.assets_model = AssetTableModel(self)
+        self.assets_table = QTableView()
+        self.assets_table.setModel(self.assets_model)
         self.assets_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.assets_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
         self.assets_table.setColumnWidth(1, 250)
+        # Fixed row heights keep the view from measuring every row.
+        self.assets_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.assets_table.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 10)
         self.assets_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.assets_table.setSortingEnabled(True)
+        self.assets_table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
 
         self.add_file_button.clicked.connect(self.add_files)
         self.add_folder_button.clicked.connect(self.add_folder)
         self.remove_button.clicked.connect(self.remove_selected)
+        self.filter_input.textChanged.connect(self.assets_model.set_filter)
+        self.assets_model.modelReset.connect(self._update_count)
+        self.assets_model.rowsInserted.connect(self._update_count)
 
         assets_layout.addLayout(button_layout)
+        assets_layout.addLayout(filter_layout)
         assets_layout.addWidget(self.assets_table)
         
         layout.addWidget(assets_group)
+
+        # Folder rules are stored as rules and expanded into files at build time.
+        rules_group = QGroupBox("Folder Rules (expanded at build time)")
+        rules_layout = QVBoxLayout(rules_group)
+        rules_button_layout = QHBoxLayout()
+        self.add_rule_button = QPushButton("Add Folder Rule...")
+        self.add_rule_button.setToolTip("Bundle a whole folder tree filtered by patterns. __pycache__, .git and "
+                                        "similar clutter are always skipped.")
+        self.remove_rule_button = QPushButton("Remove Rule")
+        rules_button_layout.addWidget(self.add_rule_button)
+        rules_button_layout.addStretch()
+        rules_button_layout.addWidget(self.remove_rule_button)
+
+        self.rules_table = QTableWidget()
+        self.rules_table.setColumnCount(len(self.RULE_COLUMNS))
+        self.rules_table.setHorizontalHeaderLabels(self.RULE_COLUMNS)
+        self.rules_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.rules_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.rules_table.setToolTip("Include/Exclude: comma-separated patterns matched against file names and "
+                                    "paths relative to the folder. Max MiB: skip larger files (empty for no limit).")
+        self.rules_table.setMaximumHeight(160)
+
+        self.add_rule_button.clicked.connect(self.add_rule)
+        self.remove_rule_button.clicked.connect(self.remove_rule)
+
+        rules_layout.addLayout(rules_button_layout)
+        rules_layout.addWidget(self.rules_table)
+        layout.addWidget(rules_group)
+
+        pipeline_group = QGroupBox("Pre-processing")
+        pipeline_layout = QVBoxLayout(pipeline_group)
+        transforms_layout = QHBoxLayout()
+        self.pipeline_check = QCheckBox("Optimize assets before bundling:")
+        self.pipeline_check.setToolTip("Process assets into a staging folder before PyInstaller runs. "
+                                       "Results are cached per file, so unchanged assets are not reprocessed.")
+        self.transform_checks = {}
+        for transform, label in zip(ASSET_TRANSFORMS, ("Minify JSON", "Optimize PNG", "Drop .pyc", "Dedupe")):
+            check = QCheckBox(label)
+            check.setChecked(True)
+            check.setEnabled(False)
+            self.pipeline_check.toggled.connect(check.setEnabled)
+            self.transform_checks[transform] = check
+        pipeline_layout.addWidget(self.pipeline_check)
+        for check in self.transform_checks.values():
+            transforms_layout.addWidget(check)
+        transforms_layout.addStretch()
+        pipeline_layout.addLayout(transforms_layout)
+        layout.addWidget(pipeline_group)
         layout.addStretch()
+        self._update_count()
+
+    def _update_count(self):
+        total = self.assets_model.asset_count()
+        shown = self.assets_model.rowCount()
+        self.count_label.setText(f"{shown} of {total} assets" if shown != total else f"{total} assets")
 
     def add_files(self):
         files, _ = QFileDialog.getOpenFileNames(self, "Select Asset Files to Add", "", "All Files (*)")
         if files:
-            for file_path in files:
-                self._add_row(file_path, ".")
+            self.add_assets((file_path, ".") for file_path in files)
 
     def add_folder(self):
         folder_path = QFileDialog.getExistingDirectory(self, "Select Asset Folder to Add")
         if folder_path:
             dest_name = Path(folder_path).name
-            self._add_row(folder_path, dest_name)
+            self.add_assets([(folder_path, dest_name)])
 
-    def _add_row(self, source_path, dest_path):
-        row_position = self.assets_table.rowCount()
-        self.assets_table.insertRow(row_position)
-        
-        source_item = QTableWidgetItem(source_path)
-        source_item.setFlags(source_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+    def add_assets(self, assets):
+        return self.assets_model.add_assets(assets)
+
+    def remove_selected(self):
+        rows = [index.row() for index in self.assets_table.selectionModel().selectedRows()]
+        self.assets_model.remove_rows(rows)
 
-        dest_item = QTableWidgetItem(dest_path)
+    def add_rule(self):
+        folder_path = QFileDialog.getExistingDirectory(self, "Select Folder for Rule")
+        if folder_path:
+            self._add_rule_row(make_rule(folder_path, Path(folder_path).name))
+
+    def _add_rule_row(self, rule):
+        row = self.rules_table.rowCount()
+        self.rules_table.insertRow(row)
+        max_size = rule.get('max_size')
+        values = [rule['source'], rule.get('dest') or ".", ", ".join(rule.get('include') or ["*"]),
+                  ", ".join(rule.get('exclude') or []), f"{max_size / 1024 / 1024:g}" if max_size else ""]
+        for column, value in enumerate(values):
+            self.rules_table.setItem(row, column, QTableWidgetItem(value))
+        self.rules_table.item(row, 0).setFlags(self.rules_table.item(row, 0).flags() & ~Qt.ItemFlag.ItemIsEditable)
+        symlinks_item = QTableWidgetItem("Follow")
+        symlinks_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
+        symlinks_item.setCheckState(Qt.CheckState.Checked if rule.get('follow_symlinks') else Qt.CheckState.Unchecked)
+        self.rules_table.setItem(row, 5, symlinks_item)
+
+    def remove_rule(self):
+        for row in sorted({index.row() for index in self.rules_table.selectionModel().selectedRows()}, reverse=True):
+            self.rules_table.removeRow(row)
+
+    def _rules(self):
+        def split(value):
+            return [pattern.strip() for pattern in value.split(',') if pattern.strip()]
+
+        rules = []
+        for row in range(self.rules_table.rowCount()):
+            text = [self.rules_table.item(row, column).text().strip() for column in range(5)]
+            try:
+                max_size = int(float(text[4]) * 1024 * 1024) if text[4] else None
+            except ValueError:
+                max_size = None
+            rules.append(make_rule(text[0], text[1] or ".", split(text[2]), split(text[3]), max_size,
+                                   self.rules_table.item(row, 5).checkState() == Qt.CheckState.Checked))
+        return rules
 
-        self.assets_table.setItem(row_position, 0, source_item)
-        self.assets_table.setItem(row_position, 1, dest_item)
+    def get_options(self):
+        return {
+            'add_data': self.assets_model.assets(),
+            'asset_rules': self._rules(),
+            'asset_pipeline': self.pipeline_check.isChecked(),
+            'asset_transforms': [name for name, check in self.transform_checks.items() if check.isChecked()],
+        }
+
+    def set_options(self, options):
+        self.assets_model.set_assets(options.get('add_data') or [])
+        self.rules_table.setRowCount(0)
+        for rule in options.get('asset_rules') or []:
+            self._add_rule_row(rule)
+        self.pipeline_check.setChecked(bool(options.get('asset_pipeline')))
+        transforms = options.get('asset_transforms')
+        for name, check in self.transform_checks.items():
+            check.setChecked(transforms is None or name in transforms)
+
+class BuildQueueTab(QWidget):
+    def __init__(self, log_file=None):
+        super().__init__()
+        self.log_file = log_file
+        self.log_view_lines = DEFAULT_LOG_VIEW_LINES
+        self.build_queue = BuildQueue()
+        self.queue_thread = None
+        self.queue_worker = None
+        self.theme_colors = None
+        self.job_logs = {}
+        self.job_highlighters = {}
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+
+        jobs_group = QGroupBox("Queued Builds")
+        jobs_layout = QVBoxLayout(jobs_group)
+
+        button_layout = QHBoxLayout()
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, max(1, os.cpu_count() or 1))
+        self.concurrency_spin.setValue(default_concurrency())
+        self.concurrency_spin.setToolTip("Number of PyInstaller processes to run at the same time.")
+        self.run_button = QPushButton("Run Queue")
+        self.remove_button = QPushButton("Remove Selected")
+        button_layout.addWidget(QLabel("Concurrent builds:"))
+        button_layout.addWidget(self.concurrency_spin)
+        button_layout.addStretch()
+        button_layout.addWidget(self.remove_button)
+        button_layout.addWidget(self.run_button)
+
+        self.jobs_table = QTableWidget()
+        self.jobs_table.setColumnCount(3)
+        self.jobs_table.setHorizontalHeaderLabels(["Application", "Status", "Time"])
+        self.jobs_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.jobs_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.jobs_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFormat("%v / %m builds finished")
+        self.progress_bar.setValue(0)
+        self.progress_bar.setMaximum(0)
+        self.progress_bar.setTextVisible(True)
+
+        self.run_button.clicked.connect(self._run_button_clicked)
+        self.remove_button.clicked.connect(self.remove_selected)
+
+        jobs_layout.addLayout(button_layout)
+        jobs_layout.addWidget(self.jobs_table)
+        jobs_layout.addWidget(self.progress_bar)
+        layout.addWidget(jobs_group)
+
+        logs_group = QGroupBox("Job Logs")
+        logs_layout = QVBoxLayout(logs_group)
+        self.log_tabs = QTabWidget()
+        logs_layout.addWidget(self.log_tabs)
+        layout.addWidget(logs_group, 1)
+
+    def is_running(self):
+        return self.queue_thread is not None and self.queue_thread.isRunning()
+
+    def add_job(self, script_path, options):
+        job = self.build_queue.add(script_path, options)
+        row = self.jobs_table.rowCount()
+        self.jobs_table.insertRow(row)
+        name_item = QTableWidgetItem(f"{job.name}  ({Path(script_path).name})")
+        name_item.setData(Qt.ItemDataRole.UserRole, job.job_id)
+        self.jobs_table.setItem(row, 0, name_item)
+        self.jobs_table.setItem(row, 1, QTableWidgetItem(job.status))
+        self.jobs_table.setItem(row, 2, QTableWidgetItem(""))
+
+        log_view = create_log_view(self.log_view_lines)
+        if self.theme_colors:
+            self.job_highlighters[job.job_id] = attach_log_highlighter(log_view, self.theme_colors)
+        self.job_logs[job.job_id] = log_view
+        self.log_tabs.addTab(log_view, f"#{job.job_id} {job.name}")
+        self._update_progress()
+        return job
 
     def remove_selected(self):
-        selected_rows = sorted(list(set(index.row() for index in self.assets_table.selectionModel().selectedIndexes())), reverse=True)
+        if self.is_running():
+            return
+        selected_rows = sorted(set(index.row() for index in self.jobs_table.selectionModel().selectedIndexes()), reverse=True)
         for row in selected_rows:
-            self.assets_table.removeRow(row)
+            job_id = self.jobs_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+            self.build_queue.jobs = [job for job in self.build_queue.jobs if job.job_id != job_id]
+            log_view = self.job_logs.pop(job_id)
+            self.job_highlighters.pop(job_id, None)
+            self.log_tabs.removeTab(self.log_tabs.indexOf(log_view))
+            self.jobs_table.removeRow(row)
+        self._update_progress()
+
+    def _run_button_clicked(self):
+        if self.is_running():
+            self.cancel_queue()
+        else:
+            self.run_queue()
 
-    def get_options(self):
-        assets = []
-        for row in range(self.assets_table.rowCount()):
-            source_item = self.assets_table.item(row, 0)
-            dest_item = self.assets_table.item(row, 1)
-            if source_item and dest_item:
-                source = source_item.text()
-                dest = dest_item.text().strip()
-                if source and dest:
-                    assets.append((source, dest))
-        return {'add_data': assets}
+    def stop_queue(self):
+        """Cancel a running queue and wait for its builds to stop."""
+        if self.is_running():
+            self.build_queue.cancel()
+            self.queue_thread.quit()
+            self.queue_thread.wait(STOP_TIMEOUT_MS)
+
+    def cancel_queue(self):
+        if not self.is_running():
+            return
+        self.build_queue.cancel()
+        self.run_button.setEnabled(False)
+        self.run_button.setText("Cancelling...")
+
+    def run_queue(self):
+        if self.is_running():
+            return
+        if not any(job.status == BuildJob.QUEUED for job in self.build_queue.jobs):
+            QMessageBox.information(self, "Build Queue", "There are no queued builds to run.")
+            return
+
+        self.build_queue.max_workers = self.concurrency_spin.value()
+        self.run_button.setText("Cancel Queue")
+
+        self.queue_worker = QueueWorker(self.build_queue)
+        self.queue_worker.job_output_signal.connect(self._append_job_log)
+        self.queue_worker.job_finished_signal.connect(self._job_finished)
+        self.queue_worker.finished_signal.connect(self._queue_finished)
+
+        self.queue_thread = QThread()
+        self.queue_worker.moveToThread(self.queue_thread)
+        self.queue_thread.started.connect(self.queue_worker.run)
+        self.queue_thread.start()
+        self._refresh_statuses()
+
+    def _append_job_log(self, job_id, text):
+        log_view = self.job_logs.get(job_id)
+        if log_view is None:
+            return
+        if self.log_file is not None:
+            prefix = f"[job {job_id}] "
+            self.log_file.write("".join(prefix + line for line in text.splitlines(keepends=True)))
+        append_to_log_view(log_view, text)
+
+    def _job_finished(self, job_id):
+        self._refresh_statuses()
+
+    def _queue_finished(self, success):
+        self.run_button.setEnabled(True)
+        self.run_button.setText("Run Queue")
+        if self.queue_thread:
+            self.queue_thread.quit()
+            self.queue_thread.wait()
+            self.queue_thread = None
+        self._refresh_statuses()
+        failed = [job.name for job in self.build_queue.jobs if job.status == BuildJob.FAILED]
+        if not success and failed:
+            QMessageBox.critical(self, "Build Queue", f"Some builds failed: {', '.join(failed)}")
+
+    def _refresh_statuses(self):
+        jobs = {job.job_id: job for job in self.build_queue.jobs}
+        for row in range(self.jobs_table.rowCount()):
+            job = jobs.get(self.jobs_table.item(row, 0).data(Qt.ItemDataRole.UserRole))
+            if job is None:
+                continue
+            self.jobs_table.item(row, 1).setText(job.status)
+            self.jobs_table.item(row, 2).setText(f"{job.duration:.1f}s" if job.duration is not None else "")
+        self._update_progress()
+
+    def _update_progress(self):
+        done, total = self.build_queue.progress()
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+
+    def set_log_view_lines(self, max_lines):
+        self.log_view_lines = max_lines
+        for log_view in self.job_logs.values():
+            log_view.setMaximumBlockCount(max_lines)
+
+    def apply_theme(self, theme_colors):
+        self.theme_colors = theme_colors
+        for job_id, log_view in self.job_logs.items():
+            highlighter = self.job_highlighters.get(job_id)
+            if highlighter is None:
+                self.job_highlighters[job_id] = attach_log_highlighter(log_view, theme_colors)
+            else:
+                restyle_log_highlighter(highlighter, log_view, theme_colors)
+
+
+# =================================================================================
+# Class: TrendChart (Line chart of one value over recent builds)
+# =================================================================================
+
+class TrendChart(QWidget):
+    def __init__(self, title, format_value):
+        super().__init__()
+        self.title = title
+        self.format_value = format_value
+        self.values = []
+        self.line_color = QColor("#0D6EFD")
+        self.text_color = QColor("#6C757D")
+        self.setMinimumHeight(120)
+
+    def set_values(self, values):
+        self.values = [value for value in values if value is not None]
+        self.update()
+
+    def set_colors(self, line_color, text_color):
+        self.line_color = QColor(line_color)
+        self.text_color = QColor(text_color)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.text_color)
+        metrics = painter.fontMetrics()
+        header = self.title
+        if self.values:
+            header += (f"  (last {self.format_value(self.values[-1])}, min {self.format_value(min(self.values))}, "
+                       f"max {self.format_value(max(self.values))})")
+        painter.drawText(0, metrics.ascent(), header)
+        if len(self.values) < 2:
+            painter.drawText(0, metrics.height() * 2 + metrics.ascent(), "Not enough successful builds yet.")
+            return
+
+        # Inset by the point radius so the end points are not clipped.
+        top = metrics.height() + 9
+        width, height = self.width() - 6, self.height() - top - 3
+        low, high = min(self.values), max(self.values)
+        spread = (high - low) or 1
+        step = width / (len(self.values) - 1)
+        points = QPolygonF([QPointF(3 + i * step, top + height - (value - low) / spread * height)
+                            for i, value in enumerate(self.values)])
+        painter.setPen(QPen(self.line_color, 2))
+        painter.drawPolyline(points)
+        for point in points:
+            painter.drawEllipse(point, 2, 2)
+
+# =================================================================================
+# Class: BuildHistoryTab (Past builds and their trends)
+# =================================================================================
+
+class BuildHistoryTab(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.history = default_history()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+
+        controls = QFormLayout()
+        self.app_combo = QComboBox()
+        self.refresh_button = QPushButton("Refresh")
+        app_layout = QHBoxLayout()
+        app_layout.addWidget(self.app_combo, 1)
+        app_layout.addWidget(self.refresh_button)
+        self.builds_spin = QSpinBox()
+        self.builds_spin.setRange(2, 10000)
+        self.builds_spin.setValue(DEFAULT_TREND_BUILDS)
+        controls.addRow("Application:", app_layout)
+        controls.addRow("Last builds:", self.builds_spin)
+
+        trends_group = QGroupBox("Trends (successful builds)")
+        trends_layout = QVBoxLayout(trends_group)
+        self.duration_chart = TrendChart("Build time", lambda value: f"{value:.1f}s")
+        self.size_chart = TrendChart("Artifact size", format_size)
+        trends_layout.addWidget(self.duration_chart)
+        trends_layout.addWidget(self.size_chart)
+
+        self.builds_table = QTableWidget()
+        self.builds_table.setColumnCount(6)
+        self.builds_table.setHorizontalHeaderLabels(["Started", "Status", "Exit", "Time", "Size", "Warnings"])
+        self.builds_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.builds_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.builds_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.builds_table.verticalHeader().setVisible(False)
+
+        self.app_combo.currentTextChanged.connect(self.show_application)
+        self.builds_spin.valueChanged.connect(lambda _: self.show_application(self.app_combo.currentText()))
+        self.refresh_button.clicked.connect(lambda: self.refresh())
+
+        layout.addLayout(controls)
+        layout.addWidget(trends_group)
+        layout.addWidget(self.builds_table, 1)
+
+    def refresh(self, select=None):
+        """Reload the application list, keeping (or switching to) ``select``."""
+        current = select or self.app_combo.currentText()
+        self.app_combo.blockSignals(True)
+        self.app_combo.clear()
+        self.app_combo.addItems(self.history.applications())
+        index = self.app_combo.findText(current)
+        self.app_combo.setCurrentIndex(max(index, 0))
+        self.app_combo.blockSignals(False)
+        self.show_application(self.app_combo.currentText())
+
+    def show_application(self, name):
+        limit = self.builds_spin.value()
+        trend = self.history.trend(name, limit) if name else {'duration': [], 'artifact_size': []}
+        self.duration_chart.set_values(trend['duration'])
+        self.size_chart.set_values(trend['artifact_size'])
+
+        builds = self.history.recent(name, limit)[::-1] if name else []
+        self.builds_table.setRowCount(len(builds))
+        for row, build in enumerate(builds):
+            values = (
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(build['created'])),
+                build['status'],
+                "" if build['exit_code'] is None else str(build['exit_code']),
+                f"{build['duration']:.1f}s" if build['duration'] is not None else "",
+                format_size(build['artifact_size']) if build['artifact_size'] else "",
+                "" if build['warnings'] is None else str(build['warnings']),
+            )
+            for column, value in enumerate(values):
+                self.builds_table.setItem(row, column, QTableWidgetItem(value))
+
+    def apply_theme(self, theme_colors):
+        for chart in (self.duration_chart, self.size_chart):
+            chart.set_colors(theme_colors["primary"], theme_colors["text_dim"])
+
+
+# =================================================================================
+# Class: AutoTuneTab (Search for the smallest / fastest-starting configuration)
+# =================================================================================
+
+class AutoTuneTab(QWidget):
+    run_requested = Signal()
+    apply_requested = Signal(object)
+    output_signal = Signal(str)
+
+    COLUMNS = ["Best", "Configuration", "Size", "Launch", "Build", "Status"]
+
+    def __init__(self):
+        super().__init__()
+        self.tuner = None
+        self.tune_thread = None
+        self.tune_worker = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+
+        search_group = QGroupBox("Search")
+        search_layout = QFormLayout(search_group)
+        description = QLabel("Builds the current script as one-file and one-directory, with and without strip, "
+                             "UPX (when available) and the suggested excludes, then launches each build with "
+                             "the smoke-test arguments from Advanced Options. Builds that fail to launch are "
+                             "never marked as best.")
+        description.setWordWrap(True)
+        self.suggested_check = QCheckBox("Try the suggested excludes")
+        self.suggested_check.setChecked(True)
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, max(1, os.cpu_count() or 1))
+        self.concurrency_spin.setValue(default_concurrency())
+        self.concurrency_spin.setToolTip("Number of candidate builds to run at the same time.")
+        self.run_button = QPushButton("Run Auto-Tune")
+        run_layout = QHBoxLayout()
+        run_layout.addWidget(self.concurrency_spin)
+        run_layout.addStretch()
+        run_layout.addWidget(self.run_button)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFormat("%v / %m candidates finished")
+        self.progress_bar.setMaximum(0)
+        self.progress_bar.setValue(0)
+        search_layout.addRow(description)
+        search_layout.addRow("", self.suggested_check)
+        search_layout.addRow("Concurrent builds:", run_layout)
+        search_layout.addRow(self.progress_bar)
+
+        results_group = QGroupBox("Candidates")
+        results_layout = QVBoxLayout(results_group)
+        self.candidates_table = QTableWidget()
+        self.candidates_table.setColumnCount(len(self.COLUMNS))
+        self.candidates_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.candidates_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.candidates_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.candidates_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.candidates_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.candidates_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.candidates_table.verticalHeader().setVisible(False)
+        self.apply_button = QPushButton("Apply Selected")
+        self.apply_button.setToolTip("Copy the selected configuration into the Basic, Advanced and "
+                                     "Package Management tabs.")
+        apply_layout = QHBoxLayout()
+        apply_layout.addStretch()
+        apply_layout.addWidget(self.apply_button)
+        results_layout.addWidget(self.candidates_table)
+        results_layout.addLayout(apply_layout)
+
+        self.run_button.clicked.connect(self._run_button_clicked)
+        self.apply_button.clicked.connect(self.apply_selected)
+
+        layout.addWidget(search_group)
+        layout.addWidget(results_group, 1)
+
+    def is_running(self):
+        return self.tune_thread is not None and self.tune_thread.isRunning()
+
+    def _run_button_clicked(self):
+        if self.is_running():
+            self.tuner.cancel()
+            self.run_button.setEnabled(False)
+            self.run_button.setText("Cancelling...")
+        else:
+            self.run_requested.emit()
+
+    def start(self, script_path, options, suggested_excludes):
+        if self.is_running():
+            return
+        if not self.suggested_check.isChecked():
+            suggested_excludes = []
+        self.tuner = AutoTuner(script_path, options, suggested_excludes, self.concurrency_spin.value())
+        self.candidates_table.setRowCount(len(self.tuner.candidates))
+        for candidate in self.tuner.candidates:
+            self._show_candidate(candidate.candidate_id)
+        self.run_button.setText("Cancel Auto-Tune")
+        self.output_signal.emit(f"[INFO] Auto-tuning {len(self.tuner.candidates)} configurations in "
+                                f"{self.tuner.base_dir}\n")
+
+        self.tune_worker = TuneWorker(self.tuner)
+        self.tune_worker.output_signal.connect(self.output_signal)
+        self.tune_worker.candidate_signal.connect(self._show_candidate)
+        self.tune_worker.finished_signal.connect(self._tune_finished)
+
+        self.tune_thread = QThread()
+        self.tune_worker.moveToThread(self.tune_thread)
+        self.tune_thread.started.connect(self.tune_worker.run)
+        self.tune_thread.start()
+
+    def stop(self):
+        """Cancel a running search and wait for its builds to stop."""
+        if self.is_running():
+            self.tuner.cancel()
+            self.tune_thread.quit()
+            self.tune_thread.wait(STOP_TIMEOUT_MS)
+
+    def _show_candidate(self, candidate_id):
+        candidate = self.tuner.candidates[candidate_id - 1]
+        status = candidate.status
+        if candidate.status in (TuneCandidate.FAILED, TuneCandidate.SKIPPED) and candidate.message:
+            status += f": {candidate.message}"
+        values = (
+            "*" if candidate.pareto else "",
+            candidate.label,
+            format_size(candidate.size) if candidate.size is not None else "",
+            f"{candidate.launch_time * 1000:.0f} ms" if candidate.launch_time is not None else "",
+            f"{candidate.build_time:.1f}s" if candidate.build_time is not None else "",
+            status,
+        )
+        for column, value in enumerate(values):
+            self.candidates_table.setItem(candidate_id - 1, column, QTableWidgetItem(value))
+        done, total = self.tuner.progress()
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+
+    def _tune_finished(self):
+        self.run_button.setEnabled(True)
+        self.run_button.setText("Run Auto-Tune")
+        if self.tune_thread:
+            self.tune_thread.quit()
+            self.tune_thread.wait()
+            self.tune_thread = None
+        best = [candidate.label for candidate in self.tuner.candidates if candidate.pareto]
+        if best:
+            self.output_signal.emit(f"[SUCCESS] Auto-tune finished; best trade-offs: {', '.join(best)}\n")
+        else:
+            self.output_signal.emit("[WARNING] Auto-tune finished without a candidate that builds and launches\n")
+
+    def apply_selected(self):
+        rows = self.candidates_table.selectionModel().selectedRows()
+        if self.tuner is None or not rows:
+            QMessageBox.information(self, "Auto-Tune", "Select a candidate to apply.")
+            return
+        candidate = self.tuner.candidates[rows[0].row()]
+        if candidate.status != TuneCandidate.DONE:
+            QMessageBox.information(self, "Auto-Tune", f"'{candidate.label}' has not built and launched "
+                                                       "successfully.")
+            return
+        self.apply_requested.emit(candidate)
 
 
 # =================================================================================
 # Class: PyInstallerGUI (Main Application Window)
 # =================================================================================
 class PyInstallerGUI(QMainWindow):
-    def __init__(self):
+    analysis_requested = Signal(str, str)
+
+    # Tabs after "Basic Options" are created the first time they are shown or
+    # their options are needed, so they cost nothing at startup.
+    LAZY_TABS = (
+        ('advanced_tab', "Advanced Options"),
+        ('packages_tab', "Package Management"),
+        ('assets_tab', "Assets"),
+        ('queue_tab', "Build Queue"),
+        ('history_tab', "History"),
+        ('tune_tab', "Auto-Tune"),
+    )
+    _icon_cache = {}
+
+    def __init__(self, startup_profiler=None):
         super().__init__()
+        self.startup_profiler = startup_profiler or StartupProfiler(time.perf_counter())
         self.current_theme = "light"
         self.build_thread = None
         self.build_worker = None
         self.log_highlighter = None
+        self.log_file = RotatingLogFile()
+        self.analyzer_thread = None
+        self.analyzer_worker = None
+        self.project_path = None
+        self.analysis_result = None
 
         self.setWindowTitle("Py2Exe")
         self.setFixedSize(960, 850)
@@ -699,7 +1824,11 @@ class PyInstallerGUI(QMainWindow):
         QApplication.instance().setWindowIcon(app_icon)
 
         self._init_ui()
+        self.startup_profiler.mark("window: widgets")
+        self._init_analyzer()
+        self.startup_profiler.mark("window: analyzer thread")
         self.apply_theme("light")
+        self.startup_profiler.mark("window: theme")
 
     def _init_ui(self):
         central_widget = QWidget(objectName="centralWidget")
@@ -720,13 +1849,14 @@ class PyInstallerGUI(QMainWindow):
         self.tabs = QTabWidget()
         self.tabs.setMinimumWidth(530)
         self.basic_tab = BasicOptionsTab()
-        self.advanced_tab = AdvancedOptionsTab()
-        self.packages_tab = PackagesTab()
-        self.assets_tab = AssetsTab()
         self.tabs.addTab(self.basic_tab, "Basic Options")
-        self.tabs.addTab(self.advanced_tab, "Advanced Options")
-        self.tabs.addTab(self.packages_tab, "Package Management")
-        self.tabs.addTab(self.assets_tab, "Assets")
+        self._lazy_tabs = {}
+        for name, label in self.LAZY_TABS:
+            container = QWidget()
+            QVBoxLayout(container).setContentsMargins(0, 0, 0, 0)
+            self._lazy_tabs[name] = container
+            self.tabs.addTab(container, label)
+        self.tabs.currentChanged.connect(self._tab_changed)
         
         # Log Panel
         log_panel = self._create_log_panel()
@@ -736,6 +1866,83 @@ class PyInstallerGUI(QMainWindow):
         splitter.setSizes([500, 420])
         splitter.setCollapsible(0, False)
 
+    def __getattr__(self, name):
+        # Only reached while a lazy tab's attribute is still unset.
+        if name in self.__dict__.get('_lazy_tabs', ()):
+            return self._create_tab(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _create_tab(self, name):
+        container = self._lazy_tabs.pop(name)
+        colors = ThemeManager.THEMES[self.current_theme]
+        if name == 'advanced_tab':
+            tab = AdvancedOptionsTab()
+        elif name == 'packages_tab':
+            tab = PackagesTab()
+            tab.analyze_requested.connect(self.analyze_script)
+            tab.trace_requested.connect(self.start_trace)
+            tab.output_signal.connect(self.append_log)
+            if self.analysis_result is not None:
+                tab.show_suggestions(self.analysis_result)
+        elif name == 'assets_tab':
+            tab = AssetsTab()
+        elif name == 'queue_tab':
+            tab = BuildQueueTab(self.log_file)
+            tab.set_log_view_lines(self.log_lines_spin.value())
+            tab.apply_theme(colors)
+        elif name == 'history_tab':
+            tab = BuildHistoryTab()
+            tab.apply_theme(colors)
+        else:
+            tab = AutoTuneTab()
+            tab.run_requested.connect(self.start_autotune)
+            tab.apply_requested.connect(self.apply_tuned_configuration)
+            tab.output_signal.connect(self.append_log)
+        setattr(self, name, tab)
+        container.layout().addWidget(tab)
+        return tab
+
+    def _tab_created(self, name):
+        return name not in self._lazy_tabs
+
+    def _tab_changed(self, index):
+        widget = self.tabs.widget(index)
+        for name, container in list(self._lazy_tabs.items()):
+            if container is widget:
+                getattr(self, name)
+        # Builds are recorded in the background; re-query whenever the tab is shown.
+        if self._tab_created('history_tab') and widget is self.history_tab.parentWidget():
+            self.history_tab.refresh(self.basic_tab.app_name_input.text())
+
+    def _init_analyzer(self):
+        # Import analysis runs on its own thread and is re-triggered, debounced,
+        # whenever the script path changes.
+        self.analyzer_worker = AnalyzerWorker()
+        self.analyzer_thread = QThread()
+        self.analyzer_worker.moveToThread(self.analyzer_thread)
+        self.analysis_requested.connect(self.analyzer_worker.analyze)
+        self.analyzer_worker.finished_signal.connect(self.analysis_finished)
+        self.analyzer_thread.start()
+
+        self.analysis_timer = QTimer(self)
+        self.analysis_timer.setSingleShot(True)
+        self.analysis_timer.setInterval(400)
+        self.analysis_timer.timeout.connect(self.analyze_script)
+        self.basic_tab.script_input.line_edit.textChanged.connect(self.analysis_timer.start)
+        self.basic_tab.python_input.line_edit.textChanged.connect(self.analysis_timer.start)
+
+    def analyze_script(self):
+        script_path = self.basic_tab.script_input.text()
+        if script_path and Path(script_path).is_file():
+            self.analysis_requested.emit(script_path, self.basic_tab.python_input.text())
+
+    def analysis_finished(self, script_path, result):
+        if script_path == self.basic_tab.script_input.text():
+            # Kept for the Package Management tab in case it has not been created yet.
+            self.analysis_result = result
+            if self._tab_created('packages_tab'):
+                self.packages_tab.show_suggestions(result)
+
     def _create_header(self):
         header_widget = QFrame()
         header_widget.setObjectName("header")
@@ -751,8 +1958,15 @@ class PyInstallerGUI(QMainWindow):
         self.theme_button.setIconSize(QSize(24, 24))
         self.theme_button.clicked.connect(self.toggle_theme)
 
+        self.open_project_button = QPushButton("Open Project...")
+        self.open_project_button.clicked.connect(self.open_project)
+        self.save_project_button = QPushButton("Save Project...")
+        self.save_project_button.clicked.connect(self.save_project)
+
         header_layout.addWidget(title)
         header_layout.addStretch()
+        header_layout.addWidget(self.open_project_button)
+        header_layout.addWidget(self.save_project_button)
         header_layout.addWidget(self.theme_button)
         return header_widget
 
@@ -772,24 +1986,51 @@ class PyInstallerGUI(QMainWindow):
         self.build_button = QPushButton("Start Build")
         self.build_button.setObjectName("buildButton")
         self.build_button.setMinimumHeight(38)
-        self.build_button.clicked.connect(self.start_build)
+        self.build_button.clicked.connect(self._build_button_clicked)
+        self.queue_button = QPushButton("Add to Queue")
+        self.queue_button.setToolTip("Queue the current configuration to run later in the Build Queue tab.")
+        self.queue_button.clicked.connect(self.add_to_queue)
         
         control_layout.addWidget(log_label)
         control_layout.addStretch()
         control_layout.addWidget(self.clear_log_button)
+        control_layout.addWidget(self.queue_button)
         control_layout.addWidget(self.build_button)
+
+        full_log_layout = QHBoxLayout()
+        self.log_lines_spin = QSpinBox()
+        self.log_lines_spin.setRange(100, 1000000)
+        self.log_lines_spin.setSingleStep(1000)
+        self.log_lines_spin.setValue(DEFAULT_LOG_VIEW_LINES)
+        self.log_lines_spin.setToolTip("Number of recent lines kept in the log view. The full log is always written to disk.")
+        self.log_lines_spin.valueChanged.connect(self.set_log_view_lines)
+        self.log_search_input = QLineEdit()
+        self.log_search_input.setPlaceholderText("Search full log...")
+        self.log_search_input.returnPressed.connect(self.search_full_log)
+        self.open_log_button = QPushButton("Open Full Log")
+        self.open_log_button.clicked.connect(self.open_full_log)
+
+        full_log_layout.addWidget(QLabel("View lines:"))
+        full_log_layout.addWidget(self.log_lines_spin)
+        full_log_layout.addWidget(self.log_search_input, 1)
+        full_log_layout.addWidget(self.open_log_button)
         
-        self.log_display = QTextEdit()
+        self.log_display = create_log_view()
         self.log_display.setObjectName("logDisplay")
-        self.log_display.setReadOnly(True)
-        self.log_display.setFont(QFont("Consolas", 9))
-        self.log_display.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
 
         log_layout.addLayout(control_layout)
+        log_layout.addLayout(full_log_layout)
         log_layout.addWidget(self.log_display)
         return log_panel
 
     def _create_icon_from_svg(self, svg_data, color):
+        key = (svg_data, color)
+        if key not in self._icon_cache:
+            self._icon_cache[key] = self._render_svg_icon(svg_data, color)
+        return self._icon_cache[key]
+
+    @staticmethod
+    def _render_svg_icon(svg_data, color):
         colored_svg = svg_data.replace('currentColor', color)
         renderer = QSvgRenderer(colored_svg.encode('utf-8'))
         pixmap = QPixmap(renderer.defaultSize())
@@ -804,6 +2045,8 @@ class PyInstallerGUI(QMainWindow):
             return
 
         try:
+            import ctypes
+            from ctypes import wintypes
             # DwmSetWindowAttribute(HWND, DWMWA_USE_IMMERSIVE_DARK_MODE, &value, sizeof(value))
             hwnd = self.winId()
             DWMWA_USE_IMMERSIVE_DARK_MODE = 20
@@ -814,7 +2057,7 @@ class PyInstallerGUI(QMainWindow):
                 ctypes.byref(value),
                 ctypes.sizeof(value)
             )
-        except (AttributeError, TypeError, NameError):
+        except (ImportError, AttributeError, TypeError, NameError):
             # This can fail if dwmapi is not available or ctypes is misconfigured
             pass
 
@@ -833,10 +2076,12 @@ class PyInstallerGUI(QMainWindow):
             self.theme_button.setToolTip("Switch to Dark Theme")
         
         if self.log_highlighter is None:
-            self.log_highlighter = LogSyntaxHighlighter(self.log_display.document(), colors)
+            self.log_highlighter = attach_log_highlighter(self.log_display, colors)
         else:
-            self.log_highlighter.update_theme(colors)
-            self.log_highlighter.rehighlight()
+            restyle_log_highlighter(self.log_highlighter, self.log_display, colors)
+        for name in ('queue_tab', 'history_tab'):
+            if self._tab_created(name):
+                getattr(self, name).apply_theme(colors)
 
         self._set_windows_titlebar_theme(theme_name)
 
@@ -846,27 +2091,114 @@ class PyInstallerGUI(QMainWindow):
         else:
             self.apply_theme("light")
     
-    def start_build(self):
-        basic_opts = self.basic_tab.get_options()
-        script_path = basic_opts.pop('script')
+    def _collect_build_request(self):
+        script_path, options = self._collect_options()
 
         if not script_path:
             QMessageBox.warning(self, "Validation Error", "Please select a Python script to build.")
-            return
+            return None, None
         
         if not Path(script_path).exists():
             QMessageBox.critical(self, "File Not Found", f"The script '{script_path}' does not exist.")
-            return
-
-        self.build_button.setEnabled(False)
-        self.build_button.setText("Building...")
-        self.clear_log()
+            return None, None
+        return script_path, options
 
-        options = {}
-        options.update(basic_opts)
+    def _collect_options(self):
+        options = self.basic_tab.get_options()
+        script_path = options.pop('script')
         options.update(self.advanced_tab.get_options())
         options.update(self.packages_tab.get_options())
         options.update(self.assets_tab.get_options())
+        return script_path, options
+
+    def _apply_options(self, script_path, options):
+        self.basic_tab.set_options(script_path, options)
+        self.advanced_tab.set_options(options)
+        self.packages_tab.set_options(options)
+        self.assets_tab.set_options(options)
+
+    def load_project(self, project_path):
+        try:
+            script_path, options = load_project(project_path)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Open Project", f"Could not open '{project_path}': {e}")
+            return False
+        self._apply_options(script_path, options)
+        self.project_path = project_path
+        self.setWindowTitle(f"Py2Exe - {Path(project_path).name}")
+        return True
+
+    def open_project(self):
+        project_path, _ = QFileDialog.getOpenFileName(self, "Open Project", "", PROJECT_FILTER)
+        if project_path:
+            self.load_project(project_path)
+
+    def save_project(self):
+        script_path, options = self._collect_options()
+        default_path = self.project_path or str(Path(script_path or ".").with_suffix(PROJECT_SUFFIX))
+        project_path, _ = QFileDialog.getSaveFileName(self, "Save Project", default_path, PROJECT_FILTER)
+        if not project_path:
+            return
+        try:
+            save_project(project_path, script_path, options)
+        except OSError as e:
+            QMessageBox.critical(self, "Save Project", f"Could not save '{project_path}': {e}")
+            return
+        self.project_path = project_path
+        self.setWindowTitle(f"Py2Exe - {Path(project_path).name}")
+
+    def add_to_queue(self):
+        script_path, options = self._collect_build_request()
+        if not script_path:
+            return
+        try:
+            job = self.queue_tab.add_job(script_path, options)
+        except ValueError as e:
+            QMessageBox.warning(self, "Build Queue", str(e))
+            return
+        self.append_log(f"[INFO] Queued build #{job.job_id}: {job.name}\n")
+
+    def start_autotune(self):
+        script_path, options = self._collect_build_request()
+        if not script_path:
+            return
+        suggested = self.analysis_result.get('exclude_modules') if self.analysis_result else None
+        self.clear_log()
+        self.tune_tab.start(script_path, options, suggested)
+
+    def start_trace(self, refresh):
+        script_path, options = self._collect_build_request()
+        if not script_path:
+            return
+        self.clear_log()
+        self.packages_tab.start_trace(script_path, options, refresh)
+
+    def apply_tuned_configuration(self, candidate):
+        script_path, options = self._collect_options()
+        options.update(candidate.overrides)
+        self._apply_options(script_path, options)
+        self.append_log(f"[INFO] Applied auto-tuned configuration: {candidate.label}\n")
+
+    def _build_button_clicked(self):
+        if self.build_thread and self.build_thread.isRunning():
+            self.cancel_build()
+        else:
+            self.start_build()
+
+    def cancel_build(self):
+        if not (self.build_worker and self.build_thread and self.build_thread.isRunning()):
+            return
+        self.build_worker.cancel()
+        self.build_button.setEnabled(False)
+        self.build_button.setText("Cancelling...")
+
+    def start_build(self):
+        script_path, options = self._collect_build_request()
+        if not script_path:
+            return
+
+        self.build_button.setText("Cancel Build")
+        self.clear_log()
 
         self.build_worker = BuildWorker(script_path, options)
         self.build_worker.output_signal.connect(self.append_log)
@@ -880,13 +2212,47 @@ class PyInstallerGUI(QMainWindow):
     def append_log(self, text):
         # The syntax highlighter now handles all coloring automatically.
         # This method just needs to append the text.
-        self.log_display.moveCursor(self.log_display.textCursor().MoveOperation.End)
-        self.log_display.insertPlainText(text)
-        self.log_display.verticalScrollBar().setValue(self.log_display.verticalScrollBar().maximum())
+        self.log_file.write(text)
+        append_to_log_view(self.log_display, text)
 
     def clear_log(self):
         self.log_display.clear()
 
+    def set_log_view_lines(self, max_lines):
+        self.log_display.setMaximumBlockCount(max_lines)
+        if self._tab_created('queue_tab'):
+            self.queue_tab.set_log_view_lines(max_lines)
+
+    def open_full_log(self):
+        self.log_file.flush()
+        if not self.log_file.path.exists():
+            QMessageBox.information(self, "Full Log", "No build output has been logged yet.")
+            return
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(self.log_file.path)))
+
+    def search_full_log(self):
+        needle = self.log_search_input.text().strip()
+        if not needle:
+            return
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            matches = self.log_file.search(needle)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Full Log: {len(matches)} match(es) for '{needle}'")
+        dialog.resize(800, 500)
+        layout = QVBoxLayout(dialog)
+        results_view = create_log_view(max(len(matches), 1))
+        results_view.setPlainText("\n".join(f"{name}:{line_number}: {line}" for name, line_number, line in matches))
+        attach_log_highlighter(results_view, ThemeManager.THEMES[self.current_theme])
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(results_view)
+        layout.addWidget(buttons)
+        dialog.exec()
+
     def build_finished(self, success, message):
         self.build_button.setEnabled(True)
         self.build_button.setText("Start Build")
@@ -894,29 +2260,98 @@ class PyInstallerGUI(QMainWindow):
             self.build_thread.quit()
             self.build_thread.wait()
             self.build_thread = None
-        
-        if not success:
+
+        if not success and not self.build_worker.is_cancelled():
             QMessageBox.critical(self, "Build Failed", message)
 
+    def _stop_analyzer(self):
+        if self.analyzer_thread:
+            self.analyzer_thread.quit()
+            self.analyzer_thread.wait()
+            self.analyzer_thread = None
+
     def closeEvent(self, event):
-        if self.build_thread and self.build_thread.isRunning():
+        queue_running = self._tab_created('queue_tab') and self.queue_tab.is_running()
+        tune_running = self._tab_created('tune_tab') and self.tune_tab.is_running()
+        if (self.build_thread and self.build_thread.isRunning()) or queue_running or tune_running:
             reply = QMessageBox.question(self, 'Confirm Exit', 
-                                         "A build is currently in progress. Are you sure you want to exit?",
+                                         "A build is currently in progress. Cancel it and exit?",
                                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, 
                                          QMessageBox.StandardButton.No)
-            if reply == QMessageBox.StandardButton.Yes:
-                event.accept()
-            else:
+            if reply != QMessageBox.StandardButton.Yes:
                 event.ignore()
-        else:
-            event.accept()
+                return
+            # Stop PyInstaller and its children instead of leaving them running
+            # after the window is gone.
+            self._stop_build()
+            if self._tab_created('queue_tab'):
+                self.queue_tab.stop_queue()
+            if self._tab_created('tune_tab'):
+                self.tune_tab.stop()
+        if self._tab_created('packages_tab'):
+            self.packages_tab.stop_trace()
+        # Builds are stopped by now; the warm PyInstaller workers go with the window.
+        shutdown_workers()
+        self.log_file.close()
+        self._stop_analyzer()
+        event.accept()
+
+    def _stop_build(self):
+        if self.build_thread and self.build_thread.isRunning():
+            self.build_worker.cancel()
+            self.build_thread.quit()
+            self.build_thread.wait(STOP_TIMEOUT_MS)
+
+
+# =================================================================================
+# Class: StartupProfiler (Timing breakdown for --profile-startup)
+# =================================================================================
+
+class StartupProfiler(QObject):
+    def __init__(self, started, enabled=False):
+        super().__init__()
+        self.started = started
+        self.enabled = enabled
+        self.steps = []
+        self._last = started
+
+    def mark(self, label):
+        now = time.perf_counter()
+        self.steps.append((label, now - self._last))
+        self._last = now
+
+    def watch_first_paint(self, widget):
+        if self.enabled:
+            widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint:
+            watched.removeEventFilter(self)
+            self.mark("first paint")
+            self.report()
+        return False
+
+    def report(self):
+        for label, seconds in self.steps:
+            print(f"[STARTUP] {label:<28} {seconds * 1000:>7.1f} ms")
+        print(f"[STARTUP] {'time to first paint':<28} {(self._last - self.started) * 1000:>7.1f} ms")
+        sys.stdout.flush()
 
 
 # =================================================================================
 # Main Execution Block
 # =================================================================================
 if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--profile-startup"]
+    profiler = StartupProfiler(_STARTED, enabled="--profile-startup" in sys.argv)
+    profiler.mark("imports")
     app = QApplication(sys.argv)
-    window = PyInstallerGUI()
+    profiler.mark("QApplication")
+    window = PyInstallerGUI(profiler)
+    if args and args[0].endswith(PROJECT_SUFFIX):
+        window.load_project(args[0])
+        profiler.mark("project")
+    profiler.watch_first_paint(window)
     window.show()
+    profiler.mark("show")
     sys.exit(app.exec())
@@ -0,0 +1,332 @@
+import os
+import sys
+import json
+import time
+import shlex
+import signal
+import argparse
+import statistics
+import threading
+import subprocess
+from pathlib import Path
+
+from process_tree import CANCEL_POLL_INTERVAL, raise_if_cancelled
+
+# =================================================================================
+# Startup benchmark for built executables (no Qt imports)
+#
+# Launches the produced executable several times with a smoke-test argument and
+# records time to first output, time to exit and peak RSS. Results are appended
+# per application so onefile/onedir, UPX and strip configurations can be
+# compared.
+#
+# Cold runs only evict the page cache when asked to (--drop-caches, or the
+# 'benchmark_drop_caches' option), since that affects the whole machine.
+#
+#   python artifact_benchmark.py dist/MyApp --runs 10 --args "--version"
+# =================================================================================
+
+DEFAULT_RESULTS_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "benchmarks")
+DEFAULT_RUNS = 5
+DEFAULT_TIMEOUT = 30.0
+_SAMPLE_INTERVAL = 0.002
+
+
+def find_executable(distpath, name, one_file):
+    dist_dir = Path(distpath or "dist")
+    suffix = ".exe" if sys.platform == "win32" else ""
+    candidate = dist_dir / f"{name}{suffix}" if one_file else dist_dir / name / f"{name}{suffix}"
+    return candidate if candidate.is_file() else None
+
+
+def drop_page_cache():
+    """Evict the OS page cache so the next launch is truly cold (Linux, root only)."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+        return True
+    except OSError:
+        return False
+
+
+def _kill_tree(process):
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except OSError:
+        pass
+
+
+def _read_hwm(pid):
+    try:
+        with open(f"/proc/{pid}/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _children(pid):
+    try:
+        children = []
+        for tid in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{tid}/children", "rb") as f:
+                children.extend(int(child) for child in f.read().split())
+        return children
+    except (OSError, ValueError):
+        return []
+
+
+class _RssSampler(threading.Thread):
+    # Linux only. Samples VmHWM of the process and its descendants (e.g. the
+    # onefile bootloader's Python child). VmHWM is tracked per address space, so,
+    # unlike ru_maxrss, it does not inherit the high-water mark of the forking
+    # Python process from before exec().
+    def __init__(self, pid):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.hwm = {}
+        self._stop_event = threading.Event()
+
+    def sample(self):
+        pending = [self.pid]
+        while pending:
+            pid = pending.pop()
+            hwm = _read_hwm(pid)
+            if hwm is not None and hwm > self.hwm.get(pid, 0):
+                self.hwm[pid] = hwm
+            pending.extend(_children(pid))
+
+    def run(self):
+        while not self._stop_event.wait(_SAMPLE_INTERVAL):
+            self.sample()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return sum(self.hwm.values()) or None
+
+
+def _watch_cancel(process, cancel_event, finished):
+    while not finished.wait(CANCEL_POLL_INTERVAL):
+        if cancel_event.is_set():
+            _kill_tree(process)
+            return
+
+
+def run_once(cmd, timeout=DEFAULT_TIMEOUT, cancel_event=None):
+    """Launch ``cmd`` once and measure it.
+
+    Returns a dict with ``exit_time`` and ``first_output`` (seconds, the latter
+    None if nothing was printed), ``peak_rss`` (bytes, None where unsupported),
+    ``returncode`` and ``timed_out``. Raises BuildCancelled if ``cancel_event``
+    is set while the executable runs.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        start_new_session=hasattr(os, "killpg"),
+    )
+    first_output = []
+
+    def drain():
+        if process.stdout.read(1):
+            first_output.append(time.perf_counter() - start)
+        while process.stdout.read(65536):
+            pass
+
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    sampler = _RssSampler(process.pid) if os.path.isdir(f"/proc/{process.pid}") else None
+    if sampler:
+        sampler.sample()
+        sampler.start()
+    timed_out = threading.Event()
+    timer = threading.Timer(timeout, lambda: (timed_out.set(), _kill_tree(process)))
+    timer.start()
+    finished = threading.Event()
+    if cancel_event is not None:
+        threading.Thread(target=_watch_cancel, args=(process, cancel_event, finished), daemon=True).start()
+
+    peak_rss = None
+    if sampler is None and hasattr(os, "wait4"):
+        # Without /proc fall back to the child's rusage, which includes its own
+        # waited-for children (e.g. the onefile bootloader's Python process).
+        _, status, rusage = os.wait4(process.pid, 0)
+        exit_time = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        peak_rss = rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    else:
+        process.wait()
+        exit_time = time.perf_counter() - start
+    if sampler:
+        peak_rss = sampler.stop()
+    timer.cancel()
+    finished.set()
+    # A daemonized grandchild may keep the pipe open; don't wait on it forever.
+    reader.join(timeout=1.0)
+    raise_if_cancelled(cancel_event)
+
+    return {
+        'exit_time': exit_time,
+        'first_output': first_output[0] if first_output else None,
+        'peak_rss': peak_rss,
+        'returncode': process.returncode,
+        'timed_out': timed_out.is_set(),
+    }
+
+
+def _summary(values):
+    values = [v for v in values if v is not None]
+    if not values:
+        return None
+    return {'median': statistics.median(values), 'min': min(values), 'max': max(values)}
+
+
+def benchmark(executable, args=(), runs=DEFAULT_RUNS, timeout=DEFAULT_TIMEOUT, cold_runs=1, cancel_event=None,
+              drop_caches=False):
+    """Run ``cold_runs`` cold launches followed by ``runs`` warm ones.
+
+    One untimed launch warms the caches before the warm runs. With
+    ``drop_caches`` the page cache is evicted before every cold launch.
+    """
+    cmd = [str(executable), *args]
+    results = {'executable': str(executable), 'args': list(args), 'cold': [], 'warm': [],
+               'page_cache_drop': drop_caches, 'page_cache_dropped': drop_caches}
+
+    for _ in range(cold_runs):
+        if drop_caches:
+            results['page_cache_dropped'] &= drop_page_cache()
+        results['cold'].append(run_once(cmd, timeout, cancel_event))
+    run_once(cmd, timeout, cancel_event)
+    for _ in range(runs):
+        results['warm'].append(run_once(cmd, timeout, cancel_event))
+
+    for kind in ('cold', 'warm'):
+        runs_of_kind = results[kind]
+        results[f'{kind}_summary'] = {
+            'exit_time': _summary([r['exit_time'] for r in runs_of_kind]),
+            'first_output': _summary([r['first_output'] for r in runs_of_kind]),
+            'peak_rss': _summary([r['peak_rss'] for r in runs_of_kind]),
+        }
+    results['failures'] = sum(1 for r in results['cold'] + results['warm'] if r['returncode'] != 0 or r['timed_out'])
+    return results
+
+
+def configuration_label(options):
+    parts = ["onefile" if options.get('one_file') else "onedir"]
+    if options.get('upx_dir') and not options.get('noupx'):
+        parts.append("upx")
+    if options.get('strip'):
+        parts.append("strip")
+    if options.get('exclude_modules'):
+        parts.append(f"{len(options['exclude_modules'])} excludes")
+    return "+".join(parts)
+
+
+def save_result(name, label, results, results_dir=None):
+    results_dir = Path(results_dir or DEFAULT_RESULTS_DIR)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    record = {'name': name, 'configuration': label, 'created': time.time(), **results}
+    with open(results_dir / f"{name}.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def load_results(name, results_dir=None, limit=10):
+    try:
+        with open(Path(results_dir or DEFAULT_RESULTS_DIR) / f"{name}.jsonl", "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return []
+    return records[-limit:]
+
+
+def _ms(value):
+    return f"{value * 1000:.0f} ms" if value is not None else "n/a"
+
+
+def _mib(value):
+    return f"{value / 1024 / 1024:.1f} MiB" if value is not None else "n/a"
+
+
+def format_results(results, previous=()):
+    cold = results['cold_summary']
+    warm = results['warm_summary']
+    lines = []
+    if cold['exit_time']:
+        note = ""
+        if not results['page_cache_dropped']:
+            note = " (page cache not dropped" + ("; run as root for a true cold start)"
+                                                 if results.get('page_cache_drop') else ")")
+        lines.append(f"[INFO] Startup benchmark, cold: exit {_ms(cold['exit_time']['median'])}, "
+                     f"first output {_ms(cold['first_output'] and cold['first_output']['median'])}{note}\n")
+    if warm['exit_time']:
+        lines.append(f"[INFO] Startup benchmark, warm x{len(results['warm'])}: exit median "
+                     f"{_ms(warm['exit_time']['median'])} (min {_ms(warm['exit_time']['min'])}, "
+                     f"max {_ms(warm['exit_time']['max'])}), first output "
+                     f"{_ms(warm['first_output'] and warm['first_output']['median'])}, peak RSS "
+                     f"{_mib(warm['peak_rss'] and warm['peak_rss']['max'])}\n")
+    if results['failures']:
+        lines.append(f"[WARNING] {results['failures']} benchmark run(s) failed or timed out\n")
+    if previous:
+        lines.append("[INFO] Previous startup benchmarks (configuration: warm median / cold / peak RSS):\n")
+        for record in previous:
+            record_warm = record['warm_summary']
+            record_cold = record['cold_summary']
+            lines.append(f"    {record['configuration']:<24} "
+                         f"{_ms(record_warm['exit_time'] and record_warm['exit_time']['median']):>8} / "
+                         f"{_ms(record_cold['exit_time'] and record_cold['exit_time']['median']):>8} / "
+                         f"{_mib(record_warm['peak_rss'] and record_warm['peak_rss']['max'])}\n")
+    return lines
+
+
+def benchmark_build(options, on_output, results_dir=None, cancel_event=None):
+    """Benchmark the artifact of a finished build and store the result."""
+    name = options.get('name') or "MyApp"
+    executable = find_executable(options.get('distpath'), name, options.get('one_file'))
+    if executable is None:
+        on_output(f"[WARNING] Built executable for '{name}' not found; startup benchmark skipped\n")
+        return None
+
+    args = shlex.split(options.get('benchmark_args') or "")
+    runs = options.get('benchmark_runs') or DEFAULT_RUNS
+    on_output(f"[PROCESS] Benchmarking startup of {executable} ({runs} warm runs)...\n")
+    results = benchmark(executable, args, runs, options.get('benchmark_timeout') or DEFAULT_TIMEOUT,
+                        cancel_event=cancel_event, drop_caches=bool(options.get('benchmark_drop_caches')))
+    previous = load_results(name, results_dir)
+    for line in format_results(results, previous):
+        on_output(line)
+    save_result(name, configuration_label(options), results, results_dir)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the startup time of a built executable.")
+    parser.add_argument("executable")
+    parser.add_argument("--args", default="", help="Smoke-test arguments passed to the executable")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Number of warm runs")
+    parser.add_argument("--cold-runs", type=int, default=1, help="Number of cold runs")
+    parser.add_argument("--drop-caches", action="store_true",
+                        help="Evict the whole machine's page cache before each cold run (Linux, root only)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-run timeout in seconds")
+    args = parser.parse_args(argv)
+
+    results = benchmark(args.executable, shlex.split(args.args), args.runs, args.timeout, args.cold_runs,
+                        drop_caches=args.drop_caches)
+    for line in format_results(results):
+        sys.stdout.write(line)
+    return 1 if results['failures'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
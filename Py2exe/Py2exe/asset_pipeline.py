@@ -0,0 +1,228 @@
+import os
+import json
+import zlib
+import shutil
+import struct
+import hashlib
+from pathlib import Path
+
+from asset_rules import source_paths
+
+# =================================================================================
+# Asset pre-processing pipeline (no Qt imports)
+#
+# Before PyInstaller runs, every asset is passed through a set of lossless
+# transforms and laid out in a staging directory that mirrors the bundle, which
+# then replaces all --add-data arguments with a single one. Transform results are
+# cached per asset content, so unchanged files are never reprocessed, and the
+# staging tree is built from hard links where possible.
+# =================================================================================
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "assets")
+STAGING_DIR = "py2exe-assets"
+TRANSFORMS = ('minify_json', 'optimize_png', 'drop_pyc_duplicates', 'dedupe')
+# Bump when a transform's output changes so cached results are not reused.
+PIPELINE_VERSION = 1
+_CHUNK_SIZE = 1024 * 1024
+# Below this many assets, starting worker processes costs more than it saves.
+_PARALLEL_THRESHOLD = 64
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Ancillary PNG chunks that carry no pixel or colour information.
+_PNG_DROP_CHUNKS = {b"tEXt", b"zTXt", b"iTXt", b"tIME"}
+
+
+def minify_json(data):
+    try:
+        value = json.loads(data)
+    except ValueError:
+        return None
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def optimize_png(data):
+    """Recompress the image data at the highest zlib level and drop text/time chunks."""
+    if not data.startswith(_PNG_SIGNATURE):
+        return None
+    chunks, idat = [], []
+    offset = len(_PNG_SIGNATURE)
+    try:
+        while offset < len(data):
+            length, chunk_type = struct.unpack(">I4s", data[offset:offset + 8])
+            body = data[offset + 8:offset + 8 + length]
+            offset += 12 + length
+            if chunk_type == b"IDAT":
+                if not idat:
+                    chunks.append((b"IDAT", None))
+                idat.append(body)
+            elif chunk_type not in _PNG_DROP_CHUNKS:
+                chunks.append((chunk_type, body))
+            if chunk_type == b"IEND":
+                break
+        pixels = zlib.compress(zlib.decompress(b"".join(idat)), 9)
+    except (struct.error, zlib.error):
+        return None
+
+    out = [_PNG_SIGNATURE]
+    for chunk_type, body in chunks:
+        body = pixels if body is None else body
+        out.append(struct.pack(">I4s", len(body), chunk_type) + body
+                   + struct.pack(">I", zlib.crc32(chunk_type + body) & 0xffffffff))
+    return b"".join(out)
+
+
+_CONTENT_TRANSFORMS = {
+    '.json': ('minify_json', minify_json),
+    '.png': ('optimize_png', optimize_png),
+}
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def process_asset(job):
+    """Hash one asset and apply its content transform through the cache.
+
+    Runs in a worker process. ``job`` is ``(source, transforms, cache_dir)``;
+    returns ``(source, digest, output, original_size, size, cached)`` where
+    ``output`` is the cached transformed file or None to ship the source as is.
+    """
+    source, transforms, cache_dir = job
+    original_size = os.path.getsize(source)
+    digest = _hash_file(source)
+    transform = _CONTENT_TRANSFORMS.get(os.path.splitext(source)[1].lower())
+    if not transform or transform[0] not in transforms:
+        return source, digest, None, original_size, original_size, False
+
+    name, function = transform
+    key = hashlib.sha256(f"{digest}|{name}|{PIPELINE_VERSION}".encode("utf-8")).hexdigest()
+    output = Path(cache_dir) / key[:2] / key
+    skip_marker = output.with_suffix(".keep")
+    if output.is_file():
+        return source, digest, str(output), original_size, output.stat().st_size, True
+    if skip_marker.is_file():
+        return source, digest, None, original_size, original_size, True
+
+    with open(source, "rb") as f:
+        result = function(f.read())
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(f".{key}.{os.getpid()}")
+    if result is None or len(result) >= original_size:
+        # No gain: remember that so the file is not transformed again.
+        tmp_path.write_bytes(b"")
+        os.replace(tmp_path, skip_marker)
+        return source, digest, None, original_size, original_size, False
+    tmp_path.write_bytes(result)
+    os.replace(tmp_path, output)
+    return source, digest, str(output), original_size, len(result), False
+
+
+def list_assets(add_data):
+    """Return ``(source_file, bundle_path)`` for every file the add_data entries ship."""
+    files = {}
+    for source, dest in add_data:
+        for path in map(Path, source_paths(source)):
+            if path.is_dir():
+                for root, _, names in os.walk(path):
+                    for name in names:
+                        file_path = Path(root) / name
+                        # A folder matched by a glob keeps its own name, as in PyInstaller.
+                        base = Path(dest, path.name) if _is_glob(source) else Path(dest)
+                        files[(base / file_path.relative_to(path)).as_posix()] = file_path
+            elif path.is_file():
+                files[Path(dest, path.name).as_posix()] = path
+    return [(str(source), bundle_path) for bundle_path, source in files.items()]
+
+
+def _is_glob(source):
+    return not os.path.exists(source)
+
+
+def _drop_pyc_duplicates(assets):
+    bundle_paths = {bundle_path for _, bundle_path in assets}
+    kept = []
+    for source, bundle_path in assets:
+        if bundle_path.endswith(".pyc"):
+            path = Path(bundle_path)
+            # foo.pyc next to foo.py, or __pycache__/foo.cpython-311.pyc below it.
+            module_dir = path.parent.parent if path.parent.name == "__pycache__" else path.parent
+            if (module_dir / (path.name.split(".")[0] + ".py")).as_posix() in bundle_paths:
+                continue
+        kept.append((source, bundle_path))
+    return kept
+
+
+def _place(source, target):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+class AssetPipeline:
+    def __init__(self, staging_dir, transforms=None, cache_dir=None, max_workers=None):
+        self.staging_dir = Path(staging_dir)
+        self.transforms = tuple(transforms) if transforms is not None else TRANSFORMS
+        self.cache_dir = str(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def run(self, add_data, on_output):
+        """Stage the assets and return the replacement add_data list."""
+        assets = list_assets(add_data)
+        dropped = 0
+        if 'drop_pyc_duplicates' in self.transforms:
+            kept = _drop_pyc_duplicates(assets)
+            dropped, assets = len(assets) - len(kept), kept
+
+        jobs = [(source, self.transforms, self.cache_dir) for source, _ in assets]
+        if len(jobs) > _PARALLEL_THRESHOLD and self.max_workers > 1:
+            # Imported here: multiprocessing is slow to import and most builds never get this far.
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(process_asset, jobs, chunksize=max(1, len(jobs) // (self.max_workers * 4))))
+        else:
+            results = [process_asset(job) for job in jobs]
+
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        self.staging_dir.mkdir(parents=True)
+        staged_by_digest = {}
+        duplicates = duplicate_bytes = 0
+        for (_, bundle_path), (source, digest, output, _, size, _) in zip(assets, results):
+            target = self.staging_dir / bundle_path
+            if 'dedupe' in self.transforms and digest in staged_by_digest:
+                _place(staged_by_digest[digest], target)
+                duplicates += 1
+                duplicate_bytes += size
+                continue
+            _place(output or source, target)
+            staged_by_digest[digest] = target
+
+        original = sum(result[3] for result in results)
+        final = sum(result[4] for result in results)
+        cached = sum(1 for result in results if result[5])
+        transformed = sum(1 for result in results if result[2])
+        on_output(f"[INFO] Asset pipeline: {len(results)} file(s), {transformed} transformed "
+                  f"({cached} from cache), {original / 1024 / 1024:.1f} MiB -> {final / 1024 / 1024:.1f} MiB\n")
+        if dropped:
+            on_output(f"[INFO] Asset pipeline: dropped {dropped} .pyc file(s) shipped next to their source\n")
+        if duplicates:
+            on_output(f"[INFO] Asset pipeline: {duplicates} duplicate file(s) ({duplicate_bytes / 1024 / 1024:.1f} MiB) "
+                      f"hard-linked in staging; consider shipping them once\n")
+        return [(str(self.staging_dir), ".")] if results else []
+
+
+def run_asset_pipeline(options, on_output):
+    """Return ``options`` with add_data replaced by the staged assets."""
+    if not options.get('add_data'):
+        return options
+    name = options.get('name') or "MyApp"
+    # Next to PyInstaller's own <workpath>/<name>, not inside it: --clean empties
+    # that folder after the assets have been staged.
+    staging_dir = Path(options.get('workpath') or "build").resolve() / f"{name}-{STAGING_DIR}"
+    pipeline = AssetPipeline(staging_dir, options.get('asset_transforms'))
+    return dict(options, add_data=pipeline.run(options['add_data'], on_output))
@@ -0,0 +1,174 @@
+import os
+import glob
+import fnmatch
+from pathlib import Path
+
+# =================================================================================
+# Folder asset rules (no Qt imports)
+#
+# A rule names a source folder plus include/exclude patterns, a size limit and
+# whether to follow symlinks. Rules are stored as rules and only expanded when a
+# build starts, by a streaming os.scandir walk. The matching files are then
+# collapsed into as few --add-data arguments as possible: a folder whose whole
+# tree matches becomes one argument, and a set of same-extension files that
+# makes up all of a folder's files with that extension becomes one glob.
+#
+#   {'source': "data", 'dest': "data", 'include': ["*"], 'exclude': ["*.tmp"],
+#    'max_size': None, 'follow_symlinks': False}
+# =================================================================================
+
+# Never worth shipping; applied to file and folder names on top of each rule's
+# own excludes.
+DEFAULT_EXCLUDES = [
+    "__pycache__", "*.pyc", "*.pyo", ".git", ".hg", ".svn", ".DS_Store", "Thumbs.db", "desktop.ini",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache", ".tox", ".venv", ".idea", ".vscode", "*.swp", "*~",
+]
+
+_GLOB_CHARS = ("*", "?", "[")
+
+
+def make_rule(source, dest, include=None, exclude=None, max_size=None, follow_symlinks=False):
+    return {
+        'source': source,
+        'dest': dest,
+        'include': list(include or ["*"]),
+        'exclude': list(exclude or []),
+        'max_size': max_size,
+        'follow_symlinks': follow_symlinks,
+    }
+
+
+def source_paths(source):
+    """Return the existing paths an --add-data source refers to (expanding globs)."""
+    if os.path.exists(source):
+        return [source]
+    if any(char in source for char in _GLOB_CHARS):
+        return sorted(glob.glob(source))
+    return []
+
+
+def _matches(name, relative, patterns):
+    return any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative, pattern) for pattern in patterns)
+
+
+def _join_dest(dest, relative):
+    return Path(dest, relative).as_posix() if relative else dest
+
+
+class _RuleExpander:
+    def __init__(self, rule):
+        self.include = rule.get('include') or ["*"]
+        self.exclude = DEFAULT_EXCLUDES + list(rule.get('exclude') or [])
+        self.max_size = rule.get('max_size')
+        self.follow_symlinks = bool(rule.get('follow_symlinks'))
+        self.dest = rule.get('dest') or "."
+        self.files = 0
+        self.size = 0
+        self.skipped = 0
+        self._visited = set()
+
+    def expand(self, root):
+        entries, _ = self._walk(root, "")
+        return entries
+
+    def _walk(self, directory, relative):
+        """Return ``(entries, complete)`` for one folder.
+
+        ``complete`` is True when every file below the folder was selected; the
+        entries are then just the folder itself.
+        """
+        if self.follow_symlinks:
+            # Guard against symlink cycles.
+            stat = os.stat(directory)
+            key = stat.st_ino, stat.st_dev
+            if key in self._visited:
+                return [], False
+            self._visited.add(key)
+
+        complete = True
+        entries = []
+        all_names, selected_names, subdir_names = [], [], []
+        with os.scandir(directory) as it:
+            for entry in it:
+                entry_relative = f"{relative}/{entry.name}" if relative else entry.name
+                if entry.is_symlink() and not self.follow_symlinks:
+                    complete = False
+                    self.skipped += 1
+                    continue
+                if entry.is_dir():
+                    subdir_names.append(entry.name)
+                    if _matches(entry.name, entry_relative, self.exclude):
+                        complete = False
+                        self.skipped += 1
+                        continue
+                    sub_entries, sub_complete = self._walk(entry.path, entry_relative)
+                    entries.extend(sub_entries)
+                    complete = complete and sub_complete
+                    continue
+
+                all_names.append(entry.name)
+                size = entry.stat().st_size
+                if (_matches(entry.name, entry_relative, self.exclude)
+                        or not _matches(entry.name, entry_relative, self.include)
+                        or (self.max_size and size > self.max_size)):
+                    complete = False
+                    self.skipped += 1
+                    continue
+                selected_names.append(entry.name)
+                self.files += 1
+                self.size += size
+
+        if complete:
+            return ([(directory, _join_dest(self.dest, relative))] if entries or selected_names else []), True
+        entries.extend(self._collapse_files(directory, relative, all_names, selected_names, subdir_names))
+        return entries, False
+
+    def _collapse_files(self, directory, relative, all_names, selected_names, subdir_names):
+        dest = _join_dest(self.dest, relative)
+        by_suffix = {}
+        for name in selected_names:
+            by_suffix.setdefault(os.path.splitext(name)[1], []).append(name)
+
+        entries = []
+        escaped_dir = glob.escape(directory)
+        for suffix, names in sorted(by_suffix.items()):
+            pattern = f"*{suffix}"
+            same_suffix = [name for name in all_names if os.path.splitext(name)[1] == suffix]
+            # "*" skips dot-files, so a folder with hidden files keeps explicit entries.
+            if (suffix and len(names) > 1 and len(names) == len(same_suffix)
+                    and not any(name.startswith(".") for name in names)
+                    and not any(fnmatch.fnmatch(name, pattern) for name in subdir_names)
+                    and not any(char in suffix for char in _GLOB_CHARS)):
+                entries.append((os.path.join(escaped_dir, pattern), dest))
+            else:
+                entries.extend((os.path.join(directory, name), dest) for name in sorted(names))
+        return entries
+
+
+def expand_rule(rule):
+    """Expand one rule into ``(add_data_entries, stats)``."""
+    source = rule.get('source')
+    expander = _RuleExpander(rule)
+    if not source or not os.path.isdir(source):
+        raise FileNotFoundError(f"asset folder not found: {source}")
+    entries = expander.expand(source)
+    return entries, {'files': expander.files, 'size': expander.size, 'skipped': expander.skipped}
+
+
+def resolve_assets(options, on_output):
+    """Return ``options`` with every asset rule expanded into ``add_data``."""
+    rules = options.get('asset_rules') or []
+    if not rules:
+        return options
+    add_data = list(options.get('add_data') or [])
+    for rule in rules:
+        try:
+            entries, stats = expand_rule(rule)
+        except OSError as e:
+            on_output(f"[WARNING] Asset rule skipped: {e}\n")
+            continue
+        add_data.extend(entries)
+        on_output(f"[INFO] Asset rule {rule['source']} -> {rule.get('dest') or '.'}: {stats['files']} file(s), "
+                  f"{stats['size'] / 1024 / 1024:.1f} MiB, {stats['skipped']} skipped, "
+                  f"{len(entries)} --add-data argument(s)\n")
+    return dict(options, add_data=add_data)
@@ -0,0 +1,384 @@
+import os
+import sys
+import hmac
+import json
+import stat
+import shutil
+import socket
+import struct
+import zipfile
+import argparse
+import ipaddress
+import tempfile
+import threading
+import socketserver
+from pathlib import Path
+
+from build_core import execute_build
+from build_cache import artifact_paths
+from process_tree import CANCEL_POLL_INTERVAL
+
+# =================================================================================
+# Remote build agent (no Qt imports)
+#
+# A TCP server that runs the same execute_build() as the GUI's BuildWorker on
+# behalf of a coordinator (see remote_build.py). The coordinator sends the
+# script, its local modules and every asset as one zip archive together with
+# the options dict; the agent streams the build log back and answers with the
+# zipped artifact. Every message is a length-prefixed JSON header, optionally
+# followed by a binary payload whose size the header announces.
+#
+#   python build_agent.py --port 8765 --jobs 4
+#   PY2EXE_AGENT_TOKEN=secret python build_agent.py --host 0.0.0.0
+#
+# Agents run whatever a build imports and hooks execute, so they listen on
+# localhost unless told otherwise, and refuse any other interface unless
+# PY2EXE_AGENT_TOKEN is set; clients must then send the same token.
+# =================================================================================
+
+DEFAULT_PORT = 8765
+DEFAULT_WORKDIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "agent")
+PROTOCOL_VERSION = 1
+TOKEN_ENV = "PY2EXE_AGENT_TOKEN"
+_HEADER = struct.Struct("!I")
+_CHUNK = 1024 * 1024
+_MAX_HEADER = 64 * 1024 * 1024
+
+
+# ---------------------------------------------------------------------------------
+# Wire protocol
+# ---------------------------------------------------------------------------------
+
+def _recv_exact(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(min(size - len(data), _CHUNK))
+        if not chunk:
+            raise ConnectionError("connection closed by peer")
+        data += chunk
+    return bytes(data)
+
+
+def send_message(sock, message, payload_path=None):
+    """Send a JSON message, followed by the contents of ``payload_path`` if given."""
+    message = dict(message, size=os.path.getsize(payload_path) if payload_path else 0)
+    header = json.dumps(message).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(header)) + header)
+    if payload_path:
+        with open(payload_path, "rb") as f:
+            sock.sendfile(f)
+
+
+def recv_header(sock):
+    """Receive the JSON part of a message; its payload, if any, is still unread."""
+    (length,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if length > _MAX_HEADER:
+        raise ConnectionError(f"message header too large ({length} bytes)")
+    return json.loads(_recv_exact(sock, length).decode("utf-8"))
+
+
+def recv_payload(sock, message, payload_dir=None):
+    """Save the payload announced by ``message`` under ``payload_dir``; its path is stored in 'payload'."""
+    remaining = message.get('size') or 0
+    if remaining:
+        fd, payload_path = tempfile.mkstemp(suffix=".zip", dir=payload_dir)
+        with os.fdopen(fd, "wb") as f:
+            while remaining:
+                chunk = sock.recv(min(remaining, _CHUNK))
+                if not chunk:
+                    raise ConnectionError("connection closed during transfer")
+                f.write(chunk)
+                remaining -= len(chunk)
+        message['payload'] = payload_path
+    return message
+
+
+def recv_message(sock, payload_dir=None):
+    return recv_payload(sock, recv_header(sock), payload_dir)
+
+
+def _is_loopback(host):
+    """True when every address ``host`` resolves to is a loopback address."""
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, None)}
+    except OSError:
+        return False
+    return bool(addresses) and all(ipaddress.ip_address(address.split("%")[0]).is_loopback
+                                   for address in addresses)
+
+
+def check_token(expected, given):
+    return not expected or hmac.compare_digest(expected.encode("utf-8"), (given or "").encode("utf-8"))
+
+
+# ---------------------------------------------------------------------------------
+# Archives
+# ---------------------------------------------------------------------------------
+
+def _add_path(archive, path, name):
+    if os.path.islink(path):
+        # Symlinks (e.g. in macOS .app bundles) are stored as links, not followed.
+        info = zipfile.ZipInfo(name)
+        info.external_attr = (stat.S_IFLNK | 0o777) << 16
+        archive.writestr(info, os.readlink(path))
+    elif os.path.isdir(path):
+        children = sorted(os.listdir(path))
+        if not children:
+            archive.writestr(zipfile.ZipInfo(f"{name}/"), b"")
+        for child in children:
+            _add_path(archive, os.path.join(path, child), f"{name}/{child}")
+    else:
+        archive.write(path, name)
+
+
+def pack_archive(entries, archive_path):
+    """Zip ``(path, name)`` pairs, recursing into folders; returns the number of entries."""
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for path, name in entries:
+            _add_path(archive, str(path), name)
+        return len(archive.infolist())
+
+
+def _inside(root, path):
+    return os.path.commonpath([root, path]) == root
+
+
+def unpack_archive(archive_path, dest_dir):
+    """Extract an archive made by pack_archive, keeping file modes and symlinks.
+
+    Raises ValueError for entries that would land outside ``dest_dir``.
+    """
+    dest_dir = os.path.realpath(dest_dir)
+    os.makedirs(dest_dir, exist_ok=True)
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            target = os.path.normpath(os.path.join(dest_dir, info.filename))
+            # Checked against the real parent too, so an earlier symlink cannot redirect a write.
+            if not _inside(dest_dir, target) or not _inside(dest_dir, os.path.realpath(os.path.dirname(target))):
+                raise ValueError(f"unsafe path in archive: {info.filename}")
+            mode = info.external_attr >> 16
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if stat.S_ISLNK(mode):
+                os.symlink(archive.read(info).decode("utf-8"), target)
+                continue
+            with archive.open(info) as source, open(target, "wb") as f:
+                shutil.copyfileobj(source, f, _CHUNK)
+            if mode & 0o777:
+                os.chmod(target, mode & 0o777)
+
+
+# ---------------------------------------------------------------------------------
+# Agent
+# ---------------------------------------------------------------------------------
+
+def _load():
+    """Return the 1-minute load average per CPU, or 0.0 where it is unavailable."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return 0.0
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        self.server.agent.handle_connection(self.request)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class BuildAgent:
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, jobs=1, workdir=None, python=None, token=None,
+                 on_log=None):
+        """Raises ValueError when asked to listen beyond localhost without a token."""
+        if not token and not _is_loopback(host):
+            raise ValueError(f"listening on {host} would let anyone who can reach it run code on this machine; "
+                             f"set {TOKEN_ENV} first")
+        self.host = host
+        self.port = port
+        self.jobs = max(1, jobs)
+        self.workdir = Path(workdir or DEFAULT_WORKDIR)
+        self.python = python
+        self.token = token
+        self.on_log = on_log or (lambda text: None)
+        self.running = 0
+        self.queued = 0
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(self.jobs)
+        self._server = None
+
+    def status(self):
+        with self._lock:
+            running, queued = self.running, self.queued
+        return {
+            'protocol': PROTOCOL_VERSION,
+            'jobs': self.jobs,
+            'running': running,
+            'queued': queued,
+            'load': _load(),
+            'platform': sys.platform,
+            'python': sys.version.split()[0],
+        }
+
+    def serve_forever(self):
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        self._server = _Server((self.host, self.port), _Handler)
+        self._server.agent = self
+        # Port 0 picks a free port; report the real one.
+        self.port = self._server.server_address[1]
+        self.on_log(f"[INFO] Build agent listening on {self.host}:{self.port} with {self.jobs} slot(s)\n")
+        self._server.serve_forever(poll_interval=CANCEL_POLL_INTERVAL)
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def handle_connection(self, conn):
+        try:
+            message = recv_header(conn)
+        except (OSError, ValueError):
+            return
+        try:
+            if not check_token(self.token, message.get('token')):
+                send_message(conn, {'type': "error", 'message': "invalid agent token"})
+            elif message.get('protocol') != PROTOCOL_VERSION:
+                send_message(conn, {'type': "error",
+                                    'message': f"agent speaks protocol {PROTOCOL_VERSION}, "
+                                               f"coordinator {message.get('protocol')}"})
+            elif message.get('type') == "status":
+                send_message(conn, dict(self.status(), type="status"))
+            elif message.get('type') == "build" and message.get('size'):
+                # Only an authenticated coordinator gets to upload.
+                self._build(conn, recv_payload(conn, message, self.workdir))
+            else:
+                send_message(conn, {'type': "error", 'message': f"unknown request {message.get('type')!r}"})
+        except (OSError, ValueError):
+            pass
+        finally:
+            if message.get('payload'):
+                Path(message['payload']).unlink(missing_ok=True)
+
+    def _acquire_slot(self, cancel_event):
+        with self._lock:
+            self.queued += 1
+        try:
+            while not self._slots.acquire(timeout=CANCEL_POLL_INTERVAL):
+                if cancel_event.is_set():
+                    return False
+        finally:
+            with self._lock:
+                self.queued -= 1
+        with self._lock:
+            self.running += 1
+        return True
+
+    def _release_slot(self):
+        with self._lock:
+            self.running -= 1
+        self._slots.release()
+
+    def _localize_options(self, options, inputs, workspace):
+        """Point the coordinator's archive-relative paths at this agent's workspace."""
+        options = dict(options)
+        options.update({
+            'python': self.python,
+            'icon': str(inputs / options['icon']) if options.get('icon') else None,
+            'add_data': [[str(inputs / source), dest] for source, dest in options.get('add_data') or []],
+            'asset_rules': [],
+            'distpath': str(workspace / "dist"),
+            'workpath': str(workspace / "build"),
+            'specpath': str(workspace),
+            'upx_dir': None,
+            'cache_dir': None,
+            'agents': [],
+        })
+        return options
+
+    def _build(self, conn, message):
+        workspace = Path(tempfile.mkdtemp(prefix="build-", dir=self.workdir))
+        cancel_event = threading.Event()
+        send_lock = threading.Lock()
+
+        def send(reply, payload_path=None):
+            try:
+                with send_lock:
+                    send_message(conn, reply, payload_path)
+            except OSError:
+                # The coordinator is gone; nobody is left to receive the artifact.
+                cancel_event.set()
+
+        def watch_coordinator():
+            try:
+                while recv_message(conn).get('type') != "cancel":
+                    pass
+            except (OSError, ValueError):
+                pass
+            cancel_event.set()
+
+        threading.Thread(target=watch_coordinator, daemon=True).start()
+        try:
+            inputs = workspace / "inputs"
+            unpack_archive(message['payload'], inputs)
+            options = self._localize_options(message['options'], inputs, workspace)
+            name = options.get('name') or "MyApp"
+            self.on_log(f"[INFO] Build '{name}' queued\n")
+            if not self._acquire_slot(cancel_event):
+                return
+            try:
+                self.on_log(f"[INFO] Build '{name}' started\n")
+                outcome = {}
+                success, text = execute_build(str(inputs / message['script']), options,
+                                              lambda output: send({'type': "output", 'text': output}),
+                                              cancel_event, outcome)
+            finally:
+                self._release_slot()
+            self.on_log(f"[INFO] Build '{name}' finished: {text}\n")
+
+            reply = {'type': "result", 'success': success, 'message': text,
+                     'status': outcome.get('status'), 'returncode': outcome.get('returncode')}
+            artifact_path = None
+            if success:
+                artifact_path = workspace / "artifact.zip"
+                pack_archive([(path, path.name) for path in artifact_paths(options['distpath'], name)], artifact_path)
+            send(reply, artifact_path)
+        except (OSError, ValueError, KeyError) as e:
+            send({'type': "result", 'success': False, 'message': f"Agent could not run the build: {e}"})
+        finally:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="py2exe-agent",
+                                     description="Run Py2Exe builds sent by a coordinator over TCP.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help=f"Interface to listen on (default: localhost only; 0.0.0.0 for all needs {TOKEN_ENV})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"TCP port (default: {DEFAULT_PORT})")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Builds to run at the same time")
+    parser.add_argument("--workdir", default=DEFAULT_WORKDIR, help="Folder for per-build workspaces")
+    parser.add_argument("--python", help="Interpreter or virtualenv folder to run PyInstaller from")
+    args = parser.parse_args(argv)
+
+    def log(text):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    try:
+        agent = BuildAgent(args.host, args.port, args.jobs, args.workdir, args.python, os.environ.get(TOKEN_ENV),
+                           log)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        agent.serve_forever()
+    except KeyboardInterrupt:
+        agent.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
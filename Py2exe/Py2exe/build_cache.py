@@ -0,0 +1,199 @@
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import subprocess
+from pathlib import Path
+
+from script_graph import local_module_files, path_under_root
+from asset_rules import source_paths
+from python_env import environment_info
+
+# =================================================================================
+# Content-addressed build cache (no Qt imports)
+#
+# A build is keyed on everything that determines its output: the PyInstaller
+# command line, the script and its local imports, the add_data sources, the icon
+# and the interpreter/PyInstaller versions. Artifacts are stored per key and
+# evicted least-recently-used once the cache exceeds its size limit.
+# =================================================================================
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "builds")
+DEFAULT_MAX_SIZE = 5 * 1024 ** 3  # 5 GiB
+_CHUNK_SIZE = 1024 * 1024
+_META_FILE = "meta.json"
+_ARTIFACT_DIR = "artifact"
+
+
+def _hash_file(digest, path):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+
+def _hash_tree(digest, path):
+    """Feed a file, or every file below a directory in a stable order, into ``digest``."""
+    path = Path(path)
+    if path.is_file():
+        _hash_file(digest, path)
+        return
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for file_name in sorted(files):
+            file_path = Path(root) / file_name
+            digest.update(str(file_path.relative_to(path)).encode("utf-8"))
+            _hash_file(digest, file_path)
+
+
+def toolchain_version(python=None):
+    """Identify the interpreter and PyInstaller that will run the build."""
+    if python:
+        info = environment_info(python)
+        return f"python={info['version']};pyinstaller={info['pyinstaller']};exe={info['executable']}"
+    try:
+        result = subprocess.run(["pyinstaller", "--version"], capture_output=True, text=True, timeout=60)
+        pyinstaller_version = result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        pyinstaller_version = "unknown"
+    return f"python={sys.version};pyinstaller={pyinstaller_version};exe={shutil.which('pyinstaller')}"
+
+
+def artifact_paths(distpath, name):
+    """Return the distpath entries PyInstaller produced for ``name``.
+
+    Covers onefile (``name``/``name.exe``), onedir (``name/``) and macOS bundles
+    (``name.app``).
+    """
+    dist_dir = Path(distpath or "dist")
+    if not dist_dir.is_dir():
+        return []
+    return sorted(p for p in dist_dir.iterdir() if p.name == name or p.name.startswith(name + "."))
+
+
+def tree_size(path):
+    path = Path(path)
+    if path.is_file():
+        return path.stat().st_size
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+class BuildCache:
+    def __init__(self, cache_dir=None, max_size=DEFAULT_MAX_SIZE):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_size = max_size
+
+    def compute_key(self, cmd, script_path, options, toolchain=None):
+        digest = hashlib.sha256()
+        digest.update(json.dumps(cmd).encode("utf-8"))
+        digest.update((toolchain or toolchain_version(options.get('python'))).encode("utf-8"))
+
+        script_root = Path(script_path).resolve().parent
+        for module_file in local_module_files(script_path):
+            digest.update(str(path_under_root(module_file, script_root)).encode("utf-8"))
+            _hash_file(digest, module_file)
+
+        for source, dest in options.get('add_data') or []:
+            digest.update(f"{source}\0{dest}".encode("utf-8"))
+            for path in source_paths(source):
+                _hash_tree(digest, path)
+
+        icon_path = options.get('icon')
+        if icon_path and os.path.isfile(icon_path):
+            _hash_file(digest, icon_path)
+        return digest.hexdigest()
+
+    def _entry_dir(self, key):
+        return self.cache_dir / key
+
+    def _read_meta(self, entry_dir):
+        try:
+            with open(entry_dir / _META_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, entry_dir, meta):
+        with open(entry_dir / _META_FILE, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def restore(self, key, distpath):
+        """Copy a cached artifact into ``distpath``. Returns the restored paths or None."""
+        entry_dir = self._entry_dir(key)
+        meta = self._read_meta(entry_dir)
+        # An entry whose artifact went missing is a miss, not an error.
+        if meta is None or not (entry_dir / _ARTIFACT_DIR).is_dir():
+            return None
+
+        dist_dir = Path(distpath or "dist")
+        dist_dir.mkdir(parents=True, exist_ok=True)
+        restored = []
+        for item in sorted((entry_dir / _ARTIFACT_DIR).iterdir()):
+            target = dist_dir / item.name
+            if target.is_dir():
+                shutil.rmtree(target)
+            elif target.exists():
+                target.unlink()
+            if item.is_dir():
+                shutil.copytree(item, target, symlinks=True)
+            else:
+                shutil.copy2(item, target)
+            restored.append(target)
+
+        meta['last_used'] = time.time()
+        self._write_meta(entry_dir, meta)
+        return restored
+
+    def store(self, key, distpath, name):
+        """Copy the freshly built artifact for ``name`` into the cache."""
+        sources = artifact_paths(distpath, name)
+        if not sources:
+            return False
+
+        entry_dir = self._entry_dir(key)
+        staging_dir = self.cache_dir / f".{key}.tmp"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        (staging_dir / _ARTIFACT_DIR).mkdir(parents=True)
+        for source in sources:
+            target = staging_dir / _ARTIFACT_DIR / source.name
+            if source.is_dir():
+                shutil.copytree(source, target, symlinks=True)
+            else:
+                shutil.copy2(source, target)
+
+        now = time.time()
+        self._write_meta(staging_dir, {
+            'name': name,
+            'size': tree_size(staging_dir / _ARTIFACT_DIR),
+            'created': now,
+            'last_used': now,
+        })
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(staging_dir, entry_dir)
+        self.evict()
+        return True
+
+    def entries(self):
+        if not self.cache_dir.is_dir():
+            return []
+        result = []
+        for entry_dir in self.cache_dir.iterdir():
+            if entry_dir.name.startswith("."):
+                continue
+            meta = self._read_meta(entry_dir)
+            if meta is not None:
+                result.append((entry_dir, meta))
+        return result
+
+    def evict(self):
+        """Drop least-recently-used entries until the cache fits ``max_size``."""
+        entries = sorted(self.entries(), key=lambda entry: entry[1].get('last_used', 0))
+        total = sum(meta.get('size', 0) for _, meta in entries)
+        evicted = 0
+        while entries and total > self.max_size:
+            entry_dir, meta = entries.pop(0)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= meta.get('size', 0)
+            evicted += 1
+        return evicted
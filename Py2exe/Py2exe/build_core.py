@@ -0,0 +1,694 @@
+import os
+import re
+import sys
+import time
+import queue
+import codecs
+import shutil
+import hashlib
+import threading
+import subprocess
+from pathlib import Path
+
+from build_cache import BuildCache, artifact_paths
+from bundle_report import report_build
+from artifact_benchmark import benchmark_build, DEFAULT_RUNS, DEFAULT_TIMEOUT
+from upx_stage import uses_parallel_upx, run_upx_stage
+from incremental_build import IncrementalBuild
+from asset_rules import resolve_assets
+from asset_pipeline import run_asset_pipeline
+from build_validation import validate_build
+from build_timing import BuildTimeline, report_timing
+from build_history import default_history, options_hash
+from python_env import pyinstaller_command, makespec_command
+from process_tree import (BuildCancelled, CANCEL_POLL_INTERVAL, process_group_kwargs, raise_if_cancelled,
+                          terminate_process_tree)
+
+# =================================================================================
+# Pure-Python build core (no Qt imports)
+#
+# Shared by the GUI's BuildWorker and the headless `py2exe_build` CLI. Options use
+# the same keys produced by the GUI tabs' get_options() methods.
+# =================================================================================
+
+SEPARATOR = "\n" + "=" * 80 + "\n"
+# Py2Exe's own warnings and PyInstaller's "<ms> WARNING: ..." lines.
+_WARNING_LINE = re.compile(r"^(?:\[WARNING\]|\d+ WARNING:)", re.MULTILINE)
+
+# Subprocess output is delivered in batches rather than line by line: a batch is
+# flushed when it is FLUSH_INTERVAL seconds old or FLUSH_BYTES long, always on a
+# line boundary.
+FLUSH_INTERVAL = 0.05
+FLUSH_BYTES = 64 * 1024
+_READ_SIZE = 64 * 1024
+
+DEFAULT_OPTIONS = {
+    'name': "MyApp",
+    'python': None,
+    'icon': None,
+    'distpath': None,
+    'workpath': None,
+    'specpath': None,
+    'one_file': True,
+    'windowed': False,
+    'clean': False,
+    'strip': False,
+    'upx_dir': None,
+    'noupx': False,
+    'parallel_upx': False,
+    'upx_exclude': [],
+    'hidden_imports': [],
+    'collect_all': [],
+    'exclude_modules': [],
+    'add_data': [],
+    'asset_rules': [],
+    'asset_pipeline': False,
+    'asset_transforms': None,
+    'use_cache': False,
+    'cache_dir': None,
+    'reuse_spec': False,
+    'incremental': False,
+    'size_report': True,
+    'benchmark': False,
+    'benchmark_runs': DEFAULT_RUNS,
+    'benchmark_args': "",
+    'benchmark_timeout': DEFAULT_TIMEOUT,
+    'benchmark_drop_caches': False,
+    'validate': True,
+    'phase_timing': True,
+    'history': True,
+    'agents': [],
+    'warm_worker': False,
+}
+
+
+def absolute_inputs(script_path, options):
+    """Return ``(script_path, options)`` with the script, icon and data sources made absolute.
+
+    PyInstaller resolves relative --add-data sources and --icon against the spec
+    directory, so a build that moves its specpath must not pass relative ones.
+    """
+    options = dict(options)
+    if options.get('icon'):
+        options['icon'] = os.path.abspath(options['icon'])
+    if options.get('add_data'):
+        options['add_data'] = [(os.path.abspath(source), dest) for source, dest in options['add_data']]
+    if options.get('asset_rules'):
+        options['asset_rules'] = [dict(rule, source=os.path.abspath(rule['source'])) if rule.get('source') else rule
+                                  for rule in options['asset_rules']]
+    return os.path.abspath(script_path) if script_path else script_path, options
+
+
+def build_command(script_path, options):
+    """Translate an options dict into a PyInstaller argv.
+
+    Returns ``(cmd, messages)`` where ``messages`` are the ``[CONFIG]``/``[WARNING]``
+    log lines describing the chosen configuration.
+    """
+    # Rebuilds must be able to replace a previous onedir bundle without a prompt.
+    cmd = [*pyinstaller_command(options.get('python')), "--noconfirm"]
+    messages = []
+    if options.get('python'):
+        messages.append(f"[CONFIG] Interpreter: {cmd[0]}\n")
+
+    if options.get('one_file'):
+        cmd.append("--onefile")
+        messages.append("[CONFIG] One-file mode enabled\n")
+    else:
+        cmd.append("--onedir")
+        messages.append("[CONFIG] One-directory mode enabled\n")
+
+    if options.get('windowed'):
+        cmd.append("--windowed")
+        messages.append("[CONFIG] Windowed mode enabled\n")
+    else: # PyInstaller defaults to console, but explicit is better
+        cmd.append("--console")
+        messages.append("[CONFIG] Console mode enabled\n")
+
+    icon_path = options.get('icon')
+    if icon_path:
+        if Path(icon_path).is_file():
+            cmd.extend(["--icon", icon_path])
+            messages.append(f"[CONFIG] Icon: {icon_path}\n")
+        else:
+            messages.append(f"[WARNING] Icon file not found at: {icon_path}. Build will proceed with the default icon.\n")
+
+    name = options.get('name') or DEFAULT_OPTIONS['name']
+    cmd.extend(["-n", name])
+    messages.append(f"[CONFIG] Output name: {name}\n")
+
+    if options.get('distpath'):
+        cmd.extend(["--distpath", options['distpath']])
+        messages.append(f"[CONFIG] Distribution path: {options['distpath']}\n")
+
+    if options.get('workpath'):
+        cmd.extend(["--workpath", options['workpath']])
+        messages.append(f"[CONFIG] Work path: {options['workpath']}\n")
+
+    if options.get('specpath'):
+        cmd.extend(["--specpath", options['specpath']])
+        messages.append(f"[CONFIG] Spec path: {options['specpath']}\n")
+
+    if options.get('clean'):
+        cmd.append("--clean")
+        messages.append("[CONFIG] Clean build enabled\n")
+
+    if options.get('strip'):
+        cmd.append("--strip")
+        messages.append("[CONFIG] Binary stripping enabled\n")
+
+    if uses_parallel_upx(options):
+        # Py2Exe compresses the onedir bundle itself after PyInstaller finishes.
+        cmd.append("--noupx")
+        messages.append(f"[CONFIG] Parallel UPX stage enabled: {options['upx_dir']}\n")
+    elif options.get('noupx'):
+        cmd.append("--noupx")
+        messages.append("[CONFIG] UPX disabled\n")
+    elif options.get('upx_dir'):
+        if options.get('parallel_upx') and options.get('one_file'):
+            messages.append("[WARNING] Parallel UPX only applies to one-directory builds; using PyInstaller's UPX step\n")
+        cmd.append("--upx-dir=" + options['upx_dir'])
+        messages.append(f"[CONFIG] UPX directory: {options['upx_dir']}\n")
+
+    if options.get('hidden_imports'):
+        for imp in options['hidden_imports']:
+            cmd.extend(["--hidden-import", imp])
+        messages.append(f"[CONFIG] Hidden imports: {', '.join(options['hidden_imports'])}\n")
+
+    if options.get('collect_all'):
+        for pkg in options['collect_all']:
+            cmd.extend(["--collect-all", pkg])
+        messages.append(f"[CONFIG] Collect all: {', '.join(options['collect_all'])}\n")
+
+    if options.get('exclude_modules'):
+        for mod in options['exclude_modules']:
+            cmd.extend(["--exclude-module", mod])
+        # PyInstaller adds __main__ to the excludes it saves with the analysis; without
+        # it here the saved analysis never matches and is redone on every build.
+        if "__main__" not in options['exclude_modules']:
+            cmd.extend(["--exclude-module", "__main__"])
+        messages.append(f"[CONFIG] Excluded modules: {', '.join(options['exclude_modules'])}\n")
+
+    if options.get('add_data'):
+        data_separator = os.pathsep
+        for source, dest in options['add_data']:
+            cmd.extend(["--add-data", f"{source}{data_separator}{dest}"])
+        messages.append(f"[CONFIG] Added data files: {len(options['add_data'])}\n")
+
+    cmd.append(script_path)
+    messages.append(f"[CONFIG] Script: {script_path}\n")
+    return cmd, messages
+
+
+# Options PyInstaller still accepts when building from a .spec file; everything
+# else is baked into the spec by pyi-makespec.
+_BUILD_ONLY_OPTIONS = ("--distpath", "--workpath")
+_BUILD_ONLY_FLAGS = ("--noconfirm", "--clean", "--upx-dir=")
+_SPEC_MARKER = "# py2exe-options: "
+
+
+def spec_path_for(options):
+    name = options.get('name') or DEFAULT_OPTIONS['name']
+    return Path(options.get('specpath') or ".") / f"{name}.spec"
+
+
+def split_spec_command(cmd, python=None):
+    """Split a ``build_command`` argv into ``(makespec_cmd, build_args)``."""
+    makespec_cmd, build_args = makespec_command(python), []
+    args = iter(cmd[len(pyinstaller_command(python)):])
+    for arg in args:
+        if arg in _BUILD_ONLY_OPTIONS:
+            build_args.extend([arg, next(args)])
+        elif arg.startswith(_BUILD_ONLY_FLAGS):
+            build_args.append(arg)
+        else:
+            makespec_cmd.append(arg)
+    return makespec_cmd, build_args
+
+
+def _spec_fingerprint(makespec_cmd):
+    return hashlib.sha256("\0".join(makespec_cmd).encode("utf-8")).hexdigest()[:16]
+
+
+def _read_spec_marker(spec_path):
+    try:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            first_line = f.readline()
+    except OSError:
+        return None
+    return first_line[len(_SPEC_MARKER):].strip() if first_line.startswith(_SPEC_MARKER) else ""
+
+
+def prepare_spec_build(cmd, options, on_output, cancel_event=None):
+    """Return the ``pyinstaller <name>.spec`` argv for ``cmd``, writing the spec if needed.
+
+    The spec is regenerated only when the options baked into it change. A spec
+    without Py2Exe's marker line is treated as hand-written and always reused.
+    Returns None if pyi-makespec fails.
+    """
+    makespec_cmd, build_args = split_spec_command(cmd, options.get('python'))
+    spec_path = spec_path_for(options)
+    fingerprint = _spec_fingerprint(makespec_cmd)
+    marker = _read_spec_marker(spec_path)
+
+    if marker == "":
+        on_output(f"[INFO] Building from hand-written spec file {spec_path}\n")
+    elif marker == fingerprint:
+        on_output(f"[INFO] Reusing spec file {spec_path}\n")
+    else:
+        on_output(f"[PROCESS] {'Regenerating' if marker else 'Generating'} spec file {spec_path}...\n")
+        if run_command(makespec_cmd, on_output, cancel_event) != 0:
+            on_output("[ERROR] pyi-makespec failed; see the output above\n")
+            return None
+        content = spec_path.read_text(encoding="utf-8")
+        spec_path.write_text(f"{_SPEC_MARKER}{fingerprint}\n{content}", encoding="utf-8")
+    return [*pyinstaller_command(options.get('python')), str(spec_path), *build_args]
+
+
+class OutputBatcher:
+    """Accumulate streamed text and hand it to ``on_output`` in whole-line chunks."""
+
+    def __init__(self, on_output, interval=FLUSH_INTERVAL, max_bytes=FLUSH_BYTES):
+        self.on_output = on_output
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self._parts = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def time_until_flush(self):
+        if not self._parts:
+            return None
+        return max(0.0, self.interval - (time.monotonic() - self._last_flush))
+
+    def write(self, text):
+        if not text:
+            return
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.max_bytes or self.time_until_flush() == 0.0:
+            self.flush()
+
+    def flush(self, final=False):
+        self._last_flush = time.monotonic()
+        if not self._parts:
+            return
+        text = "".join(self._parts)
+        cut = len(text) if final else text.rfind("\n") + 1
+        if cut == 0 and self._size < self.max_bytes:
+            # Only a partial line so far; wait for the rest of it.
+            self._parts = [text]
+            return
+        if cut == 0:
+            cut = len(text)
+        self.on_output(text[:cut])
+        rest = text[cut:]
+        self._parts = [rest] if rest else []
+        self._size = len(rest)
+
+
+def _read_chunks(stream, chunks):
+    fd = stream.fileno()
+    while True:
+        data = os.read(fd, _READ_SIZE)
+        chunks.put(data)
+        if not data:
+            break
+
+
+def _reap(process):
+    """Wait for ``process``; return its rusage (including its waited-for children) where available."""
+    if not hasattr(os, "wait4"):
+        process.wait()
+        return None
+    _, status, rusage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return rusage
+
+
+def run_command(cmd, on_output, cancel_event=None, timeline=None):
+    """Run ``cmd`` and stream its combined stdout/stderr to ``on_output``.
+
+    Output is batched (see OutputBatcher) so a chatty process costs one callback
+    per batch instead of one per line. Returns the process return code. Raises
+    FileNotFoundError if the executable cannot be found, and BuildCancelled,
+    after stopping the whole process tree, if ``cancel_event`` is set. The
+    output and resource usage are also passed to ``timeline`` (a BuildTimeline).
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+        **process_group_kwargs()
+    )
+    if timeline is not None:
+        timeline.process_started()
+
+    # A reader thread keeps the pipe drained while this thread applies the flush
+    # deadline, so a quiet process never leaves a batch stranded.
+    chunks = queue.Queue()
+    reader = threading.Thread(target=_read_chunks, args=(process.stdout, chunks), daemon=True)
+    reader.start()
+
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    batcher = OutputBatcher(on_output)
+    try:
+        while True:
+            timeout = batcher.time_until_flush()
+            try:
+                data = chunks.get(timeout=CANCEL_POLL_INTERVAL if timeout is None else min(timeout, CANCEL_POLL_INTERVAL))
+            except queue.Empty:
+                raise_if_cancelled(cancel_event)
+                if batcher.time_until_flush() == 0.0:
+                    batcher.flush()
+                continue
+            if not data:
+                break
+            text = decoder.decode(data).replace("\r\n", "\n")
+            batcher.write(text)
+            if timeline is not None:
+                timeline.feed(text)
+            raise_if_cancelled(cancel_event)
+    except BaseException:
+        # Cancelled or interrupted: never leave PyInstaller running on its own.
+        terminate_process_tree(process)
+        batcher.flush(final=True)
+        reader.join()
+        process.stdout.close()
+        raise
+
+    batcher.write(decoder.decode(b"", final=True))
+    batcher.flush(final=True)
+    reader.join()
+    process.stdout.close()
+    rusage = _reap(process)
+    if timeline is not None:
+        timeline.process_finished(rusage)
+    return process.returncode
+
+
+# PyInstaller's binary cache (the strip/UPX results and their index.dat) is not
+# safe for concurrent use, so builds that go through it run one at a time.
+_bincache_lock = threading.Lock()
+
+
+def uses_bincache(options):
+    """True when PyInstaller will strip or UPX-compress binaries through its shared cache."""
+    if sys.platform == "darwin" or options.get('strip'):
+        return True
+    if options.get('noupx') or uses_parallel_upx(options):
+        return False
+    return bool(options.get('upx_dir') or shutil.which("upx"))
+
+
+def run_pyinstaller(cmd, options, on_output, cancel_event=None, timeline=None):
+    """Run a PyInstaller argv, on the warm worker when 'warm_worker' is set; see run_command."""
+    if not uses_bincache(options):
+        return _run_pyinstaller(cmd, options, on_output, cancel_event, timeline)
+    if not _bincache_lock.acquire(blocking=False):
+        on_output("[INFO] Waiting for another strip/UPX build: PyInstaller's binary cache is not safe "
+                  "for concurrent builds\n")
+        while not _bincache_lock.acquire(timeout=CANCEL_POLL_INTERVAL):
+            raise_if_cancelled(cancel_event)
+    try:
+        return _run_pyinstaller(cmd, options, on_output, cancel_event, timeline)
+    finally:
+        _bincache_lock.release()
+
+
+def _run_pyinstaller(cmd, options, on_output, cancel_event=None, timeline=None):
+    if options.get('warm_worker'):
+        # Imported here: warm_worker imports this module.
+        from warm_worker import run_warm_command
+        returncode = run_warm_command(cmd, options.get('python'), on_output, cancel_event, timeline)
+        if returncode is not None:
+            return returncode
+    return run_command(cmd, on_output, cancel_event, timeline)
+
+
+def cache_key_for(cache, script_path, options):
+    # Output locations and --clean do not change the artifact, so they are left
+    # out of the key; a cached build can then be restored into any distpath. The
+    # spec directory only matters through the relative data and icon paths
+    # PyInstaller resolves against it, so the key holds those resolved instead.
+    spec_dir = options.get('specpath') or "."
+    key_options = dict(options, distpath=None, workpath=None, specpath=None, clean=False,
+                       add_data=[(os.path.abspath(os.path.join(spec_dir, source)), dest)
+                                 for source, dest in options.get('add_data') or []])
+    if options.get('icon'):
+        key_options['icon'] = os.path.abspath(os.path.join(spec_dir, options['icon']))
+    cmd, _ = build_command(script_path, key_options)
+    if options.get('reuse_spec') and _read_spec_marker(spec_path_for(options)) == "":
+        # A hand-written spec replaces the options as the description of the build.
+        cmd += [hashlib.sha256(spec_path_for(options).read_bytes()).hexdigest()]
+    if uses_parallel_upx(options):
+        # The argv alone cannot tell a parallel-UPX build from a --noupx one.
+        cmd += ["parallel-upx", *(options.get('upx_exclude') or [])]
+    return cache.compute_key(cmd, script_path, key_options)
+
+
+def _store_in_cache(cache, cache_key, options, on_output):
+    name = options.get('name') or DEFAULT_OPTIONS['name']
+    try:
+        if cache.store(cache_key, options.get('distpath'), name):
+            on_output(f"[INFO] Stored artifact in build cache ({cache_key[:12]})\n")
+    except OSError as e:
+        on_output(f"[WARNING] Could not store artifact in build cache: {e}\n")
+
+
+def _compress_with_upx(options, on_output, cancel_event=None):
+    try:
+        run_upx_stage(options, on_output, cancel_event)
+    except Exception as e:
+        on_output(f"[WARNING] Parallel UPX stage failed: {e}\n")
+
+
+def _preprocess_assets(options, on_output):
+    try:
+        return run_asset_pipeline(options, on_output)
+    except Exception as e:
+        on_output(f"[WARNING] Asset pipeline failed, bundling assets unprocessed: {e}\n")
+        return options
+
+
+def _report_size(options, on_output):
+    try:
+        report_build(options, on_output)
+    except Exception as e:
+        on_output(f"[WARNING] Could not generate the bundle size report: {e}\n")
+
+
+def _benchmark(options, on_output, cancel_event=None):
+    try:
+        benchmark_build(options, on_output, cancel_event=cancel_event)
+    except Exception as e:
+        on_output(f"[WARNING] Startup benchmark failed: {e}\n")
+
+
+def _report_timing(timeline, script_path, options, success, on_output):
+    if not options.get('phase_timing', True):
+        return
+    try:
+        report_timing(timeline, options.get('name') or DEFAULT_OPTIONS['name'], script_path, success, on_output)
+    except Exception as e:
+        on_output(f"[WARNING] Could not record the build timeline: {e}\n")
+
+
+def _record_history(timeline, script_path, options, outcome, warnings):
+    if not options.get('history', True):
+        return
+    name = options.get('name') or DEFAULT_OPTIONS['name']
+    record = timeline.record(name, script_path, outcome['status'] == "success")
+    # Only listed here; the history's writer thread measures their size.
+    artifact = artifact_paths(options.get('distpath'), name) if outcome['status'] == "success" else []
+    default_history().record({
+        'name': name,
+        'script': str(script_path),
+        'created': record['created'],
+        'status': outcome['status'],
+        'exit_code': outcome['returncode'],
+        'options_hash': options_hash(options),
+        'duration': record['wall_time'],
+        'cpu_time': record['cpu_time'],
+        'peak_rss': record['peak_rss'],
+        'artifact_paths': [str(path) for path in artifact],
+        'warnings': warnings,
+        'timings': {'stages': record['stages'], 'phases': record['phases']},
+    })
+
+
+def _remove_partial_output(options, started_at, work_started, on_output):
+    """Delete what a cancelled build left behind.
+
+    The work directory is removed only if PyInstaller (or the asset pipeline)
+    had started writing to it; dist entries and spec files only if they were
+    written during this build, so a previous good build is kept.
+    """
+    name = options.get('name') or DEFAULT_OPTIONS['name']
+    partial = []
+    if work_started:
+        partial.append(Path(options.get('workpath') or "build") / name)
+    partial.extend(path for path in artifact_paths(options.get('distpath'), name)
+                   if path.lstat().st_mtime >= started_at)
+    spec_path = spec_path_for(options)
+    if (options.get('reuse_spec') and spec_path.is_file() and spec_path.stat().st_mtime >= started_at
+            and _read_spec_marker(spec_path) == ""):
+        # An interrupted pyi-makespec; without the marker it would pass for a hand-written spec.
+        partial.append(spec_path)
+
+    for path in partial:
+        try:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path)
+            elif path.exists() or path.is_symlink():
+                path.unlink()
+            else:
+                continue
+            on_output(f"[INFO] Removed partial output: {path}\n")
+        except OSError as e:
+            on_output(f"[WARNING] Could not remove partial output {path}: {e}\n")
+
+
+def execute_build(script_path, options, on_output, cancel_event=None, outcome=None):
+    """Run a complete build, reporting progress through ``on_output``.
+
+    Returns ``(success, message)``. Never raises; failures are reported as
+    ``[ERROR]`` lines and a ``False`` result. Setting ``cancel_event`` (a
+    threading.Event) stops the build and its child processes within
+    CANCEL_POLL_INTERVAL and removes the partial output. Every build, whatever
+    its outcome, is recorded in the build history unless 'history' is off.
+    With 'agents' set the build runs on a remote build agent instead. If given,
+    the ``outcome`` dict receives the final 'status' and PyInstaller's 'returncode'.
+    """
+    timeline = BuildTimeline()
+    outcome = outcome if outcome is not None else {}
+    outcome.update(status="failed", returncode=None)
+    warnings = 0
+
+    def counting_output(text):
+        nonlocal warnings
+        warnings += len(_WARNING_LINE.findall(text))
+        on_output(text)
+
+    if options.get('agents'):
+        # Imported here: remote_build imports this module.
+        from remote_build import run_remote_build
+        success, message = run_remote_build(script_path, options, counting_output, cancel_event, timeline, outcome)
+    else:
+        success, message = _run_build(script_path, options, counting_output, cancel_event, timeline, outcome)
+    if success:
+        outcome['status'] = "success"
+    try:
+        _record_history(timeline, script_path, options, outcome, warnings)
+    except Exception as e:
+        on_output(f"[WARNING] Could not record the build in the history: {e}\n")
+    return success, message
+
+
+def _run_build(script_path, options, on_output, cancel_event, timeline, outcome):
+    started_at = time.time()
+    work_started = False
+    try:
+        on_output("[INFO] Starting PyInstaller build process...\n")
+
+        if options.get('validate', True):
+            timeline.begin_stage("validation")
+            if not validate_build(script_path, options, on_output):
+                return False, "Pre-build validation failed."
+        raise_if_cancelled(cancel_event)
+
+        timeline.begin_stage("asset rules")
+        options = resolve_assets(options, on_output)
+        incremental = None
+        if options.get('incremental'):
+            timeline.begin_stage("incremental check")
+            incremental = IncrementalBuild(script_path, options)
+            options = incremental.prepare(on_output)
+        raise_if_cancelled(cancel_event)
+        if options.get('asset_pipeline'):
+            timeline.begin_stage("asset pipeline")
+            work_started = True
+            options = _preprocess_assets(options, on_output)
+            raise_if_cancelled(cancel_event)
+
+        cmd, messages = build_command(script_path, options)
+        for message in messages:
+            on_output(message)
+
+        cache = cache_key = None
+        if options.get('use_cache'):
+            timeline.begin_stage("cache lookup")
+            cache = BuildCache(options.get('cache_dir'))
+            cache_key = cache_key_for(cache, script_path, options)
+            restored = cache.restore(cache_key, options.get('distpath'))
+            if restored:
+                on_output(f"[INFO] Build cache hit ({cache_key[:12]}): restored {len(restored)} item(s), PyInstaller skipped\n")
+                on_output(SEPARATOR)
+                if options.get('benchmark'):
+                    timeline.begin_stage("benchmark")
+                    _benchmark(options, on_output, cancel_event)
+                _report_timing(timeline, script_path, options, True, on_output)
+                on_output("[SUCCESS] Build restored from cache!\n")
+                return True, "Build restored from cache!"
+            on_output(f"[INFO] Build cache miss ({cache_key[:12]})\n")
+        raise_if_cancelled(cancel_event)
+
+        if options.get('reuse_spec'):
+            timeline.begin_stage("spec file")
+            cmd = prepare_spec_build(cmd, options, on_output, cancel_event)
+            if cmd is None:
+                return False, "Could not generate the spec file."
+
+        on_output(SEPARATOR)
+        on_output("[PROCESS] Executing PyInstaller...\n\n")
+
+        work_started = True
+        timeline.begin_stage("PyInstaller")
+        returncode = outcome['returncode'] = run_pyinstaller(cmd, options, on_output, cancel_event, timeline)
+        timeline.end_stage()
+
+        on_output(SEPARATOR)
+        if returncode == 0:
+            # The work directory is complete now, even if a later stage is cancelled.
+            work_started = False
+            if incremental is not None:
+                incremental.save()
+            if uses_parallel_upx(options):
+                timeline.begin_stage("UPX")
+                _compress_with_upx(options, on_output, cancel_event)
+            if options.get('size_report'):
+                timeline.begin_stage("size report")
+                _report_size(options, on_output)
+            raise_if_cancelled(cancel_event)
+            if cache is not None:
+                timeline.begin_stage("cache store")
+                _store_in_cache(cache, cache_key, options, on_output)
+            if options.get('benchmark'):
+                timeline.begin_stage("benchmark")
+                _benchmark(options, on_output, cancel_event)
+            _report_timing(timeline, script_path, options, True, on_output)
+            on_output("[SUCCESS] Build completed successfully!\n")
+            return True, "Build completed successfully!"
+        _report_timing(timeline, script_path, options, False, on_output)
+        on_output(f"[ERROR] Build failed with return code {returncode}\n")
+        return False, f"Build failed with return code {returncode}"
+
+    except (BuildCancelled, KeyboardInterrupt):
+        outcome['status'] = "cancelled"
+        elapsed = time.time() - started_at
+        on_output(SEPARATOR)
+        on_output(f"[WARNING] Build cancelled after {elapsed:.1f}s\n")
+        _remove_partial_output(options, started_at, work_started, on_output)
+        return False, f"Build cancelled after {elapsed:.1f}s."
+    except FileNotFoundError:
+        if options.get('python'):
+            on_output(f"[ERROR] Critical: Python interpreter not found: {options['python']}\n")
+            return False, "Python interpreter not found."
+        on_output("[ERROR] Critical: 'pyinstaller' command not found.\n"
+                  "[ERROR] Please ensure PyInstaller is installed and accessible in your system's PATH.\n"
+                  "[ERROR] Installation: pip install pyinstaller\n")
+        return False, "PyInstaller not found or not in PATH."
+    except Exception as e:
+        on_output(f"[ERROR] An unexpected error occurred: {str(e)}\n")
+        return False, str(e)
@@ -0,0 +1,197 @@
+import os
+import json
+import queue
+import atexit
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+from build_cache import tree_size
+
+# =================================================================================
+# Build history database (no Qt imports)
+#
+# Every build appends one row to a local SQLite database: duration, exit code,
+# artifact size, warning count, CPU time, peak RSS and the per-stage timings.
+# Rows are written by a background daemon thread so recording never delays a
+# build; the thread exits once it has been idle for a while, and the default
+# history is flushed at interpreter exit so queued rows are not lost. The writer
+# also sums the artifact's size, which means walking a onedir bundle. Queries
+# share one read connection, opened on first use, and the (name, created) index,
+# so trends over thousands of builds read only the rows they return.
+# =================================================================================
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "history.sqlite3")
+DEFAULT_TREND_BUILDS = 50
+# Seconds the writer thread waits for more rows before it exits.
+_WRITER_IDLE = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    script TEXT,
+    created REAL NOT NULL,
+    status TEXT NOT NULL,
+    exit_code INTEGER,
+    options_hash TEXT,
+    duration REAL,
+    cpu_time REAL,
+    peak_rss INTEGER,
+    artifact_size INTEGER,
+    warnings INTEGER,
+    timings TEXT
+);
+CREATE INDEX IF NOT EXISTS builds_name_created ON builds (name, created);
+CREATE INDEX IF NOT EXISTS builds_created ON builds (created);
+"""
+_COLUMNS = ('name', 'script', 'created', 'status', 'exit_code', 'options_hash', 'duration', 'cpu_time',
+            'peak_rss', 'artifact_size', 'warnings', 'timings')
+
+
+def options_hash(options):
+    """Return a short, stable hash of an options dict."""
+    text = json.dumps(options, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _connect(path, check_same_thread=True):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30, check_same_thread=check_same_thread)
+    # WAL lets the GUI read while a build's row is being written.
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def _artifact_size(paths):
+    try:
+        return sum(tree_size(path) for path in paths) or None
+    except OSError:
+        # Replaced or removed by a later build before the row was written.
+        return None
+
+
+def _entry_to_row(entry):
+    if entry.get('artifact_size') is None and entry.get('artifact_paths'):
+        entry = dict(entry, artifact_size=_artifact_size(entry['artifact_paths']))
+    timings = entry.get('timings')
+    return [json.dumps(timings) if column == 'timings' and timings else entry.get(column) for column in _COLUMNS]
+
+
+def _row_to_dict(cursor, row):
+    entry = {column[0]: value for column, value in zip(cursor.description, row)}
+    if 'timings' in entry:
+        entry['timings'] = json.loads(entry['timings']) if entry['timings'] else None
+    return entry
+
+
+class BuildHistory:
+    def __init__(self, path=None):
+        self.path = Path(path or DEFAULT_HISTORY_PATH)
+        self._pending = queue.Queue()
+        self._lock = threading.Lock()
+        self._writer = None
+        self._reader = None
+        self._reader_lock = threading.Lock()
+
+    def record(self, entry):
+        """Queue ``entry`` (a dict with the builds columns) for writing and return at once.
+
+        Instead of ``artifact_size``, the entry may list ``artifact_paths``; their
+        size is then measured on the writer thread.
+        """
+        self._pending.put(entry)
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_pending, name="build-history", daemon=True)
+                self._writer.start()
+
+    def _write_pending(self):
+        try:
+            connection = _connect(self.path)
+        except (sqlite3.Error, OSError):
+            # Queued rows are still consumed, so flush() never waits on a database that cannot open.
+            connection = None
+        try:
+            while True:
+                try:
+                    batch = [self._pending.get(timeout=_WRITER_IDLE)]
+                except queue.Empty:
+                    with self._lock:
+                        # Checked under the lock, so a concurrent record() either
+                        # finds its entry picked up here or starts a new writer.
+                        if self._pending.empty():
+                            self._writer = None
+                            return
+                    continue
+                # Whatever else is queued goes into the same transaction.
+                while True:
+                    try:
+                        batch.append(self._pending.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    if connection is None:
+                        continue
+                    rows = [_entry_to_row(entry) for entry in batch]
+                    with connection:
+                        connection.executemany(
+                            f"INSERT INTO builds ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                            rows)
+                except sqlite3.Error:
+                    # History is best effort; a locked or damaged database never fails a build.
+                    pass
+                finally:
+                    for _ in batch:
+                        self._pending.task_done()
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def flush(self):
+        """Wait until every queued entry has been written."""
+        self._pending.join()
+
+    def _query(self, sql, parameters=()):
+        if not self.path.is_file():
+            return []
+        with self._reader_lock:
+            if self._reader is None:
+                # Shared by the GUI's queries; the lock keeps them one at a time.
+                self._reader = _connect(self.path, check_same_thread=False)
+            cursor = self._reader.execute(sql, parameters)
+            return [_row_to_dict(cursor, row) for row in cursor.fetchall()]
+
+    def applications(self):
+        """Return the recorded application names, most recently built first."""
+        rows = self._query("SELECT name, MAX(created) AS last FROM builds GROUP BY name ORDER BY last DESC")
+        return [row['name'] for row in rows]
+
+    def recent(self, name, limit=DEFAULT_TREND_BUILDS):
+        """Return the last ``limit`` builds of ``name``, oldest first."""
+        rows = self._query(f"SELECT id, {', '.join(_COLUMNS)} FROM builds WHERE name = ? "
+                           "ORDER BY created DESC LIMIT ?", (name, limit))
+        return rows[::-1]
+
+    def trend(self, name, limit=DEFAULT_TREND_BUILDS):
+        """Return ``{'duration': [...], 'artifact_size': [...]}`` for the last successful builds of ``name``."""
+        rows = self._query("SELECT duration, artifact_size FROM builds WHERE name = ? AND status = 'success' "
+                           "ORDER BY created DESC LIMIT ?", (name, limit))[::-1]
+        return {'duration': [row['duration'] for row in rows],
+                'artifact_size': [row['artifact_size'] for row in rows]}
+
+
+_default_history = None
+_default_lock = threading.Lock()
+
+
+def default_history():
+    """Return the process-wide BuildHistory for DEFAULT_HISTORY_PATH."""
+    global _default_history
+    with _default_lock:
+        if _default_history is None:
+            _default_history = BuildHistory()
+            atexit.register(_default_history.flush)
+        return _default_history
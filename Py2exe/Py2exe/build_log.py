@@ -0,0 +1,79 @@
+import os
+from pathlib import Path
+
+# =================================================================================
+# Rotating on-disk build log (no Qt imports)
+#
+# The GUI log view only keeps the most recent lines; the complete output of every
+# build is streamed here so it can be opened or searched on demand.
+# =================================================================================
+
+DEFAULT_LOG_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "logs")
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+
+class RotatingLogFile:
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT):
+        self.path = Path(path or os.path.join(DEFAULT_LOG_DIR, "build.log"))
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file = None
+        self._size = 0
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8", errors="replace")
+        self._size = self._file.tell()
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backup_count > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._open()
+
+    def write(self, text):
+        if self._file is None:
+            self._open()
+        if self._size and self._size + len(text) > self.max_bytes:
+            self._rotate()
+        self._file.write(text)
+        self._size += len(text)
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def files(self):
+        """Return the existing log files, oldest first."""
+        backups = [self.path.with_name(f"{self.path.name}.{index}") for index in range(self.backup_count, 0, -1)]
+        return [path for path in backups + [self.path] if path.exists()]
+
+    def search(self, needle, max_results=5000):
+        """Return ``(file_name, line_number, line)`` for lines containing ``needle``.
+
+        Matching is case-insensitive and scans the files oldest first.
+        """
+        self.flush()
+        needle = needle.lower()
+        results = []
+        for path in self.files():
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                for line_number, line in enumerate(f, 1):
+                    if needle in line.lower():
+                        results.append((path.name, line_number, line.rstrip("\n")))
+                        if len(results) >= max_results:
+                            return results
+        return results
@@ -0,0 +1,125 @@
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from build_core import absolute_inputs, execute_build
+
+# =================================================================================
+# Build queue: runs many scripts/option sets on a bounded pool of PyInstaller
+# processes. Each job gets its own --workpath/--specpath so concurrent builds
+# never share PyInstaller's intermediate files; its input paths are made
+# absolute first, since PyInstaller resolves relative ones against the spec
+# directory. Jobs that would write the same artifact (same name and distpath)
+# are rejected. No Qt imports.
+# =================================================================================
+
+def default_concurrency():
+    # PyInstaller is largely single-threaded, but analysis is I/O heavy; half the
+    # cores keeps the machine responsive while still filling it up.
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+class BuildJob:
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    SUCCEEDED = "Succeeded"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+
+    def __init__(self, job_id, script_path, options):
+        self.job_id = job_id
+        self.script_path = script_path
+        self.options = dict(options)
+        self.status = BuildJob.QUEUED
+        self.message = ""
+        self.started_at = None
+        self.duration = None
+
+    @property
+    def name(self):
+        return self.options.get('name') or "MyApp"
+
+    @property
+    def artifact_key(self):
+        """The dist folder and name PyInstaller writes this job's artifact to."""
+        return os.path.abspath(self.options.get('distpath') or "dist"), self.name
+
+    @property
+    def finished(self):
+        return self.status in (BuildJob.SUCCEEDED, BuildJob.FAILED, BuildJob.CANCELLED)
+
+    def isolate_paths(self, base_dir):
+        """Give this job private work/spec directories below ``base_dir``."""
+        job_dir = f"job{self.job_id:03d}-{self.name}"
+        self.options['workpath'] = os.path.join(self.options.get('workpath') or base_dir, job_dir)
+        self.options['specpath'] = os.path.join(self.options.get('specpath') or base_dir, job_dir)
+
+
+class BuildQueue:
+    def __init__(self, max_workers=None, base_dir=None):
+        self.max_workers = max_workers or default_concurrency()
+        self.base_dir = base_dir or os.path.join(os.getcwd(), "build", "queue")
+        self.jobs = []
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+
+    def add(self, script_path, options):
+        """Queue a build; raises ValueError if a pending job writes the same artifact."""
+        job = BuildJob(len(self.jobs) + 1, *absolute_inputs(script_path, options))
+        for other in self.jobs:
+            if not other.finished and other.artifact_key == job.artifact_key:
+                raise ValueError(f"Build #{other.job_id} already writes {job.name} to {job.artifact_key[0]}; "
+                                 "change the name or the dist path")
+        job.isolate_paths(self.base_dir)
+        self.jobs.append(job)
+        return job
+
+    def progress(self):
+        """Return ``(finished, total)`` over all jobs."""
+        with self._lock:
+            return sum(1 for job in self.jobs if job.finished), len(self.jobs)
+
+    def cancel(self):
+        """Stop the running jobs and skip the ones that have not started."""
+        self._cancel_event.set()
+
+    def _run_job(self, job, on_output, on_finished):
+        if self._cancel_event.is_set():
+            with self._lock:
+                job.status = BuildJob.CANCELLED
+                job.message = "Cancelled before it started."
+                job.duration = 0.0
+            on_finished(job)
+            return False
+        with self._lock:
+            job.status = BuildJob.RUNNING
+            job.started_at = time.monotonic()
+
+        success, message = execute_build(job.script_path, job.options, lambda text: on_output(job, text),
+                                         self._cancel_event)
+
+        with self._lock:
+            if success:
+                job.status = BuildJob.SUCCEEDED
+            else:
+                job.status = BuildJob.CANCELLED if self._cancel_event.is_set() else BuildJob.FAILED
+            job.message = message
+            job.duration = time.monotonic() - job.started_at
+        on_finished(job)
+        return success
+
+    def run(self, on_output=None, on_finished=None):
+        """Run every queued job and block until all have finished.
+
+        ``on_output(job, text)`` and ``on_finished(job)`` are called from pool
+        threads. Returns True if every job succeeded.
+        """
+        on_output = on_output or (lambda job, text: None)
+        on_finished = on_finished or (lambda job: None)
+        pending = [job for job in self.jobs if job.status == BuildJob.QUEUED]
+        self._cancel_event.clear()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="py2exe-build") as pool:
+            results = list(pool.map(lambda job: self._run_job(job, on_output, on_finished), pending))
+        return all(results)
@@ -0,0 +1,213 @@
+import os
+import re
+import sys
+import json
+import time
+from pathlib import Path
+
+# =================================================================================
+# Build phase timing (no Qt imports)
+#
+# A BuildTimeline records Py2Exe's own stages (validation, spec generation, the
+# PyInstaller run, UPX, ...) and, while PyInstaller's output streams through
+# feed(), the PyInstaller phases recognised from its log lines. PyInstaller
+# prefixes every log line with the milliseconds since it started, so phase
+# boundaries are exact even though output arrives in batches. The longest gaps
+# between consecutive log lines are attributed to the line before them, which
+# is where a slow hook or collect-all shows up.
+#
+# After each build a text timeline is logged and one JSON record is appended to
+# ~/.cache/py2exe/timings/<name>.jsonl.
+# =================================================================================
+
+DEFAULT_TIMINGS_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "timings")
+SLOWEST_STEPS = 5
+TIMELINE_WIDTH = 40
+# Gaps shorter than this are never reported as slow steps.
+_MIN_STEP_SECONDS = 0.2
+
+# Each phase starts at the first log message matching its pattern and runs
+# until the next phase starts. Phases only move forward; a build may skip some
+# (a one-file build has no COLLECT).
+PYINSTALLER_PHASES = (
+    ("configure", re.compile(r"PyInstaller: ")),
+    ("module graph", re.compile(r"Initializing module dependency graph")),
+    ("analysis", re.compile(r"Analyzing (?!modules for base_library|hidden import|run-time hooks)")),
+    ("hooks & binaries", re.compile(r"Processing module hooks \(post-graph stage\)")),
+    ("PYZ", re.compile(r"checking PYZ")),
+    ("PKG", re.compile(r"checking PKG")),
+    ("EXE", re.compile(r"checking EXE")),
+    ("COLLECT", re.compile(r"checking COLLECT")),
+    ("BUNDLE", re.compile(r"checking BUNDLE")),
+)
+_LOG_LINE = re.compile(r"^(\d+) [A-Z_]+: (.*)")
+_BUILD_COMPLETE = "Build complete!"
+
+
+class BuildTimeline:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = []
+        self.phases = []
+        self.cpu_time = None
+        self.peak_rss = None
+        self._stage = None
+        self._process_start = None
+        self._phase_index = -1
+        self._last_step = None
+        self._steps = []
+        self._partial = ""
+
+    def _now(self):
+        return time.perf_counter() - self.started
+
+    def begin_stage(self, name):
+        """End the current Py2Exe stage and start ``name``."""
+        self.end_stage()
+        self._stage = (name, self._now())
+
+    def end_stage(self):
+        if self._stage is not None:
+            name, start = self._stage
+            self.stages.append({'name': name, 'start': start, 'duration': self._now() - start})
+            self._stage = None
+
+    def process_started(self):
+        self._process_start = self._now()
+        self._phase_index = -1
+        self._last_step = None
+        self._partial = ""
+        self._start_phase(0, "startup", self._process_start)
+
+    def feed(self, text):
+        """Consume streamed PyInstaller output."""
+        if self._process_start is None:
+            return
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._parse_line(line)
+
+    def _parse_line(self, line):
+        match = _LOG_LINE.match(line)
+        if not match:
+            return
+        at = self._process_start + int(match.group(1)) / 1000
+        message = match.group(2)
+        if self._last_step is not None:
+            step_at, step_message = self._last_step
+            if at - step_at >= _MIN_STEP_SECONDS:
+                self._steps.append({'line': step_message[:120], 'duration': at - step_at})
+        self._last_step = (at, message)
+
+        if message.startswith(_BUILD_COMPLETE):
+            self._close_phase(at)
+            return
+        for index in range(max(1, self._phase_index + 1), len(PYINSTALLER_PHASES) + 1):
+            name, pattern = PYINSTALLER_PHASES[index - 1]
+            if pattern.match(message):
+                self._start_phase(index, name, at)
+                break
+
+    def _start_phase(self, index, name, at):
+        self._close_phase(at)
+        self._phase_index = index
+        self.phases.append({'name': name, 'start': at, 'duration': None})
+
+    def _close_phase(self, at):
+        if self.phases and self.phases[-1]['duration'] is None:
+            self.phases[-1]['duration'] = max(0.0, at - self.phases[-1]['start'])
+
+    def process_finished(self, rusage=None):
+        """Close the PyInstaller phases and add the process tree's resource usage."""
+        if self._partial:
+            self._parse_line(self._partial)
+            self._partial = ""
+        self._close_phase(self._now())
+        if rusage is not None:
+            self.cpu_time = (self.cpu_time or 0.0) + rusage.ru_utime + rusage.ru_stime
+            # ru_maxrss is in KiB on Linux and bytes on macOS.
+            peak = rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+            self.peak_rss = max(self.peak_rss or 0, peak)
+
+    @property
+    def wall_time(self):
+        return self._now()
+
+    def slowest_steps(self, count=SLOWEST_STEPS):
+        return sorted(self._steps, key=lambda step: step['duration'], reverse=True)[:count]
+
+    def record(self, name, script_path, success):
+        self.end_stage()
+        return {
+            'name': name,
+            'script': str(script_path),
+            'created': time.time(),
+            'success': success,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'peak_rss': self.peak_rss,
+            'stages': self.stages,
+            'phases': self.phases,
+            'slowest_steps': self.slowest_steps(),
+        }
+
+
+def _bar(start, duration, total):
+    scale = TIMELINE_WIDTH / total if total > 0 else 0
+    offset = min(TIMELINE_WIDTH - 1, int(start * scale))
+    length = max(1, round(duration * scale))
+    return (" " * offset + "#" * length)[:TIMELINE_WIDTH].ljust(TIMELINE_WIDTH)
+
+
+def format_timeline(record, previous=None):
+    total = record['wall_time']
+    resources = []
+    if record['cpu_time'] is not None:
+        resources.append(f"{record['cpu_time']:.1f}s CPU")
+    if record['peak_rss'] is not None:
+        resources.append(f"peak RSS {record['peak_rss'] / 1024 / 1024:.1f} MiB")
+    change = ""
+    if previous:
+        delta = total - previous['wall_time']
+        change = f", {'+' if delta >= 0 else '-'}{abs(delta):.1f}s vs previous build"
+    lines = [f"[INFO] Build timeline: {total:.1f}s wall{''.join(', ' + item for item in resources)}{change}\n"]
+
+    rows = []
+    for stage in record['stages']:
+        rows.append((stage['name'], stage))
+        if stage['name'] == "PyInstaller":
+            rows.extend((f"  {phase['name']}", phase) for phase in record['phases'] if phase['duration'] is not None)
+    for label, entry in rows:
+        lines.append(f"    {label:<20} {entry['start']:>6.1f}s {entry['duration']:>6.1f}s "
+                     f"|{_bar(entry['start'], entry['duration'], total)}|\n")
+    if record['slowest_steps']:
+        lines.append("[INFO] Slowest PyInstaller steps (time until the next log line):\n")
+        lines.extend(f"    {step['duration']:>6.1f}s  {step['line']}\n" for step in record['slowest_steps'])
+    return lines
+
+
+def save_timing(record, timings_dir=None):
+    timings_dir = Path(timings_dir or DEFAULT_TIMINGS_DIR)
+    timings_dir.mkdir(parents=True, exist_ok=True)
+    with open(timings_dir / f"{record['name']}.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def load_timings(name, timings_dir=None, limit=10):
+    try:
+        with open(Path(timings_dir or DEFAULT_TIMINGS_DIR) / f"{name}.jsonl", "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return []
+    return records[-limit:]
+
+
+def report_timing(timeline, name, script_path, success, on_output, timings_dir=None):
+    """Log the timeline of a finished build and append its record."""
+    record = timeline.record(name, script_path, success)
+    previous = [entry for entry in load_timings(name, timings_dir) if entry['success']]
+    for line in format_timeline(record, previous[-1] if previous and success else None):
+        on_output(line)
+    save_timing(record, timings_dir)
+    return record
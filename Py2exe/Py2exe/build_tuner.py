@@ -0,0 +1,284 @@
+import os
+import re
+import sys
+import time
+import shlex
+import shutil
+import itertools
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from build_core import absolute_inputs, execute_build
+from build_cache import artifact_paths, tree_size
+from build_queue import default_concurrency
+from artifact_benchmark import benchmark, find_executable, DEFAULT_RUNS, DEFAULT_TIMEOUT
+from bundle_report import format_size
+from import_analyzer import ImportAnalyzer
+
+# =================================================================================
+# Build configuration auto-tuner (no Qt imports)
+#
+# Builds one script with every combination of onefile/onedir, strip, UPX and the
+# analyzer's suggested excludes, then scores each artifact by its size and the
+# warm launch time of the built executable, run with the benchmark's smoke-test
+# arguments. Candidates that fail to build or to launch are never suggested.
+#
+# Only the excludes change PyInstaller's Analysis; the other knobs only affect
+# PYZ/PKG/EXE/COLLECT. So one "seed" candidate per exclude set is built first,
+# and the others in its group start from a copy of its work directory, which
+# PyInstaller accepts as an up-to-date analysis. Each candidate has its own spec
+# directory, so the inputs are made absolute first; strip and UPX candidates
+# build one at a time (see build_core.run_pyinstaller). Launch times are
+# measured one candidate at a time after all builds have finished, so concurrent
+# builds do not skew them.
+# =================================================================================
+
+# Launch times closer than this fraction count as equal; run-to-run noise alone
+# must not make a much larger artifact look optimal.
+LAUNCH_TOLERANCE = 0.05
+
+# Candidate builds are scratch builds: they must not restore from the cache,
+# pollute the history, timing and size baselines of the real application or
+# leave the machine for a build agent (which could not share the work directory).
+_CANDIDATE_OVERRIDES = {
+    'clean': False,
+    'incremental': False,
+    'use_cache': False,
+    'reuse_spec': False,
+    'size_report': False,
+    'phase_timing': False,
+    'history': False,
+    'benchmark': False,
+    'agents': [],
+}
+
+
+def upx_available(options):
+    return bool(options.get('upx_dir') or shutil.which("upx"))
+
+
+def search_space(options, suggested_excludes=()):
+    """Return the option overrides to try, seeds (onedir, no strip, no UPX) first in each exclude group."""
+    base_excludes = list(options.get('exclude_modules') or [])
+    exclude_sets = [base_excludes]
+    extra = [name for name in suggested_excludes if name not in base_excludes]
+    if extra:
+        exclude_sets.append(base_excludes + extra)
+    # Stripping is not supported for Windows binaries.
+    strips = (False,) if sys.platform == "win32" else (False, True)
+    upx_choices = (True, False) if upx_available(options) else (True,)
+
+    space = []
+    for excludes in exclude_sets:
+        for one_file, strip, noupx in itertools.product((False, True), strips, upx_choices):
+            space.append({'one_file': one_file, 'strip': strip, 'noupx': noupx, 'exclude_modules': list(excludes)})
+    return space
+
+
+def candidate_label(overrides):
+    parts = ["onefile" if overrides['one_file'] else "onedir"]
+    if overrides['strip']:
+        parts.append("strip")
+    if not overrides['noupx']:
+        parts.append("UPX")
+    if overrides['exclude_modules']:
+        parts.append(f"{len(overrides['exclude_modules'])} excludes")
+    return " + ".join(parts)
+
+
+def _dominates(a, b):
+    tolerance = LAUNCH_TOLERANCE * b.launch_time
+    return (a.size <= b.size and a.launch_time <= b.launch_time + tolerance
+            and (a.size < b.size or a.launch_time < b.launch_time - tolerance))
+
+
+def pareto_front(candidates):
+    """Return the scored candidates no other candidate beats on both size and launch time, smallest first."""
+    scored = [c for c in candidates if c.size is not None and c.launch_time is not None]
+    front = [c for c in scored if not any(_dominates(other, c) for other in scored)]
+    return sorted(front, key=lambda c: (c.size, c.launch_time))
+
+
+class TuneCandidate:
+    QUEUED = "Queued"
+    BUILDING = "Building"
+    BUILT = "Built"
+    BENCHMARKING = "Benchmarking"
+    DONE = "Done"
+    FAILED = "Failed"
+    SKIPPED = "Skipped"
+    CANCELLED = "Cancelled"
+
+    def __init__(self, candidate_id, overrides, options, base_dir, seed=None):
+        self.candidate_id = candidate_id
+        self.overrides = overrides
+        self.label = candidate_label(overrides)
+        self.seed = seed
+        candidate_dir = Path(base_dir) / re.sub(r"[^a-z0-9]+", "-", self.label.lower())
+        self.options = dict(options, **_CANDIDATE_OVERRIDES, **overrides,
+                            distpath=str(candidate_dir / "dist"), workpath=str(candidate_dir / "work"),
+                            specpath=str(candidate_dir))
+        if overrides['noupx']:
+            self.options['parallel_upx'] = False
+        if seed is not None:
+            # The seed already checked the same inputs.
+            self.options['validate'] = False
+        self.status = TuneCandidate.QUEUED
+        self.message = ""
+        self.build_time = None
+        self.size = None
+        self.launch_time = None
+        self.peak_rss = None
+        self.pareto = False
+        self.built = threading.Event()
+
+    @property
+    def finished(self):
+        return self.status in (TuneCandidate.DONE, TuneCandidate.FAILED, TuneCandidate.SKIPPED,
+                               TuneCandidate.CANCELLED)
+
+
+class AutoTuner:
+    def __init__(self, script_path, options, suggested_excludes=None, max_workers=None, base_dir=None,
+                 runs=None):
+        self.script_path, self.options = absolute_inputs(script_path, options)
+        self.max_workers = max_workers or default_concurrency()
+        self.runs = runs or options.get('benchmark_runs') or DEFAULT_RUNS
+        name = options.get('name') or "MyApp"
+        # Kept between runs: an unchanged script re-tunes from PyInstaller's cached analysis.
+        self.base_dir = base_dir or str(Path(script_path).resolve().parent / "build" / "autotune" / name)
+        if suggested_excludes is None:
+            suggested_excludes = ImportAnalyzer().analyze(script_path)['exclude_modules']
+
+        self.candidates = []
+        seed = None
+        for overrides in search_space(self.options, suggested_excludes):
+            if seed is None or overrides['exclude_modules'] != seed.overrides['exclude_modules']:
+                seed = None
+            candidate = TuneCandidate(len(self.candidates) + 1, overrides, self.options, self.base_dir, seed)
+            seed = seed or candidate
+            self.candidates.append(candidate)
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+
+    def progress(self):
+        """Return ``(finished, total)`` over all candidates."""
+        with self._lock:
+            return sum(1 for c in self.candidates if c.finished), len(self.candidates)
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _set_status(self, candidate, status, message, on_update):
+        with self._lock:
+            candidate.status = status
+            if message is not None:
+                candidate.message = message
+        on_update(candidate)
+
+    def _build(self, candidate, on_output, on_update):
+        try:
+            seed = candidate.seed
+            if seed is not None:
+                seed.built.wait()
+                if seed.status != TuneCandidate.BUILT:
+                    if self._cancel_event.is_set():
+                        self._set_status(candidate, TuneCandidate.CANCELLED, "Cancelled before it started.",
+                                         on_update)
+                    else:
+                        self._set_status(candidate, TuneCandidate.SKIPPED,
+                                         f"Not built because '{seed.label}' failed.", on_update)
+                    return
+            if self._cancel_event.is_set():
+                self._set_status(candidate, TuneCandidate.CANCELLED, "Cancelled before it started.", on_update)
+                return
+
+            self._set_status(candidate, TuneCandidate.BUILDING, None, on_update)
+            shutil.rmtree(candidate.options['distpath'], ignore_errors=True)
+            if seed is not None:
+                shutil.rmtree(candidate.options['workpath'], ignore_errors=True)
+                shutil.copytree(seed.options['workpath'], candidate.options['workpath'], symlinks=True)
+            started = time.monotonic()
+            success, message = execute_build(self.script_path, candidate.options,
+                                             lambda text: on_output(candidate, text), self._cancel_event)
+            candidate.build_time = time.monotonic() - started
+            if success:
+                candidate.size = sum(tree_size(path) for path in
+                                     artifact_paths(candidate.options['distpath'], candidate.options.get('name')))
+                self._set_status(candidate, TuneCandidate.BUILT, message, on_update)
+            elif self._cancel_event.is_set():
+                self._set_status(candidate, TuneCandidate.CANCELLED, message, on_update)
+            else:
+                self._set_status(candidate, TuneCandidate.FAILED, message, on_update)
+        except OSError as e:
+            self._set_status(candidate, TuneCandidate.FAILED, str(e), on_update)
+        finally:
+            candidate.built.set()
+
+    def _benchmark(self, candidate, on_output, on_update):
+        options = candidate.options
+        executable = find_executable(options['distpath'], options.get('name') or "MyApp", options['one_file'])
+        if executable is None:
+            self._set_status(candidate, TuneCandidate.FAILED, "Built executable not found.", on_update)
+            return
+        self._set_status(candidate, TuneCandidate.BENCHMARKING, None, on_update)
+        args = shlex.split(options.get('benchmark_args') or "")
+        results = benchmark(executable, args, self.runs, options.get('benchmark_timeout') or DEFAULT_TIMEOUT,
+                            cold_runs=0, cancel_event=self._cancel_event)
+        if self._cancel_event.is_set():
+            self._set_status(candidate, TuneCandidate.CANCELLED, "Cancelled while benchmarking.", on_update)
+            return
+        if results['failures']:
+            run = next(r for r in results['warm'] if r['returncode'] != 0 or r['timed_out'])
+            reason = "timed out" if run['timed_out'] else f"exited with code {run['returncode']}"
+            on_output(candidate, f"[WARNING] {candidate.label}: smoke-test launch {reason}\n")
+            self._set_status(candidate, TuneCandidate.FAILED, f"Smoke-test launch {reason}.", on_update)
+            return
+        summary = results['warm_summary']
+        candidate.launch_time = summary['exit_time']['median']
+        candidate.peak_rss = summary['peak_rss'] and summary['peak_rss']['max']
+        self._set_status(candidate, TuneCandidate.DONE, None, on_update)
+
+    def run(self, on_output=None, on_update=None):
+        """Build and benchmark every candidate and return the Pareto front.
+
+        ``on_output(candidate, text)`` and ``on_update(candidate)`` are called
+        from worker threads. Blocks until all candidates have finished.
+        """
+        on_output = on_output or (lambda candidate, text: None)
+        on_update = on_update or (lambda candidate: None)
+        self._cancel_event.clear()
+        os.makedirs(self.base_dir, exist_ok=True)
+
+        # Seeds are queued first, so a candidate waiting on its seed never holds
+        # back a seed that has not started.
+        ordered = sorted(self.candidates, key=lambda c: c.seed is not None)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="py2exe-tune") as pool:
+            list(pool.map(lambda c: self._build(c, on_output, on_update), ordered))
+
+        for candidate in self.candidates:
+            if candidate.status == TuneCandidate.BUILT:
+                if self._cancel_event.is_set():
+                    self._set_status(candidate, TuneCandidate.CANCELLED, "Cancelled before benchmarking.",
+                                     on_update)
+                else:
+                    self._benchmark(candidate, on_output, on_update)
+
+        front = pareto_front(self.candidates)
+        for candidate in front:
+            candidate.pareto = True
+            on_update(candidate)
+        return front
+
+
+def format_candidates(candidates):
+    """Return log lines with one row per candidate; Pareto-optimal rows are marked with '*'."""
+    lines = [f"    {'':1} {'Configuration':<32} {'Size':>10} {'Launch':>9} {'Build':>7}  Status\n"]
+    for c in candidates:
+        size = format_size(c.size) if c.size is not None else ""
+        launch = f"{c.launch_time * 1000:.0f} ms" if c.launch_time is not None else ""
+        build = f"{c.build_time:.1f}s" if c.build_time is not None else ""
+        status = c.status + (f": {c.message}" if c.status in (TuneCandidate.FAILED, TuneCandidate.SKIPPED) else "")
+        lines.append(f"    {'*' if c.pareto else ' '} {c.label:<32} {size:>10} {launch:>9} {build:>7}  {status}\n")
+    return lines
@@ -0,0 +1,159 @@
+import os
+import sys
+import glob
+import json
+import time
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from upx_stage import upx_executable
+from python_env import pyinstaller_interpreter, environment_info
+
+# =================================================================================
+# Pre-build validation (no Qt imports)
+#
+# Checks every input PyInstaller would otherwise only trip over minutes into a
+# build: the interpreter, script, icon, UPX directory, asset sources and module
+# names. Path checks run on a thread pool while a single child process of the
+# target interpreter resolves all module names with importlib.util.find_spec.
+# =================================================================================
+
+MODULE_CHECK_TIMEOUT = 60
+# Asset sources are checked in batches so tens of thousands of rows do not
+# become tens of thousands of futures.
+_PATH_BATCH = 256
+# Problems beyond this many are summarised in one line.
+MAX_REPORTED = 25
+
+# Runs in the target interpreter with the script's folder on sys.path, as
+# PyInstaller's analysis does. Prints {name: error-or-null}.
+_FIND_SPEC_SCRIPT = """
+import sys, json, importlib.util
+sys.path.insert(0, sys.argv[1])
+results = {}
+for name in sys.argv[2:]:
+    try:
+        results[name] = None if importlib.util.find_spec(name) else "not found"
+    except BaseException as e:
+        results[name] = f"{type(e).__name__}: {e}"
+print(json.dumps(results))
+"""
+
+
+def check_modules(names, script_dir, python=None):
+    """Return ``{name: error}`` for every name that cannot be resolved."""
+    if not names:
+        return {}
+    try:
+        result = subprocess.run([python or sys.executable, "-c", _FIND_SPEC_SCRIPT, script_dir, *names],
+                                capture_output=True, text=True, timeout=MODULE_CHECK_TIMEOUT, cwd=script_dir)
+        resolved = json.loads(result.stdout.strip().splitlines()[-1])
+    except (OSError, subprocess.SubprocessError, ValueError, IndexError) as e:
+        raise RuntimeError(f"could not query the interpreter: {e}") from e
+    return {name: error for name, error in resolved.items() if error}
+
+
+def _source_exists(source):
+    # One match is enough; a glob does not need to be expanded in full.
+    return os.path.exists(source) or next(glob.iglob(source), None) is not None
+
+
+def _missing_sources(sources):
+    return [source for source in sources if not _source_exists(source)]
+
+
+def _check_interpreter(python):
+    try:
+        info = environment_info(python)
+    except (FileNotFoundError, RuntimeError) as e:
+        return str(e)
+    if not info['pyinstaller']:
+        return f"PyInstaller is not installed for {info['executable']}"
+    return None
+
+
+def _check_upx_dir(upx_dir):
+    if not os.path.isdir(upx_dir):
+        return f"UPX directory not found: {upx_dir}"
+    if not upx_executable(upx_dir).is_file():
+        return f"No {upx_executable(upx_dir).name} in UPX directory: {upx_dir}"
+    return None
+
+
+class BuildValidator:
+    def __init__(self, script_path, options, python=None, max_workers=None):
+        self.script_path = script_path
+        self.options = options
+        if python is None:
+            # The interpreter PyInstaller will run under, not ours; a missing
+            # one is reported by _check_interpreter.
+            try:
+                python = pyinstaller_interpreter(options.get('python'))
+            except FileNotFoundError:
+                python = None
+        self.python = python
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.errors = []
+        self.warnings = []
+
+    def run(self):
+        """Run all checks concurrently; return True when nothing blocks the build."""
+        options = self.options
+        script_dir = str(Path(self.script_path).resolve().parent)
+        required = list(dict.fromkeys((options.get('hidden_imports') or []) + (options.get('collect_all') or [])))
+        excluded = [name for name in options.get('exclude_modules') or [] if name not in required]
+        sources = list(dict.fromkeys(source for source, _ in options.get('add_data') or []))
+        batches = [sources[i:i + _PATH_BATCH] for i in range(0, len(sources), _PATH_BATCH)]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            modules = pool.submit(check_modules, required + excluded, script_dir, self.python)
+            missing_sources = [pool.submit(_missing_sources, batch) for batch in batches]
+            upx = pool.submit(_check_upx_dir, options['upx_dir']) if options.get('upx_dir') else None
+            interpreter = pool.submit(_check_interpreter, options['python']) if options.get('python') else None
+
+            if not os.path.isfile(self.script_path):
+                self.errors.append(f"Script not found: {self.script_path}")
+            if options.get('icon') and not os.path.isfile(options['icon']):
+                self.errors.append(f"Icon file not found: {options['icon']}")
+            for rule in options.get('asset_rules') or []:
+                if not os.path.isdir(rule.get('source') or ""):
+                    self.errors.append(f"Asset rule folder not found: {rule.get('source')}")
+
+            for future in missing_sources:
+                self.errors.extend(f"Asset source not found: {source}" for source in future.result())
+            for check in (interpreter, upx):
+                if check is not None and check.result():
+                    self.errors.append(check.result())
+            try:
+                unresolved = modules.result()
+            except RuntimeError as e:
+                self.warnings.append(f"Module names not checked: {e}")
+                unresolved = {}
+
+        for name in required:
+            if name in unresolved:
+                self.errors.append(f"Module '{name}' cannot be imported by the build interpreter ({unresolved[name]})")
+        for name in excluded:
+            if name in unresolved:
+                self.warnings.append(f"Excluded module '{name}' does not exist; the exclude has no effect")
+        return not self.errors
+
+
+def validate_build(script_path, options, on_output, python=None):
+    """Validate the build inputs, log the result and return True if the build may start."""
+    started = time.perf_counter()
+    validator = BuildValidator(script_path, options, python)
+    valid = validator.run()
+    for warning in validator.warnings:
+        on_output(f"[WARNING] {warning}\n")
+    for error in validator.errors[:MAX_REPORTED]:
+        on_output(f"[ERROR] {error}\n")
+    if len(validator.errors) > MAX_REPORTED:
+        on_output(f"[ERROR] ... and {len(validator.errors) - MAX_REPORTED} more\n")
+    elapsed = time.perf_counter() - started
+    if valid:
+        on_output(f"[INFO] Pre-build validation passed in {elapsed:.1f}s\n")
+    else:
+        on_output(f"[ERROR] Pre-build validation failed: {len(validator.errors)} problem(s) found in {elapsed:.1f}s\n")
+    return valid
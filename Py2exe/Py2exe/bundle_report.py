@@ -0,0 +1,204 @@
+import os
+import re
+import ast
+import json
+import time
+from pathlib import Path
+
+from build_cache import artifact_paths, tree_size
+
+# =================================================================================
+# Bundle size report (no Qt imports)
+#
+# Reads the TOC files PyInstaller leaves in its work directory to break the
+# bundle down by package, list the largest binaries and data files, and diff the
+# result against the previous build of the same application. Sizes are
+# uncompressed payload sizes, which is what a onefile executable unpacks at
+# startup.
+# =================================================================================
+
+DEFAULT_REPORT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "reports")
+DEFAULT_TOP_N = 10
+
+# A build is flagged when the bundle grows by more than both of these, or any
+# single package grows by more than PACKAGE_REGRESSION_BYTES.
+TOTAL_REGRESSION_RATIO = 0.05
+TOTAL_REGRESSION_BYTES = 512 * 1024
+PACKAGE_REGRESSION_BYTES = 1024 * 1024
+
+_BINARY_TYPES = ("BINARY", "EXTENSION")
+_PYTHON_TYPES = ("PYMODULE", "PYSOURCE")
+_STDLIB_PATTERN = re.compile(r"[\\/](?:lib|Lib)[\\/](?:python\d+(?:\.\d+)?[\\/])?")
+
+
+def read_toc(path):
+    """Return the longest ``(dest, source, typecode)`` list found in a TOC file."""
+    try:
+        data = ast.literal_eval(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError, SyntaxError):
+        return []
+    candidates = [item for item in (data if isinstance(data, tuple) else (data,)) if isinstance(item, list)]
+    entries = [item for item in candidates if item and all(isinstance(e, tuple) and len(e) == 3 for e in item)]
+    return max(entries, key=len) if entries else []
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _is_stdlib(source):
+    return ("site-packages" not in source and "dist-packages" not in source
+            and _STDLIB_PATTERN.search(source) is not None)
+
+
+def _package_of(dest, typecode, source):
+    if typecode in _PYTHON_TYPES:
+        if dest.startswith(("pyimod", "pyiboot", "pyi_rth")) or "localpycs" in Path(source).parts:
+            return "pyinstaller-bootstrap"
+        return "python-stdlib" if _is_stdlib(source) else dest.split(".")[0]
+    parts = Path(dest).parts
+    if len(parts) == 1:
+        return "python-runtime" if dest.startswith(("libpython", "python3")) else "system-libraries"
+    if re.match(r"python\d", parts[0]) or parts[0] in ("lib-dynload", "base_library.zip"):
+        return "python-stdlib"
+    return parts[0]
+
+
+def collect_entries(work_dir):
+    """Return ``(dest, package, typecode, size)`` for everything in the bundle."""
+    work_dir = Path(work_dir)
+    contents = {}
+    for toc_name in ("PKG-00.toc", "COLLECT-00.toc"):
+        for dest, source, typecode in read_toc(work_dir / toc_name):
+            if typecode in ("OPTION", "EXECUTABLE", "DEPENDENCY"):
+                continue
+            contents[dest] = (source, typecode)
+
+    entries = []
+    pyz_entry = contents.pop("PYZ-00.pyz", None)
+    if pyz_entry:
+        # PYZ members are compressed bytecode; spread the real archive size over
+        # its modules in proportion to their source size.
+        modules = [(dest, source, _file_size(source)) for dest, source, typecode in read_toc(work_dir / "PYZ-00.toc")]
+        source_total = sum(size for _, _, size in modules) or 1
+        pyz_size = _file_size(pyz_entry[0])
+        for dest, source, size in modules:
+            entries.append((dest, _package_of(dest, "PYMODULE", source), "PYMODULE", size * pyz_size // source_total))
+
+    for dest, (source, typecode) in contents.items():
+        entries.append((dest, _package_of(dest, typecode, source), typecode, _file_size(source)))
+    return entries
+
+
+def count_warnings(work_dir, name):
+    try:
+        with open(Path(work_dir) / f"warn-{name}.txt", "r", encoding="utf-8", errors="replace") as f:
+            return sum(1 for line in f if line.startswith("missing module"))
+    except OSError:
+        return 0
+
+
+def build_report(work_dir, name, distpath=None, top_n=DEFAULT_TOP_N):
+    entries = collect_entries(work_dir)
+    packages = {}
+    for _, package, _, size in entries:
+        packages[package] = packages.get(package, 0) + size
+
+    def largest(typecodes):
+        matching = [(dest, size) for dest, _, typecode, size in entries if typecode in typecodes]
+        return sorted(matching, key=lambda item: item[1], reverse=True)[:top_n]
+
+    return {
+        'name': name,
+        'created': time.time(),
+        'total_size': sum(packages.values()),
+        'artifact_size': sum(tree_size(path) for path in artifact_paths(distpath, name)),
+        'file_count': len(entries),
+        'packages': dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)),
+        'largest_binaries': largest(_BINARY_TYPES),
+        'largest_data': largest(("DATA", "ZIPFILE")),
+        'missing_modules': count_warnings(work_dir, name),
+    }
+
+
+def load_previous(name, report_dir=None):
+    try:
+        with open(Path(report_dir or DEFAULT_REPORT_DIR) / f"{name}.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_report(report, report_dir=None):
+    report_dir = Path(report_dir or DEFAULT_REPORT_DIR)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    with open(report_dir / f"{report['name']}.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+
+
+def find_regressions(report, previous):
+    if not previous:
+        return []
+    regressions = []
+    growth = report['total_size'] - previous['total_size']
+    if growth > TOTAL_REGRESSION_BYTES and growth > previous['total_size'] * TOTAL_REGRESSION_RATIO:
+        regressions.append(f"bundle grew by {format_size(growth)} "
+                           f"({growth / max(previous['total_size'], 1):+.1%})")
+    for package, size in report['packages'].items():
+        package_growth = size - previous['packages'].get(package, 0)
+        if package_growth > PACKAGE_REGRESSION_BYTES:
+            label = "new package" if package not in previous['packages'] else "package"
+            regressions.append(f"{label} '{package}' grew by {format_size(package_growth)}")
+    return regressions
+
+
+def format_size(size):
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GiB"
+
+
+def format_report(report, previous=None, top_n=DEFAULT_TOP_N):
+    lines = [f"[INFO] Bundle size report for '{report['name']}': {format_size(report['total_size'])} payload "
+             f"in {report['file_count']} files, artifact {format_size(report['artifact_size'])}\n"]
+    if previous:
+        delta = report['total_size'] - previous['total_size']
+        lines.append(f"[INFO] Change since previous build: {'+' if delta >= 0 else '-'}{format_size(abs(delta))}\n")
+
+    lines.append("[INFO] Largest packages:\n")
+    for package, size in list(report['packages'].items())[:top_n]:
+        change = ""
+        if previous:
+            package_delta = size - previous['packages'].get(package, 0)
+            if package_delta:
+                change = f"  ({'+' if package_delta > 0 else '-'}{format_size(abs(package_delta))})"
+        lines.append(f"    {format_size(size):>10}  {package}{change}\n")
+    for title, key in (("Largest binaries", 'largest_binaries'), ("Largest data files", 'largest_data')):
+        if report[key]:
+            lines.append(f"[INFO] {title}:\n")
+            lines.extend(f"    {format_size(size):>10}  {dest}\n" for dest, size in report[key])
+    if report['missing_modules']:
+        lines.append(f"[INFO] {report['missing_modules']} missing module(s) listed in warn-{report['name']}.txt\n")
+    for regression in find_regressions(report, previous):
+        lines.append(f"[WARNING] Bundle size regression: {regression}\n")
+    return lines
+
+
+def report_build(options, on_output, report_dir=None):
+    """Generate, print and store the size report for a finished build."""
+    name = options.get('name') or "MyApp"
+    work_dir = Path(options.get('workpath') or "build") / name
+    if not (work_dir / "PKG-00.toc").is_file():
+        on_output(f"[WARNING] No PyInstaller TOC files found in {work_dir}; size report skipped\n")
+        return None
+    report = build_report(work_dir, name, options.get('distpath'))
+    previous = load_previous(name, report_dir)
+    for line in format_report(report, previous):
+        on_output(line)
+    save_report(report, report_dir)
+    return report
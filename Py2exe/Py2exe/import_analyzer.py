@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import threading
+from pathlib import Path
+
+from script_graph import scan_source, walk_local_modules
+from python_env import available_modules
+
+# =================================================================================
+# Static import analyzer (no Qt imports)
+#
+# Walks a script and its local imports to suggest PackagesTab entries:
+#   - hidden imports for importlib.import_module()/__import__() calls,
+#   - collect-all for packages whose submodules are chosen at runtime,
+#   - excludes for heavy modules the project never imports (packaging tools
+#     only when no third-party package could import them instead).
+# Given an introspected target environment (see python_env), suggestions are
+# limited to modules that environment actually has, and imports it lacks are
+# reported as missing, without importing anything into this process.
+# Per-file parse results are cached by (mtime, size) so re-analysis after an
+# edit only re-parses the files that changed.
+# =================================================================================
+
+# Large modules PyInstaller may bundle via hooks or stdlib dependencies even
+# though applications rarely use them.
+HEAVY_EXCLUDE_CANDIDATES = (
+    "tkinter", "turtle", "turtledemo", "idlelib", "lib2to3", "pydoc_data",
+    "test", "ensurepip", "venv", "distutils", "setuptools", "pip",
+    "IPython", "jedi", "parso",
+)
+
+# Packaging tools that third-party packages import themselves (pkg_resources,
+# for one, is part of setuptools); only suggested for projects that import
+# nothing outside the standard library.
+PACKAGING_MODULES = ("distutils", "setuptools", "pip")
+
+# Third-party packages that ship their own test suites as importable packages.
+TEST_SUITE_PACKAGES = ("numpy", "scipy", "pandas", "matplotlib", "sklearn", "skimage", "PIL", "networkx")
+
+
+class ImportAnalyzer:
+    def __init__(self):
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+
+    def scan(self, file_path):
+        """scan_source() with a per-file cache keyed on mtime and size."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return scan_source(file_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._cache.get(file_path)
+        if cached and cached[0] == stamp:
+            self._hits += 1
+            return cached[1]
+        info = scan_source(file_path)
+        with self._lock:
+            self._cache[file_path] = (stamp, info)
+        return info
+
+    def analyze(self, script_path, environment=None):
+        """Return suggested ``hidden_imports``, ``collect_all`` and ``exclude_modules``.
+
+        The result also reports ``missing`` (top-level imports ``environment``
+        lacks), ``modules_scanned``, ``cache_hits`` and ``elapsed``.
+        """
+        start = time.perf_counter()
+        self._hits = 0
+        root_dir = Path(script_path).resolve().parent
+
+        imported = set()
+        dynamic_imports = set()
+        dynamic_prefixes = set()
+        local_modules = set()
+        scanned = 0
+        for file_path, info in walk_local_modules(script_path, self.scan):
+            scanned += 1
+            local_modules.add(_module_name(file_path, root_dir))
+            imported.update(module for module, level in info['imports'] if not level and module)
+            dynamic_imports.update(info['dynamic_imports'])
+            dynamic_prefixes.update(info['dynamic_prefixes'])
+
+        hidden_imports = set(dynamic_imports)
+        collect_all = set()
+        for prefix in dynamic_prefixes:
+            package_dir = root_dir.joinpath(*prefix.split("."))
+            if package_dir.is_dir():
+                # A local plugin package: list its modules explicitly.
+                hidden_imports.update(_package_modules(package_dir, prefix))
+            else:
+                collect_all.add(prefix.split(".")[0])
+
+        top_level = {name.split(".")[0] for name in imported | dynamic_imports | dynamic_prefixes}
+        stdlib = set(environment['stdlib'] if environment is not None else getattr(sys, "stdlib_module_names", ()))
+        local_top_level = {name.split(".")[0] for name in local_modules}
+        third_party = top_level - stdlib - local_top_level - set(sys.builtin_module_names)
+        exclude_modules = [name for name in HEAVY_EXCLUDE_CANDIDATES if name not in top_level
+                           and not (third_party and name in PACKAGING_MODULES)]
+        exclude_modules.extend(f"{name}.tests" for name in TEST_SUITE_PACKAGES if name in top_level)
+
+        missing = []
+        if environment is not None:
+            available = available_modules(environment)
+            missing = sorted(name for name in top_level if name not in available
+                             and not (root_dir / name).is_dir() and not (root_dir / f"{name}.py").is_file())
+            # Suggesting a module the environment lacks would only fail or do nothing;
+            # it is listed as missing instead.
+            exclude_modules = [name for name in exclude_modules if name.split(".")[0] in available]
+            collect_all = {name for name in collect_all if name in available}
+            hidden_imports = {name for name in hidden_imports if name.split(".")[0] not in missing}
+
+        return {
+            'hidden_imports': sorted(hidden_imports - local_modules - imported),
+            'collect_all': sorted(collect_all),
+            'exclude_modules': exclude_modules,
+            'missing': missing,
+            'modules_scanned': scanned,
+            'cache_hits': self._hits,
+            'elapsed': time.perf_counter() - start,
+        }
+
+
+def _module_name(file_path, root_dir):
+    try:
+        parts = list(Path(file_path).relative_to(root_dir).with_suffix("").parts)
+    except ValueError:
+        # A symlinked module that resolves outside the script folder.
+        path = Path(file_path)
+        parts = [path.parent.name if path.stem == "__init__" else path.stem]
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _package_modules(package_dir, prefix):
+    modules = []
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = [d for d in dirs if d != "__pycache__" and not d.startswith(".")]
+        relative = Path(root).relative_to(package_dir).parts
+        for file_name in files:
+            if not file_name.endswith(".py"):
+                continue
+            stem = file_name[:-3]
+            parts = [prefix, *relative] + ([] if stem == "__init__" else [stem])
+            modules.append(".".join(parts))
+    return modules
@@ -0,0 +1,416 @@
+import os
+import re
+import sys
+import json
+import time
+import shlex
+import hashlib
+import zipfile
+import tempfile
+import sysconfig
+import subprocess
+from pathlib import Path
+
+from bundle_report import collect_entries, read_toc, format_size
+from script_graph import scan_source, local_module_files, path_under_root
+from import_analyzer import HEAVY_EXCLUDE_CANDIDATES
+from incremental_build import default_workpath
+from python_env import pyinstaller_interpreter
+from process_tree import CANCEL_POLL_INTERVAL, process_group_kwargs, raise_if_cancelled, terminate_process_tree
+
+# =================================================================================
+# Runtime import tracing (no Qt imports)
+#
+# Runs the script with the smoke-test arguments in a child interpreter whose
+# first sys.meta_path entry records every module name the program imports, then
+# compares the trace with the modules PyInstaller's last build of the same
+# options bundled. Every bundled subtree the trace never touched becomes a
+# proposed exclude, ranked by how confident we are that it is not needed:
+#
+#   high    test suites, known heavy modules, and code only imported by other
+#           modules that are proposed for exclusion too
+#   medium  imported by a module that stays bundled: one the trace loaded (on a
+#           path the smoke test did not reach, typically an import inside a
+#           function) or one in base_library.zip, which is never excluded
+#   low     imported by the project's own code
+#
+# Modules PyInstaller's bootstrap and runtime hooks import, and everything they
+# import in turn, only run in the frozen program and are always kept.
+#
+# Traces are saved per script and reused until a file in the script's local
+# import tree, the interpreter or the smoke-test arguments change.
+# =================================================================================
+
+DEFAULT_TRACE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "traces")
+DEFAULT_TRACE_TIMEOUT = 30.0
+CONFIDENCE_LEVELS = ("high", "medium", "low")
+
+_TEST_PARTS = {"test", "tests", "testing", "_test", "_tests", "conftest"}
+_BOOTSTRAP_PREFIXES = ("pyimod", "pyiboot", "pyi_rth", "_pyi")
+_EXTENSION_SUFFIX = re.compile(r"\.(?:cpython-[^.]+\.|abi3\.|cp\d+-[^.]+\.)?(?:so|pyd)$")
+_OUTPUT_TAIL_LINES = 10
+
+# Runs inside the traced interpreter; argv is [trace_file, script, *args]. The
+# modules already loaded when the hook is installed, including runpy's own
+# imports, are recorded as used so nothing the script shares with the tracer is
+# ever proposed.
+_TRACER = """
+import os
+import sys
+import runpy
+
+_trace = open(sys.argv[1], "w", encoding="utf-8", buffering=1)
+_trace.write("\\n".join(sys.modules) + "\\n")
+
+
+class _ImportRecorder:
+    @staticmethod
+    def find_spec(name, path=None, target=None):
+        _trace.write(name + "\\n")
+        return None
+
+
+sys.meta_path.insert(0, _ImportRecorder)
+sys.argv = sys.argv[2:]
+sys.path[0] = os.path.dirname(os.path.abspath(sys.argv[0]))
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+
+def trace_key(script_path, interpreter, args):
+    """Hash the script's local import tree, the interpreter and the smoke-test arguments."""
+    digest = hashlib.sha256(json.dumps([interpreter, list(args)]).encode("utf-8"))
+    root = Path(script_path).resolve().parent
+    for path in local_module_files(script_path):
+        digest.update(path_under_root(path, root).as_posix().encode("utf-8"))
+        try:
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def _trace_path(script_path, trace_dir):
+    name = hashlib.sha256(str(Path(script_path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(trace_dir or DEFAULT_TRACE_DIR) / f"{Path(script_path).stem}-{name}.json"
+
+
+def load_trace(script_path, key, trace_dir=None):
+    try:
+        with open(_trace_path(script_path, trace_dir), "r", encoding="utf-8") as f:
+            trace = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return trace if trace.get('key') == key else None
+
+
+def save_trace(script_path, trace, trace_dir=None):
+    path = _trace_path(script_path, trace_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trace, f)
+
+
+def run_trace(script_path, args=(), timeout=DEFAULT_TRACE_TIMEOUT, interpreter=None, cancel_event=None):
+    """Run the script under the import recorder and return the trace dict.
+
+    Hitting the timeout is not an error: the program is stopped and the imports
+    recorded until then are kept, which suits GUI and server programs.
+    """
+    script = Path(script_path).resolve()
+    interpreter = interpreter or sys.executable
+    with tempfile.TemporaryDirectory(prefix="py2exe-trace-") as temp_dir:
+        trace_file = os.path.join(temp_dir, "modules.txt")
+        output_file = os.path.join(temp_dir, "output.txt")
+        started = time.monotonic()
+        timed_out = False
+        with open(output_file, "wb") as output:
+            process = subprocess.Popen([interpreter, "-c", _TRACER, trace_file, str(script), *args],
+                                       cwd=script.parent, stdin=subprocess.DEVNULL, stdout=output,
+                                       stderr=subprocess.STDOUT, **process_group_kwargs())
+            try:
+                while True:
+                    try:
+                        process.wait(timeout=CANCEL_POLL_INTERVAL)
+                        break
+                    except subprocess.TimeoutExpired:
+                        raise_if_cancelled(cancel_event)
+                        if time.monotonic() - started > timeout:
+                            timed_out = True
+                            terminate_process_tree(process)
+                            break
+            except BaseException:
+                terminate_process_tree(process)
+                raise
+        try:
+            with open(trace_file, "r", encoding="utf-8") as f:
+                modules = sorted({line.strip() for line in f if line.strip()})
+        except OSError:
+            modules = []
+        with open(output_file, "r", encoding="utf-8", errors="replace") as f:
+            output_tail = f.read().splitlines()[-_OUTPUT_TAIL_LINES:]
+    return {
+        'script': str(script),
+        'interpreter': interpreter,
+        'args': list(args),
+        'created': time.time(),
+        'duration': time.monotonic() - started,
+        'returncode': None if timed_out else process.returncode,
+        'timed_out': timed_out,
+        'output_tail': output_tail,
+        'modules': modules,
+    }
+
+
+def _extension_module(dest):
+    """Return the module name of an extension's bundle path, or None for other binaries."""
+    parts = Path(dest).parts
+    if not parts or not _EXTENSION_SUFFIX.search(parts[-1]):
+        return None
+    # Standard library extensions live in lib-dynload (or at the top level on Windows).
+    parts = [part for part in parts[:-1] if part != "lib-dynload" and not re.match(r"python\d", part)]
+    return ".".join(parts + [_EXTENSION_SUFFIX.sub("", Path(dest).name)])
+
+
+def bundled_modules(work_dir):
+    """Return ``{module: (size, source)}`` for the Python modules and extensions of a build."""
+    modules = {}
+    for dest, _, typecode, size in collect_entries(work_dir):
+        if typecode == "PYMODULE" and not dest.startswith(_BOOTSTRAP_PREFIXES):
+            modules[dest] = [size, None]
+        elif typecode == "EXTENSION":
+            name = _extension_module(dest)
+            if name:
+                modules[name] = [size, None]
+    for dest, source, _ in read_toc(Path(work_dir) / "PYZ-00.toc"):
+        if dest in modules:
+            modules[dest][1] = source
+    return {name: tuple(value) for name, value in modules.items()}
+
+
+def _absolute_imports(module, source):
+    """Return the absolute names a module's source imports."""
+    package = module if Path(source).name == "__init__.py" else module.rpartition(".")[0]
+    names = set()
+    for name, level in scan_source(source)['imports']:
+        if level:
+            base = package.split(".")
+            base = base[:len(base) - (level - 1)] if level > 1 else base
+            name = ".".join(part for part in (*base, name) if part)
+        if name:
+            names.add(name)
+    return names
+
+
+def _base_library_modules(work_dir):
+    """Return the modules of the build's base_library.zip, which PyInstaller always bundles."""
+    try:
+        with zipfile.ZipFile(Path(work_dir) / "base_library.zip") as archive:
+            names = archive.namelist()
+    except (OSError, zipfile.BadZipFile):
+        return set()
+    modules = set()
+    for name in names:
+        if name.endswith(".pyc"):
+            parts = name[:-len(".pyc")].split("/")
+            modules.add(".".join(parts[:-1] if parts[-1] == "__init__" else parts))
+    return modules
+
+
+def _module_imports(name, bundled, cache):
+    """Return what a bundled (or base_library.zip) module imports; sources are parsed once per ``cache``."""
+    if name not in cache:
+        source = bundled.get(name, (None, None))[1] or _stdlib_source(name)
+        cache[name] = _absolute_imports(name, source) if source and source.endswith(".py") else set()
+    return cache[name]
+
+
+def _importers(modules, bundled, cache):
+    """Return ``{imported name: {importing module}}`` over the sources of ``modules``."""
+    importers = {}
+    for name in modules:
+        for imported in _module_imports(name, bundled, cache):
+            importers.setdefault(imported, set()).add(name)
+    return importers
+
+
+def _startup_imports(work_dir):
+    """Modules PyInstaller's bootstrap and runtime hooks import before the script runs."""
+    entries = [entry for toc_name in ("PKG-00.toc", "COLLECT-00.toc")
+               for entry in read_toc(Path(work_dir) / toc_name) if entry[0].startswith(_BOOTSTRAP_PREFIXES)]
+    sources = {dest: source for dest, source, typecode in entries if typecode == "PYSOURCE"}
+    # The pyimod* modules are bundled as .pyc; their sources sit next to pyiboot01_bootstrap.py.
+    loader_dirs = [Path(source).parent for dest, source in sources.items() if dest.startswith("pyiboot")]
+    for dest, _, typecode in entries:
+        for loader_dir in loader_dirs:
+            if typecode == "PYMODULE" and (loader_dir / f"{dest}.py").is_file():
+                sources[dest] = str(loader_dir / f"{dest}.py")
+    imports = set()
+    for dest, source in sources.items():
+        imports |= _absolute_imports(dest, source)
+    return imports
+
+
+def _stdlib_source(name):
+    """Return the source of a pure-Python standard library module, or None."""
+    path = Path(sysconfig.get_paths()['stdlib']).joinpath(*name.split("."))
+    for candidate in (path / "__init__.py", path.with_name(path.name + ".py")):
+        if candidate.is_file():
+            return str(candidate)
+    return None
+
+
+def _import_closure(names, bundled, cache):
+    """Return ``names`` plus every bundled module their sources import, transitively.
+
+    Modules PyInstaller keeps in base_library.zip are not in the TOCs, so their
+    imports are read from this interpreter's standard library instead.
+    """
+    seen = set()
+    pending = list(names)
+    while pending:
+        # Importing a.b.c also runs a and a.b.
+        for prefix in _prefixes(pending.pop()):
+            if prefix in seen:
+                continue
+            seen.add(prefix)
+            pending.extend(_module_imports(prefix, bundled, cache))
+    return seen
+
+
+def _prefixes(name):
+    parts = name.split(".")
+    return [".".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+def _references(names, root):
+    return sorted(name for name in names if name == root or name.startswith(root + "."))
+
+
+def propose_excludes(trace_modules, bundled, script_path, work_dir=None, current_excludes=()):
+    """Return proposed exclude entries, most confident and largest first.
+
+    Each entry is a dict with ``module``, ``confidence``, ``size`` (bundled
+    bytes saved), ``modules`` (bundled modules removed) and ``reason``.
+    """
+    used = set(trace_modules)
+    cache = {}
+    base_library = set()
+    if work_dir is not None:
+        # Never traced, because they only run in the frozen program.
+        used |= _import_closure(_startup_imports(work_dir), bundled, cache)
+        base_library = _base_library_modules(work_dir)
+    used_prefixes = {prefix for name in used for prefix in _prefixes(name)}
+
+    # Group every untraced bundled module under its shortest untraced ancestor.
+    groups = {}
+    for name in bundled:
+        root = next((prefix for prefix in _prefixes(name) if prefix not in used_prefixes), None)
+        if root is not None:
+            groups.setdefault(root, []).append(name)
+
+    project_imports = set()
+    for path, info in ((path, scan_source(path)) for path in local_module_files(script_path)):
+        project_imports.update(module for module, level in info['imports'] if not level and module)
+        project_imports.update(info['dynamic_imports'])
+    removed = {name for members in groups.values() for name in members} - base_library
+    # Only the importers that stay bundled matter.
+    importers = _importers((set(bundled) | base_library) - removed, bundled, cache)
+
+    proposals = []
+    for root, members in groups.items():
+        if any(root == exclude or root.startswith(exclude + ".") for exclude in current_excludes):
+            continue
+        parts = root.split(".")
+        from_project = _references(project_imports, root)
+        # Importers outside every proposed group stay bundled and may still import this one.
+        kept = sorted(importer for imported in _references(importers, root) for importer in importers[imported]
+                      if importer not in removed)
+        if from_project:
+            confidence, reason = "low", f"imported by the project ({from_project[0]}) but not loaded by the smoke test"
+        elif kept:
+            importer = next((name for name in kept if name in used), kept[0])
+            if importer in used:
+                reason = f"imported by {importer} on a path the smoke test did not reach"
+            else:
+                reason = f"imported by {importer}, which stays bundled"
+            confidence = "medium"
+        elif _TEST_PARTS.intersection(parts):
+            confidence, reason = "high", "test suite"
+        elif parts[0] in HEAVY_EXCLUDE_CANDIDATES:
+            confidence, reason = "high", "rarely needed at runtime and never loaded"
+        else:
+            confidence, reason = "high", "only imported by modules that are proposed for exclusion too"
+        proposals.append({
+            'module': root,
+            'confidence': confidence,
+            'size': sum(bundled[name][0] for name in members),
+            'modules': len(members),
+            'reason': reason,
+        })
+    proposals.sort(key=lambda p: (CONFIDENCE_LEVELS.index(p['confidence']), -p['size'], p['module']))
+    return proposals
+
+
+def analysis_dir(script_path, options):
+    """Return the work directory of the last build of ``options``."""
+    workpath = options.get('workpath') or (default_workpath(script_path) if options.get('incremental') else "build")
+    return Path(workpath) / (options.get('name') or "MyApp")
+
+
+def format_proposals(proposals):
+    lines = [f"    {'Confidence':<10} {'Saves':>10} {'Modules':>7}  Exclude\n"]
+    for p in proposals:
+        lines.append(f"    {p['confidence']:<10} {format_size(p['size']):>10} {p['modules']:>7}  "
+                     f"{p['module']}  ({p['reason']})\n")
+    return lines
+
+
+def trace_build(script_path, options, on_output, cancel_event=None, refresh=False, trace_dir=None):
+    """Trace the script (or reuse its saved trace) and propose excludes against the last build.
+
+    Returns the proposals, or None when there is no analysis to compare with or
+    the smoke test failed. Raises BuildCancelled if ``cancel_event`` is set.
+    """
+    work_dir = analysis_dir(script_path, options)
+    if not (work_dir / "PYZ-00.toc").is_file():
+        on_output(f"[ERROR] No PyInstaller analysis found in {work_dir}; build the script once, "
+                  "then trace it\n")
+        return None
+    try:
+        interpreter = pyinstaller_interpreter(options.get('python'))
+    except FileNotFoundError as e:
+        on_output(f"[ERROR] {e}\n" if options.get('python') else "[ERROR] pyinstaller not found on PATH\n")
+        return None
+
+    args = shlex.split(options.get('benchmark_args') or "")
+    key = trace_key(script_path, interpreter, args)
+    trace = None if refresh else load_trace(script_path, key, trace_dir)
+    if trace is not None:
+        created = time.strftime('%Y-%m-%d %H:%M', time.localtime(trace['created']))
+        on_output(f"[INFO] Reusing the import trace from {created}; the script tree has not changed\n")
+    else:
+        timeout = options.get('benchmark_timeout') or DEFAULT_TRACE_TIMEOUT
+        on_output(f"[PROCESS] Tracing imports of {Path(script_path).name} {' '.join(args)} "
+                  f"(timeout {timeout:.0f}s)...\n")
+        trace = run_trace(script_path, args, timeout, interpreter, cancel_event)
+        if trace['timed_out']:
+            on_output(f"[INFO] Stopped the script after {timeout:.0f}s; imports recorded until then are used\n")
+        elif trace['returncode'] != 0:
+            on_output(f"[ERROR] The smoke test exited with code {trace['returncode']}, so the trace is "
+                      "incomplete:\n")
+            for line in trace['output_tail']:
+                on_output(f"    {line}\n")
+            return None
+        trace['key'] = key
+        save_trace(script_path, trace, trace_dir)
+    on_output(f"[INFO] {len(trace['modules'])} module(s) imported at runtime\n")
+
+    bundled = bundled_modules(work_dir)
+    proposals = propose_excludes(trace['modules'], bundled, script_path, work_dir, options.get('exclude_modules') or [])
+    saved = sum(p['size'] for p in proposals)
+    on_output(f"[INFO] {len(bundled)} module(s) bundled by the last build; {len(proposals)} exclude(s) proposed, "
+              f"{format_size(saved)} in total\n")
+    for line in format_proposals(proposals):
+        on_output(line)
+    return proposals
@@ -0,0 +1,144 @@
+import os
+import json
+import hashlib
+from pathlib import Path
+
+from build_cache import toolchain_version
+from script_graph import local_module_files
+from asset_rules import source_paths
+
+# =================================================================================
+# Incremental rebuilds (no Qt imports)
+#
+# Pins the PyInstaller work directory next to the script and records the build
+# inputs after every successful build. The next build reports what changed and
+# passes --clean only when a change invalidates PyInstaller's own caches; source
+# and asset edits are left to PyInstaller's work-directory reuse.
+# =================================================================================
+
+STATE_FILE = "py2exe-inputs.json"
+
+# Options whose change can leave stale modules, hooks or binaries behind in the
+# work directory and PyInstaller's binary cache.
+CLEAN_OPTIONS = ('hidden_imports', 'collect_all', 'exclude_modules')
+
+# Options that only affect where output goes or what runs after PyInstaller.
+_IGNORED_OPTIONS = ('clean', 'distpath', 'workpath', 'use_cache', 'cache_dir', 'size_report', 'incremental',
+                    'benchmark', 'benchmark_runs', 'benchmark_args', 'benchmark_timeout', 'benchmark_drop_caches',
+                    'validate', 'phase_timing', 'history', 'agents', 'warm_worker')
+
+
+def _hash_json(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _file_digest(path, previous):
+    """Return ``[mtime_ns, size, sha256]``, reusing the previous hash if the file is untouched."""
+    stat = path.stat()
+    if previous and previous[:2] == [stat.st_mtime_ns, stat.st_size]:
+        return previous
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return [stat.st_mtime_ns, stat.st_size, digest.hexdigest()]
+
+
+def _asset_files(add_data):
+    for source, dest in add_data:
+        for path in map(Path, source_paths(source)):
+            if path.is_dir():
+                for root, _, files in os.walk(path):
+                    for file_name in files:
+                        yield Path(root) / file_name
+            elif path.is_file():
+                yield path
+
+
+def default_workpath(script_path):
+    return str(Path(script_path).resolve().parent / "build")
+
+
+class IncrementalBuild:
+    def __init__(self, script_path, options):
+        self.script_path = script_path
+        self.options = dict(options)
+        if not self.options.get('workpath'):
+            self.options['workpath'] = default_workpath(script_path)
+        name = self.options.get('name') or "MyApp"
+        self.state_path = Path(self.options['workpath']) / name / STATE_FILE
+        self.state = None
+
+    def _load_previous(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _collect_state(self, previous):
+        previous_files = previous.get('files', {}) if previous else {}
+        files = {}
+        for path in local_module_files(self.script_path):
+            files[str(path)] = _file_digest(path, previous_files.get(str(path)))
+        previous_assets = previous.get('assets', {}) if previous else {}
+        assets = {}
+        for path in _asset_files(self.options.get('add_data') or []):
+            assets[str(path)] = _file_digest(path, previous_assets.get(str(path)))
+
+        return {
+            'toolchain': toolchain_version(self.options.get('python')),
+            'clean_options': _hash_json({key: self.options.get(key) for key in CLEAN_OPTIONS}),
+            'options': _hash_json({key: value for key, value in self.options.items() if key not in _IGNORED_OPTIONS}),
+            'files': files,
+            'assets': assets,
+        }
+
+    def prepare(self, on_output):
+        """Decide whether this build needs --clean and return the options to build with."""
+        previous = self._load_previous()
+        self.state = self._collect_state(previous)
+        on_output(f"[CONFIG] Incremental build, work path: {self.options['workpath']}\n")
+
+        if previous is None:
+            clean, reasons = True, ["no previous incremental build"]
+        else:
+            reasons = []
+            if previous.get('toolchain') != self.state['toolchain']:
+                reasons.append("interpreter or PyInstaller changed")
+            if previous.get('clean_options') != self.state['clean_options']:
+                reasons.append(f"{'/'.join(CLEAN_OPTIONS)} changed")
+            clean = bool(reasons)
+            self._report_changes(previous, on_output)
+
+        if clean:
+            on_output(f"[INFO] Incremental: clean build ({'; '.join(reasons)})\n")
+        else:
+            on_output("[INFO] Incremental: reusing the work directory\n")
+            if self.options.get('clean'):
+                on_output("[INFO] Incremental: 'Clean Build' ignored; the work directory is still valid\n")
+        self.options['clean'] = clean
+        return self.options
+
+    def _report_changes(self, previous, on_output):
+        for label, key in (("source", 'files'), ("asset", 'assets')):
+            old, new = previous.get(key, {}), self.state[key]
+            changed = [path for path, digest in new.items() if path not in old or old[path][2] != digest[2]]
+            removed = [path for path in old if path not in new]
+            if changed or removed:
+                names = ", ".join(Path(path).name for path in (changed + removed)[:5])
+                more = "..." if len(changed) + len(removed) > 5 else ""
+                on_output(f"[INFO] Incremental: {len(changed)} {label} file(s) changed, "
+                          f"{len(removed)} removed ({names}{more})\n")
+            else:
+                on_output(f"[INFO] Incremental: {label} files unchanged\n")
+        if previous.get('options') != self.state['options']:
+            on_output("[INFO] Incremental: build options changed\n")
+
+    def save(self):
+        """Record the inputs of a successful build."""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,81 @@
+import os
+import sys
+import signal
+import subprocess
+
+# =================================================================================
+# Cancellable child processes (no Qt imports)
+#
+# Build tools are started in their own process group (a new session on POSIX, a
+# new process group on Windows) so that cancelling a build also stops whatever
+# they started themselves, such as PyInstaller's isolated analysis workers.
+# Cancellation is requested through a threading.Event that long-running steps
+# poll at least every CANCEL_POLL_INTERVAL seconds.
+# =================================================================================
+
+CANCEL_POLL_INTERVAL = 0.1
+# Time a process group gets to exit after SIGTERM before it is killed.
+TERMINATE_GRACE = 0.5
+
+
+class BuildCancelled(BaseException):
+    """Raised when a build is cancelled.
+
+    Derives from BaseException, like KeyboardInterrupt, so the ``except
+    Exception`` guards around optional build stages do not swallow it.
+    """
+
+
+def raise_if_cancelled(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        raise BuildCancelled()
+
+
+def process_group_kwargs():
+    """Popen keyword arguments that start the child in its own process group."""
+    if sys.platform == "win32":
+        return {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {'start_new_session': True}
+
+
+def terminate_process_tree(process):
+    """Stop ``process`` and every process in its group; returns once it has exited."""
+    if process.poll() is not None:
+        return
+    if sys.platform == "win32":
+        # taskkill /T walks the child tree, which Windows process groups do not cover.
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        process.wait()
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=TERMINATE_GRACE)
+    except subprocess.TimeoutExpired:
+        pass
+    except ProcessLookupError:
+        return
+    try:
+        # Children that ignored SIGTERM or outlived the leader.
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    process.wait()
+
+
+def run_cancellable(cmd, cancel_event=None):
+    """Run ``cmd`` with its output discarded and return its exit code.
+
+    Raises BuildCancelled, after stopping the process tree, if ``cancel_event``
+    is set while it runs.
+    """
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **process_group_kwargs())
+    try:
+        while True:
+            try:
+                return process.wait(timeout=CANCEL_POLL_INTERVAL)
+            except subprocess.TimeoutExpired:
+                raise_if_cancelled(cancel_event)
+    except BaseException:
+        terminate_process_tree(process)
+        raise
@@ -0,0 +1,84 @@
+import os
+import json
+from pathlib import Path
+
+from build_core import DEFAULT_OPTIONS
+
+# =================================================================================
+# Project files (no Qt imports)
+#
+# A project file is a flat JSON object holding the script path and every option
+# key, so it doubles as an `--options` file for the CLI. Paths inside the project
+# directory are stored relative to the project file so a project can be moved or
+# checked into version control. Assets are stored as [source, dest] pairs.
+# =================================================================================
+
+PROJECT_SUFFIX = ".p2e"
+PROJECT_VERSION = 1
+PROJECT_FILTER = f"Py2Exe Projects (*{PROJECT_SUFFIX});;JSON Files (*.json)"
+_PATH_OPTIONS = ('script', 'python', 'icon', 'distpath', 'workpath', 'specpath', 'upx_dir')
+
+
+def _relative_to(path, base_dir):
+    if not path:
+        return path
+    try:
+        relative = os.path.relpath(os.path.abspath(path), base_dir)
+    except ValueError:  # different drive on Windows
+        return path
+    return path if relative.startswith("..") else Path(relative).as_posix()
+
+
+def _absolute_from(path, base_dir):
+    if not path or os.path.isabs(path):
+        return path
+    return os.path.normpath(os.path.join(base_dir, path))
+
+
+def save_project(project_path, script_path, options):
+    """Write ``script_path`` and ``options`` to ``project_path``."""
+    base_dir = os.path.dirname(os.path.abspath(project_path))
+    project = {'py2exe_project': PROJECT_VERSION}
+    project.update((key, options[key]) for key in DEFAULT_OPTIONS if key in options)
+    project['script'] = script_path
+    for key in _PATH_OPTIONS:
+        project[key] = _relative_to(project.get(key), base_dir)
+    project['add_data'] = [[_relative_to(source, base_dir), dest] for source, dest in options.get('add_data') or []]
+    project['asset_rules'] = [dict(rule, source=_relative_to(rule['source'], base_dir))
+                              for rule in options.get('asset_rules') or []]
+
+    tmp_path = f"{project_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(project, f, separators=(",", ":"))
+    os.replace(tmp_path, project_path)
+
+
+def load_project(project_path):
+    """Return ``(script_path, options)`` from a project file, with all paths absolute."""
+    with open(project_path, "r", encoding="utf-8") as f:
+        project = json.load(f)
+    if not isinstance(project, dict):
+        raise ValueError(f"{project_path} is not a Py2Exe project file")
+    if project.get('py2exe_project', PROJECT_VERSION) > PROJECT_VERSION:
+        raise ValueError(f"{project_path} was saved by a newer version of Py2Exe")
+
+    base_dir = os.path.dirname(os.path.abspath(project_path))
+    options = dict(DEFAULT_OPTIONS)
+    options.update((key, value) for key, value in project.items() if key in DEFAULT_OPTIONS)
+    for key in _PATH_OPTIONS:
+        if key in options:
+            options[key] = _absolute_from(options[key], base_dir)
+    options['add_data'] = [(_absolute_from(source, base_dir), dest) for source, dest in options.get('add_data') or []]
+    options['asset_rules'] = [dict(rule, source=_absolute_from(rule['source'], base_dir))
+                              for rule in options.get('asset_rules') or []]
+    return _absolute_from(project.get('script'), base_dir), options
+
+
+def load_options_file(path):
+    """Load an `--options` file: a project file, an options dict or a list of dicts."""
+    with open(path, "r", encoding="utf-8") as f:
+        loaded = json.load(f)
+    if isinstance(loaded, dict) and 'py2exe_project' in loaded:
+        script_path, options = load_project(path)
+        return [dict(options, script=script_path)]
+    return loaded if isinstance(loaded, list) else [loaded]
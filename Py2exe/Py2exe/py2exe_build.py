@@ -0,0 +1,324 @@
+import os
+import sys
+import time
+import threading
+import argparse
+from pathlib import Path
+
+from build_core import DEFAULT_OPTIONS, build_command, execute_build
+from build_queue import BuildQueue, default_concurrency
+from build_tuner import AutoTuner, TuneCandidate, format_candidates
+from import_trace import trace_build
+from process_tree import BuildCancelled
+from warm_worker import shutdown_workers
+from project_file import load_options_file, save_project
+from asset_rules import make_rule, resolve_assets
+from asset_pipeline import TRANSFORMS as ASSET_TRANSFORMS
+
+# =================================================================================
+# Headless CLI entry point (py2exe-build)
+#
+# Usage:
+#   python py2exe_build.py app.py --name App --hidden-import pkg.mod
+#   python py2exe_build.py app.py --options project.json
+#   python py2exe_build.py --options app.p2e --reuse-spec
+#   python py2exe_build.py tool_a.py tool_b.py tool_c.py --jobs 4
+#   python py2exe_build.py tool_a.py tool_b.py tool_c.py --warm-worker
+#   python py2exe_build.py app.py --agent buildbox1:8765 --agent buildbox2:8765
+#   python py2exe_build.py app.py --autotune --benchmark-args "--version"
+#   python py2exe_build.py app.py --trace-imports --benchmark-args "--version"
+#
+# Never imports PySide6, so it is suitable for display-less build agents.
+# =================================================================================
+
+def _parse_add_data(value):
+    separator = os.pathsep if os.pathsep in value else ":"
+    source, sep, dest = value.rpartition(separator)
+    if not (sep and source and dest):
+        raise argparse.ArgumentTypeError(f"expected SOURCE{os.pathsep}DEST, got '{value}'")
+    return [source, dest]
+
+
+def _parse_asset_rule(value):
+    return make_rule(*_parse_add_data(value))
+
+
+def create_parser():
+    parser = argparse.ArgumentParser(
+        prog="py2exe-build",
+        description="Build a Python script with PyInstaller using Py2Exe options, without the GUI."
+    )
+    parser.add_argument("scripts", nargs="*", metavar="script",
+                        help="Python script(s) to package (overrides 'script' in --options)")
+    parser.add_argument("--options", metavar="FILE",
+                        help="JSON file with an options dict (same keys as the GUI tabs' get_options()), "
+                             "or a list of such dicts to queue several builds")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help=f"Concurrent PyInstaller processes when building several scripts "
+                             f"(default: {default_concurrency()})")
+    parser.add_argument("-n", "--name", help="Application name")
+    parser.add_argument("--python", help="Interpreter or virtualenv folder to run PyInstaller from "
+                                          "(default: pyinstaller on PATH)")
+    parser.add_argument("--agent", dest="agents", action="append", metavar="HOST:PORT",
+                        help="Build agent to run the build on (repeatable; the least-loaded free agent is used)")
+    parser.add_argument("--icon", help="Icon file (.ico)")
+    parser.add_argument("--distpath", help="Distribution (output) directory")
+    parser.add_argument("--workpath", help="Build (work) directory")
+    parser.add_argument("--specpath", help="Spec file directory")
+
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--onefile", dest="one_file", action="store_true", default=None, help="One-file executable")
+    mode.add_argument("--onedir", dest="one_file", action="store_false", help="One-directory bundle")
+
+    parser.add_argument("--windowed", action="store_true", default=None, help="Windowed (no console)")
+    parser.add_argument("--clean", action="store_true", default=None, help="Clean PyInstaller cache before building")
+    parser.add_argument("--strip", action="store_true", default=None, help="Strip binaries")
+    parser.add_argument("--upx-dir", dest="upx_dir", help="UPX directory")
+    parser.add_argument("--noupx", action="store_true", default=None, help="Disable UPX")
+    parser.add_argument("--parallel-upx", dest="parallel_upx", action="store_true", default=None,
+                        help="Compress a one-directory bundle with concurrent, cached UPX runs after PyInstaller")
+    parser.add_argument("--upx-exclude", dest="upx_exclude", action="append", metavar="PATTERN",
+                        help="Binary name/glob never to compress with the parallel UPX stage")
+    parser.add_argument("--hidden-import", dest="hidden_imports", action="append", metavar="MODULE")
+    parser.add_argument("--collect-all", dest="collect_all", action="append", metavar="PACKAGE")
+    parser.add_argument("--exclude-module", dest="exclude_modules", action="append", metavar="MODULE")
+    parser.add_argument("--add-data", dest="add_data", action="append", type=_parse_add_data, metavar="SOURCE:DEST")
+    parser.add_argument("--asset-rule", dest="asset_rules", action="append", type=_parse_asset_rule,
+                        metavar="FOLDER:DEST",
+                        help="Bundle a folder tree, skipping junk like __pycache__ and .git; expanded at build "
+                             "time (include/exclude/max_size/follow_symlinks can be set in --options)")
+    parser.add_argument("--asset-pipeline", dest="asset_pipeline", action="store_true", default=None,
+                        help="Minify, optimize and deduplicate assets into a staging directory before bundling")
+    parser.add_argument("--asset-transform", dest="asset_transforms", action="append", choices=ASSET_TRANSFORMS,
+                        help="Asset pipeline transform to run (repeatable; default: all)")
+    parser.add_argument("--cache", dest="use_cache", action="store_true", default=None,
+                        help="Reuse a cached artifact when all build inputs are unchanged")
+    parser.add_argument("--incremental", action="store_true", default=None,
+                        help="Keep a per-script work directory and only clean it when hidden imports, "
+                             "collect-all, excludes or the toolchain change")
+    parser.add_argument("--warm-worker", dest="warm_worker", action="store_true", default=None,
+                        help="Run PyInstaller as forks of a worker that keeps it imported; saves its start-up "
+                             "on every build after the first (POSIX only)")
+    parser.add_argument("--reuse-spec", dest="reuse_spec", action="store_true", default=None,
+                        help="Generate <name>.spec once and build from it while the options are unchanged")
+    parser.add_argument("--cache-dir", dest="cache_dir", help="Build cache directory")
+    parser.add_argument("--no-size-report", dest="size_report", action="store_false", default=None,
+                        help="Skip the bundle size report after a successful build")
+    parser.add_argument("--no-validate", dest="validate", action="store_false", default=None,
+                        help="Skip the pre-build check of paths and module names")
+    parser.add_argument("--no-timing", dest="phase_timing", action="store_false", default=None,
+                        help="Skip the per-phase build timeline")
+    parser.add_argument("--no-history", dest="history", action="store_false", default=None,
+                        help="Do not record this build in the build history database")
+    parser.add_argument("--benchmark", action="store_true", default=None,
+                        help="Measure the startup time of the built executable")
+    parser.add_argument("--benchmark-runs", dest="benchmark_runs", type=int, help="Warm benchmark runs")
+    parser.add_argument("--benchmark-args", dest="benchmark_args", metavar="ARGS",
+                        help="Smoke-test arguments passed to the executable when benchmarking")
+    parser.add_argument("--benchmark-timeout", dest="benchmark_timeout", type=float, metavar="SECONDS",
+                        help="Per-run benchmark timeout")
+    parser.add_argument("--benchmark-drop-caches", dest="benchmark_drop_caches", action="store_true", default=None,
+                        help="Evict the whole machine's page cache before the cold benchmark run (Linux, root only)")
+    parser.add_argument("--autotune", action="store_true",
+                        help="Build every onefile/onedir, strip, UPX and suggested-excludes combination, measure "
+                             "size and launch time (with --benchmark-args) and print the best trade-offs")
+    parser.add_argument("--trace-imports", action="store_true",
+                        help="Run the script with --benchmark-args, record its imports and propose excludes for "
+                             "modules the last build bundled but the program never loaded")
+    parser.add_argument("--retrace", action="store_true",
+                        help="With --trace-imports, re-run the smoke test instead of reusing the saved trace")
+    parser.add_argument("--print-command", action="store_true",
+                        help="Print the PyInstaller command line and exit without building")
+    parser.add_argument("--save-project", metavar="FILE",
+                        help="Write the merged options to a project file and exit without building")
+    return parser
+
+
+def _apply_flags(options, args):
+    for key in DEFAULT_OPTIONS:
+        value = getattr(args, key, None)
+        if value is None:
+            continue
+        if isinstance(DEFAULT_OPTIONS[key], list):
+            options[key] = list(options.get(key) or []) + list(value)
+        else:
+            options[key] = value
+    return options
+
+
+def load_builds(args):
+    """Merge defaults, an optional JSON options file and command-line flags.
+
+    Returns a list of ``(script_path, options)`` pairs, one per build.
+    """
+    file_options = [{}]
+    if args.options:
+        file_options = load_options_file(args.options)
+
+    builds = []
+    if args.scripts:
+        # Scripts on the command line share one option set; with several scripts each
+        # build is named after its script unless the options file names it.
+        base = file_options[0]
+        for script_path in args.scripts:
+            options = _apply_flags(dict(DEFAULT_OPTIONS, **base), args)
+            if len(args.scripts) > 1 and not base.get('name'):
+                options['name'] = Path(script_path).stem
+            options.pop('script', None)
+            builds.append((script_path, options))
+    else:
+        for entry in file_options:
+            options = _apply_flags(dict(DEFAULT_OPTIONS, **entry), args)
+            builds.append((options.pop('script', None), options))
+    return builds
+
+
+def _write_output(text):
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def run_queue(builds, max_workers):
+    queue = BuildQueue(max_workers=max_workers)
+    for script_path, options in builds:
+        try:
+            queue.add(script_path, options)
+        except ValueError as e:
+            _write_output(f"[ERROR] {e}\n")
+            return False
+    lock = threading.Lock()
+
+    def on_output(job, text):
+        prefix = f"[{job.name}] "
+        lines = text.splitlines(keepends=True)
+        with lock:
+            _write_output("".join(prefix + line for line in lines))
+
+    def on_finished(job):
+        done, total = queue.progress()
+        with lock:
+            _write_output(f"[INFO] ({done}/{total}) {job.name}: {job.status} in {job.duration:.1f}s\n")
+
+    start = time.monotonic()
+    results = []
+    runner = threading.Thread(target=lambda: results.append(queue.run(on_output, on_finished)))
+    runner.start()
+    try:
+        while runner.is_alive():
+            runner.join(0.2)
+    except KeyboardInterrupt:
+        # Builds run in their own process groups, so Ctrl+C does not reach them.
+        _write_output("[WARNING] Cancelling the queue...\n")
+        queue.cancel()
+        runner.join()
+    success = bool(results and results[0])
+    _write_output(f"[INFO] Queue finished in {time.monotonic() - start:.1f}s "
+                  f"with {queue.max_workers} concurrent build(s)\n")
+    return success
+
+
+def run_autotune(script_path, options, max_workers):
+    tuner = AutoTuner(script_path, options, max_workers=max_workers)
+    lock = threading.Lock()
+    reported = (TuneCandidate.FAILED, TuneCandidate.SKIPPED, TuneCandidate.DONE)
+    built = []
+
+    def on_output(candidate, text):
+        # Full build logs of every candidate would drown the summary; keep problems only.
+        lines = [line for line in text.splitlines(keepends=True) if line.startswith(("[ERROR]", "[WARNING]"))]
+        with lock:
+            _write_output("".join(f"[{candidate.label}] {line}" for line in lines))
+
+    def on_update(candidate):
+        # Built candidates still have their benchmark ahead, so they are counted
+        # apart from the finished ones.
+        if candidate.status == TuneCandidate.BUILT:
+            with lock:
+                built.append(candidate)
+                _write_output(f"[INFO] (built {len(built)}/{len(tuner.candidates)}) {candidate.label}\n")
+        elif candidate.status in reported and not candidate.pareto:
+            done, total = tuner.progress()
+            with lock:
+                _write_output(f"[INFO] ({done}/{total}) {candidate.label}: {candidate.status}\n")
+
+    _write_output(f"[INFO] Auto-tuning {len(tuner.candidates)} configurations in {tuner.base_dir}\n")
+    start = time.monotonic()
+    results = []
+    runner = threading.Thread(target=lambda: results.append(tuner.run(on_output, on_update)))
+    runner.start()
+    try:
+        while runner.is_alive():
+            runner.join(0.2)
+    except KeyboardInterrupt:
+        _write_output("[WARNING] Cancelling the auto-tune...\n")
+        tuner.cancel()
+        runner.join()
+    _write_output(f"[INFO] Auto-tune finished in {time.monotonic() - start:.1f}s; "
+                  f"* marks the best size/launch-time trade-offs:\n")
+    for line in format_candidates(tuner.candidates):
+        _write_output(line)
+    return bool(results and results[0])
+
+
+def main(argv=None):
+    parser = create_parser()
+    args = parser.parse_args(argv)
+    builds = load_builds(args)
+
+    for script_path, _ in builds:
+        if not script_path:
+            parser.error("a Python script is required (positional argument or 'script' in --options)")
+
+    if args.save_project:
+        if len(builds) > 1:
+            parser.error("--save-project takes a single script")
+        save_project(args.save_project, *builds[0])
+        print(f"[INFO] Project saved to {args.save_project}")
+        return 0
+
+    if args.print_command:
+        for script_path, options in builds:
+            cmd, _ = build_command(script_path, resolve_assets(options, lambda text: None))
+            print(" ".join(cmd))
+        return 0
+
+    for script_path, _ in builds:
+        if not Path(script_path).exists():
+            print(f"[ERROR] The script '{script_path}' does not exist.", file=sys.stderr)
+            return 2
+
+    if args.trace_imports:
+        if len(builds) > 1:
+            parser.error("--trace-imports takes a single script")
+        try:
+            proposals = trace_build(*builds[0], _write_output, refresh=args.retrace)
+        except (BuildCancelled, KeyboardInterrupt):
+            _write_output("[WARNING] Import trace cancelled\n")
+            return 1
+        except (OSError, ValueError) as e:
+            _write_output(f"[ERROR] Import trace failed: {e}\n")
+            return 1
+        return 0 if proposals is not None else 1
+
+    if args.autotune:
+        if len(builds) > 1:
+            parser.error("--autotune takes a single script")
+        return 0 if run_autotune(*builds[0], args.jobs) else 1
+
+    if len(builds) > 1:
+        jobs = args.jobs
+        if jobs is None and all(options.get('agents') for _, options in builds):
+            # Agents limit their own concurrency; local threads only wait on them.
+            jobs = len(builds)
+        return 0 if run_queue(builds, jobs) else 1
+
+    script_path, options = builds[0]
+    success, _ = execute_build(script_path, options, _write_output)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    finally:
+        shutdown_workers()
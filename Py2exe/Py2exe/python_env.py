@@ -0,0 +1,217 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import threading
+import subprocess
+from pathlib import Path
+
+# =================================================================================
+# Target interpreter selection and introspection (no Qt imports)
+#
+# A build can run PyInstaller from any interpreter or virtual environment
+# instead of the `pyinstaller` found on PATH. What that environment contains
+# (distributions, importable top-level modules, PyInstaller version and hooks)
+# is queried once in a child process and cached on disk, keyed on the mtimes of
+# the interpreter and its site-packages folders; installing or removing a
+# package changes the folder's mtime and triggers a fresh query.
+# =================================================================================
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "envs")
+INTROSPECTION_TIMEOUT = 120
+# Bump when the introspection script's output changes.
+INTROSPECTION_VERSION = 1
+
+# Runs in the target interpreter and prints one JSON object.
+_INTROSPECT_SCRIPT = r"""
+import os, sys, json, site, pkgutil, sysconfig
+from importlib import metadata
+
+# Only the environment itself, not the caller's working directory.
+sys.path = [path for path in sys.path if path]
+site_dirs = list(site.getsitepackages()) if hasattr(site, "getsitepackages") else []
+site_dirs += [sysconfig.get_paths()[key] for key in ("purelib", "platlib")]
+if site.ENABLE_USER_SITE and site.USER_SITE:
+    site_dirs.append(site.USER_SITE)
+
+distributions = {}
+for dist in metadata.distributions():
+    name = dist.metadata["Name"]
+    if name:
+        distributions.setdefault(name, dist.version)
+
+try:
+    pyinstaller = metadata.version("pyinstaller")
+except metadata.PackageNotFoundError:
+    pyinstaller = None
+
+hook_dirs = []
+if pyinstaller:
+    try:
+        import PyInstaller
+        hook_dirs.append(os.path.join(os.path.dirname(PyInstaller.__file__), "hooks"))
+    except Exception:
+        pass
+    try:
+        entry_points = metadata.entry_points(group="pyinstaller40")
+    except TypeError:  # Python < 3.10
+        entry_points = metadata.entry_points().get("pyinstaller40", [])
+    for entry_point in entry_points:
+        if entry_point.name == "hook-dirs":
+            try:
+                hook_dirs.extend(entry_point.load()())
+            except Exception:
+                pass
+hooks = set()
+for hook_dir in hook_dirs:
+    try:
+        names = os.listdir(hook_dir)
+    except OSError:
+        continue
+    hooks.update(name[5:-3] for name in names if name.startswith("hook-") and name.endswith(".py"))
+
+modules = {module.name for module in pkgutil.iter_modules()}
+modules.update(sys.builtin_module_names)
+print(json.dumps({
+    "executable": sys.executable,
+    "version": sys.version,
+    "prefix": sys.prefix,
+    "site_packages": sorted({os.path.normpath(path) for path in site_dirs if os.path.isdir(path)}),
+    "distributions": distributions,
+    "pyinstaller": pyinstaller,
+    "hooks": sorted(hooks),
+    "modules": sorted(modules),
+    "stdlib": sorted(getattr(sys, "stdlib_module_names", ())),
+}))
+"""
+
+_memory_cache = {}
+_lock = threading.Lock()
+
+
+def resolve_interpreter(path):
+    """Return the interpreter for ``path`` (an executable or a virtualenv folder), or None."""
+    if not path:
+        return None
+    path = Path(path).expanduser()
+    if path.is_dir():
+        for candidate in (path / "Scripts" / "python.exe", path / "bin" / "python", path / "python.exe"):
+            if candidate.is_file():
+                return str(candidate.absolute())
+        return None
+    return str(path.absolute()) if path.is_file() else None
+
+
+def pyinstaller_interpreter(python=None):
+    """Return the interpreter PyInstaller runs under for ``python`` (PATH's pyinstaller when None).
+
+    Raises FileNotFoundError when neither can be found.
+    """
+    if python:
+        interpreter = resolve_interpreter(python)
+        if interpreter is None:
+            raise FileNotFoundError(f"Python interpreter not found: {python}")
+        return interpreter
+    script = shutil.which("pyinstaller")
+    if script is None:
+        raise FileNotFoundError("pyinstaller")
+    try:
+        with open(script, "rb") as f:
+            first_line = f.readline(4096).decode("utf-8", errors="replace")
+    except OSError:
+        first_line = ""
+    parts = first_line[2:].split() if first_line.startswith("#!") else []
+    if parts and Path(parts[0]).name == "env":
+        parts = [shutil.which(parts[1])] if len(parts) > 1 else []
+    if parts and parts[0] and "python" in Path(parts[0]).name and os.path.isfile(parts[0]):
+        return parts[0]
+    # A launcher without a Python shebang (pyenv shims, for example): assume ours.
+    return sys.executable
+
+
+def pyinstaller_command(python=None):
+    """Return the argv prefix that runs PyInstaller for ``python`` (PATH when None)."""
+    interpreter = resolve_interpreter(python) if python else None
+    if python and interpreter is None:
+        raise FileNotFoundError(f"Python interpreter not found: {python}")
+    return [interpreter, "-m", "PyInstaller"] if interpreter else ["pyinstaller"]
+
+
+def makespec_command(python=None):
+    """Return the argv prefix that runs pyi-makespec for ``python`` (PATH when None)."""
+    prefix = pyinstaller_command(python)
+    return [prefix[0], "-m", "PyInstaller.utils.cliutils.makespec"] if python else ["pyi-makespec"]
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _stamp(interpreter, site_packages):
+    return [INTROSPECTION_VERSION, _mtime(interpreter), *(_mtime(path) for path in site_packages)]
+
+
+def _cache_path(interpreter, cache_dir):
+    key = hashlib.sha256(interpreter.encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir or DEFAULT_CACHE_DIR) / f"{key}.json"
+
+
+def _introspect(interpreter):
+    try:
+        result = subprocess.run([interpreter, "-c", _INTROSPECT_SCRIPT], capture_output=True, text=True,
+                                timeout=INTROSPECTION_TIMEOUT)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+    except (OSError, subprocess.SubprocessError, ValueError, IndexError) as e:
+        raise RuntimeError(f"could not introspect {interpreter}: {e}") from e
+
+
+def environment_info(python, cache_dir=None):
+    """Return the cached introspection of ``python``, querying it only when stale.
+
+    Raises FileNotFoundError for a missing interpreter and RuntimeError when the
+    interpreter cannot be queried.
+    """
+    interpreter = resolve_interpreter(python)
+    if interpreter is None:
+        raise FileNotFoundError(f"Python interpreter not found: {python}")
+    cache_path = _cache_path(interpreter, cache_dir)
+
+    with _lock:
+        entry = _memory_cache.get(cache_path)
+    if entry is None:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+    if entry and entry.get('stamp') == _stamp(interpreter, entry['info']['site_packages']):
+        with _lock:
+            _memory_cache[cache_path] = entry
+        return entry['info']
+
+    info = _introspect(interpreter)
+    entry = {'stamp': _stamp(interpreter, info['site_packages']), 'info': info}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, cache_path)
+    with _lock:
+        _memory_cache[cache_path] = entry
+    return info
+
+
+def available_modules(info):
+    """Return the set of top-level module names importable in an introspected environment."""
+    return set(info['modules']) | set(info['stdlib'])
+
+
+def describe_environment(info):
+    version = info['version'].split()[0]
+    pyinstaller = f"PyInstaller {info['pyinstaller']}" if info['pyinstaller'] else "no PyInstaller"
+    return (f"Python {version} at {info['executable']} ({len(info['distributions'])} distribution(s), "
+            f"{pyinstaller}, {len(info['hooks'])} hook(s))")
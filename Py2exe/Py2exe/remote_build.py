@@ -0,0 +1,271 @@
+import os
+import sys
+import time
+import select
+import shutil
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from asset_rules import resolve_assets, source_paths
+from script_graph import local_module_files, resolve_local_module
+from bundle_report import format_size
+from process_tree import BuildCancelled, CANCEL_POLL_INTERVAL, raise_if_cancelled
+from build_agent import (DEFAULT_PORT, PROTOCOL_VERSION, TOKEN_ENV, send_message, recv_header, recv_payload,
+                         pack_archive, unpack_archive)
+
+# =================================================================================
+# Remote builds on build agents (no Qt imports)
+#
+# With the 'agents' option set ("host:port" strings), execute_build() hands the
+# build to run_remote_build(): the script, its local modules, the icon and every
+# asset are zipped with archive-relative paths, sent with the options to the
+# least-loaded agent that has a free slot, the agent's log is streamed back into
+# on_output, and the zipped artifact is unpacked into distpath.
+#
+# Agents report their slots, running and queued builds and load average. The
+# scheduler also counts the builds this process has just sent to an agent, so a
+# queue dispatching many builds at once does not pile them all onto the agent
+# that happened to look idle.
+# =================================================================================
+
+CONNECT_TIMEOUT = 10
+STATUS_TIMEOUT = 2
+TRANSFER_TIMEOUT = 60
+# Seconds between scheduling attempts while every agent is busy.
+SCHEDULE_INTERVAL = 0.5
+
+
+def parse_agent(address):
+    """Return ``(host, port)`` for "host", "host:port" or "[ipv6]:port"."""
+    address = address.strip()
+    host, sep, port = address.rpartition(":")
+    if not sep or (":" in host and not host.endswith("]")):
+        return address.strip("[]"), DEFAULT_PORT
+    return host.strip("[]"), int(port)
+
+
+def _request(address, message, timeout):
+    with socket.create_connection(parse_agent(address), timeout=timeout) as sock:
+        send_message(sock, dict(message, protocol=PROTOCOL_VERSION, token=os.environ.get(TOKEN_ENV)))
+        reply = recv_header(sock)
+    if reply.get('type') == "error":
+        raise ConnectionError(reply['message'])
+    return reply
+
+
+def agent_status(address, timeout=STATUS_TIMEOUT):
+    """Return an agent's status dict; raises OSError or ValueError when it cannot be queried."""
+    return _request(address, {'type': "status"}, timeout)
+
+
+def agent_statuses(addresses, timeout=STATUS_TIMEOUT):
+    """Query all agents concurrently; returns ``{address: status or error string}``."""
+    def query(address):
+        try:
+            return agent_status(address, timeout)
+        except (OSError, ValueError) as e:
+            return str(e) or type(e).__name__
+
+    with ThreadPoolExecutor(max_workers=max(1, len(addresses))) as pool:
+        return dict(zip(addresses, pool.map(query, addresses)))
+
+
+def describe_agent(address, status):
+    if not isinstance(status, dict):
+        return f"{address}: unreachable ({status})"
+    return (f"{address}: {status['running']}/{status['jobs']} running, {status['queued']} queued, "
+            f"load {status['load']:.2f}, {status['platform']}, Python {status['python']}")
+
+
+class AgentScheduler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._assigned = {}
+
+    def acquire(self, addresses, on_output, cancel_event=None):
+        """Wait for the least-loaded agent with a free slot and return ``(address, status)``.
+
+        Raises ConnectionError if no agent can be reached.
+        """
+        waiting_logged = False
+        while True:
+            statuses = agent_statuses(addresses)
+            reachable = {address: status for address, status in statuses.items() if isinstance(status, dict)}
+            if not reachable:
+                raise ConnectionError("no build agent reachable: " +
+                                      "; ".join(describe_agent(address, status) for address, status in statuses.items()))
+            with self._lock:
+                candidates = []
+                for address, status in reachable.items():
+                    busy = max(status['running'] + status['queued'], self._assigned.get(address, 0))
+                    if busy < status['jobs']:
+                        candidates.append(((busy / status['jobs'], status['load']), address))
+                if candidates:
+                    _, address = min(candidates)
+                    self._assigned[address] = self._assigned.get(address, 0) + 1
+                    return address, reachable[address]
+            if not waiting_logged:
+                on_output(f"[INFO] All {len(reachable)} reachable agent(s) are busy; waiting for a free slot...\n")
+                waiting_logged = True
+            if cancel_event is not None and cancel_event.wait(SCHEDULE_INTERVAL):
+                raise BuildCancelled()
+            if cancel_event is None:
+                time.sleep(SCHEDULE_INTERVAL)
+
+    def release(self, address):
+        with self._lock:
+            self._assigned[address] = max(0, self._assigned.get(address, 0) - 1)
+
+
+scheduler = AgentScheduler()
+
+
+def package_inputs(script_path, options, archive_path, on_output=None):
+    """Zip everything the build reads into ``archive_path``.
+
+    Returns ``(remote_options, script_name, file_count)``; paths in the remote
+    options are relative to the archive root. Raises FileNotFoundError for a
+    missing asset source. Local modules that resolve outside the script folder
+    are reported through ``on_output`` and not sent.
+    """
+    script = Path(script_path).resolve()
+    root = script.parent
+    files = set(local_module_files(script))
+    # Local hidden imports and collect-all packages are not reachable from the import graph.
+    for name in options.get('hidden_imports') or []:
+        files.update(resolve_local_module(name, 0, script, root))
+    package_dirs = [path for path in (root.joinpath(*name.split(".")) for name in options.get('collect_all') or [])
+                    if path.is_dir()]
+    files = [path for path in files if not any(package_dir in path.parents for package_dir in package_dirs)]
+    # A symlinked module can resolve outside the folder the archive mirrors.
+    outside = sorted(path for path in files if root not in path.parents)
+    if outside and on_output is not None:
+        on_output(f"[ERROR] Not sent to the agent, because they are outside {root}: "
+                  f"{', '.join(str(path) for path in outside)}; copy them into the script folder\n")
+    files = [path for path in files if root in path.parents]
+    entries = [(path, "src/" + path.relative_to(root).as_posix()) for path in sorted(files + package_dirs)]
+
+    remote = {key: value for key, value in options.items() if key not in ('python', 'upx_dir', 'cache_dir', 'agents')}
+    add_data = []
+    for index, (source, dest) in enumerate(options.get('add_data') or []):
+        paths = source_paths(source)
+        if not paths:
+            raise FileNotFoundError(f"Asset source not found: {source}")
+        # Each glob match is shipped as its own source; PyInstaller treats both the same.
+        for number, path in enumerate(paths):
+            name = f"assets/{index}/{number}/{Path(path).name}"
+            entries.append((path, name))
+            add_data.append([name, dest])
+    remote['add_data'] = add_data
+    remote['asset_rules'] = []
+    if options.get('icon'):
+        remote['icon'] = f"icon/{Path(options['icon']).name}"
+        entries.append((options['icon'], remote['icon']))
+    count = pack_archive(entries, archive_path)
+    return remote, "src/" + script.name, count
+
+
+def unpack_artifact(archive_path, distpath, name):
+    """Replace the artifact for ``name`` in ``distpath`` with the archive's contents."""
+    dist_dir = Path(distpath or "dist")
+    staging_dir = dist_dir / f".{name}.remote"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    try:
+        unpack_archive(archive_path, staging_dir)
+        restored = []
+        for item in sorted(staging_dir.iterdir()):
+            target = dist_dir / item.name
+            if target.is_dir() and not target.is_symlink():
+                shutil.rmtree(target)
+            elif target.exists() or target.is_symlink():
+                target.unlink()
+            os.replace(item, target)
+            restored.append(target)
+        return restored
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _stream_build(sock, on_output, cancel_event, payload_dir):
+    """Relay the agent's output until its result arrives; returns the result message."""
+    while True:
+        readable, _, _ = select.select([sock], [], [], CANCEL_POLL_INTERVAL)
+        if cancel_event is not None and cancel_event.is_set():
+            try:
+                send_message(sock, {'type': "cancel"})
+            except OSError:
+                pass
+            raise BuildCancelled()
+        if not readable:
+            continue
+        message = recv_header(sock)
+        if message.get('type') == "output":
+            on_output(message['text'])
+        elif message.get('type') == "result":
+            return recv_payload(sock, message, payload_dir)
+        elif message.get('type') == "error":
+            raise ConnectionError(message['message'])
+
+
+def run_remote_build(script_path, options, on_output, cancel_event, timeline, outcome):
+    """Build on the least-loaded agent in options['agents']; same contract as execute_build."""
+    started_at = time.time()
+    name = options.get('name') or "MyApp"
+    address = None
+    try:
+        on_output("[INFO] Starting remote build...\n")
+        timeline.begin_stage("packaging")
+        options = resolve_assets(options, on_output)
+        with tempfile.TemporaryDirectory(prefix="py2exe-remote-") as temp_dir:
+            archive_path = os.path.join(temp_dir, "inputs.zip")
+            remote_options, script_name, count = package_inputs(script_path, options, archive_path, on_output)
+            on_output(f"[INFO] Packaged {count} file(s), {format_size(os.path.getsize(archive_path))} compressed\n")
+            raise_if_cancelled(cancel_event)
+
+            timeline.begin_stage("scheduling")
+            address, status = scheduler.acquire(options['agents'], on_output, cancel_event)
+            on_output(f"[INFO] Building on agent {describe_agent(address, status)}\n")
+            if status['platform'] != sys.platform:
+                on_output(f"[WARNING] Agent {address} runs on {status['platform']}; "
+                          f"the artifact will be built for {status['platform']}, not {sys.platform}\n")
+
+            timeline.begin_stage("upload")
+            with socket.create_connection(parse_agent(address), timeout=CONNECT_TIMEOUT) as sock:
+                sock.settimeout(TRANSFER_TIMEOUT)
+                send_message(sock, {'type': "build", 'protocol': PROTOCOL_VERSION,
+                                    'token': os.environ.get(TOKEN_ENV), 'script': script_name,
+                                    'options': remote_options}, archive_path)
+                timeline.begin_stage("remote build")
+                result = _stream_build(sock, on_output, cancel_event, temp_dir)
+            scheduler.release(address)
+            address = None
+
+            outcome['returncode'] = result.get('returncode')
+            if not result['success']:
+                if result.get('status') == "cancelled":
+                    outcome['status'] = "cancelled"
+                return False, result['message']
+            timeline.begin_stage("download")
+            restored = unpack_artifact(result['payload'], options.get('distpath'), name)
+            on_output(f"[INFO] Pulled {len(restored)} item(s) from the agent into "
+                      f"{options.get('distpath') or 'dist'}\n")
+            on_output("[SUCCESS] Remote build completed successfully!\n")
+            return True, "Remote build completed successfully!"
+
+    except (BuildCancelled, KeyboardInterrupt):
+        outcome['status'] = "cancelled"
+        elapsed = time.time() - started_at
+        on_output(f"[WARNING] Remote build cancelled after {elapsed:.1f}s\n")
+        return False, f"Build cancelled after {elapsed:.1f}s."
+    except FileNotFoundError as e:
+        on_output(f"[ERROR] {e}\n")
+        return False, str(e)
+    except (OSError, ValueError) as e:
+        on_output(f"[ERROR] Remote build failed: {e}\n")
+        return False, f"Remote build failed: {e}"
+    finally:
+        if address is not None:
+            scheduler.release(address)
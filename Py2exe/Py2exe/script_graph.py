@@ -0,0 +1,160 @@
+import ast
+from pathlib import Path
+
+# =================================================================================
+# Local import graph of a script (no Qt imports)
+#
+# Finds the script's transitive imports that resolve to files inside the script's
+# own directory tree, i.e. the project sources PyInstaller will pull in, and the
+# dynamic imports PyInstaller cannot see.
+# =================================================================================
+
+def _dynamic_target(node):
+    """Return ``(name, is_prefix)`` for importlib.import_module()/__import__() calls."""
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        is_import_call = func.attr == "import_module"
+    elif isinstance(func, ast.Name):
+        is_import_call = func.id in ("import_module", "__import__")
+    else:
+        is_import_call = False
+    if not is_import_call or not node.args:
+        return None
+
+    arg = node.args[0]
+    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        name, is_prefix = arg.value, False
+    elif (isinstance(arg, ast.JoinedStr) and arg.values
+          and isinstance(arg.values[0], ast.Constant) and isinstance(arg.values[0].value, str)):
+        name, is_prefix = arg.values[0].value, True      # f"plugins.{name}"
+    elif (isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Add)
+          and isinstance(arg.left, ast.Constant) and isinstance(arg.left.value, str)):
+        name, is_prefix = arg.left.value, True           # "plugins." + name
+    else:
+        return None
+
+    if name.startswith("."):
+        package = None
+        if len(node.args) > 1:
+            package = node.args[1]
+        for keyword in node.keywords:
+            if keyword.arg == "package":
+                package = keyword.value
+        if not (isinstance(package, ast.Constant) and isinstance(package.value, str)):
+            return None
+        name = package.value + name
+    name = name.rstrip(".") if is_prefix else name
+    return (name, is_prefix) if name else None
+
+
+def _walk_statements(tree):
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        yield node
+        for field in ("body", "orelse", "finalbody", "handlers", "cases"):
+            children = getattr(node, field, None)
+            if isinstance(children, list):
+                pending.extend(children)
+
+
+def scan_source(file_path):
+    """Parse a file and return its static imports and dynamic import targets.
+
+    The result is a dict with ``imports`` (``(module, level)`` pairs),
+    ``dynamic_imports`` (literal module names) and ``dynamic_prefixes`` (package
+    prefixes of computed module names).
+    """
+    info = {'imports': [], 'dynamic_imports': [], 'dynamic_prefixes': []}
+    try:
+        source = Path(file_path).read_bytes()
+        tree = ast.parse(source, filename=str(file_path))
+    except (OSError, SyntaxError, ValueError):
+        return info
+
+    imports = info['imports']
+    # Import statements never live inside expressions, so unless the file can
+    # contain a dynamic import call only statement bodies need to be visited.
+    nodes = ast.walk(tree) if (b"import_module" in source or b"__import__" in source) else _walk_statements(tree)
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            imports.extend((alias.name, 0) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            imports.append((module, node.level))
+            # "from pkg import sub" may name a submodule rather than an attribute.
+            imports.extend((f"{module}.{alias.name}" if module else alias.name, node.level)
+                           for alias in node.names if alias.name != "*")
+        elif isinstance(node, ast.Call):
+            target = _dynamic_target(node)
+            if target:
+                name, is_prefix = target
+                info['dynamic_prefixes' if is_prefix else 'dynamic_imports'].append(name)
+    return info
+
+
+def parse_imports(file_path):
+    """Return ``(module, level)`` pairs for every import statement in a file."""
+    return scan_source(file_path)['imports']
+
+
+def _module_candidates(base_dir, module):
+    path = base_dir.joinpath(*module.split(".")) if module else base_dir
+    return [path.with_suffix(".py"), path / "__init__.py"]
+
+
+def resolve_local_module(module, level, importer, root_dir):
+    """Return the files under ``root_dir`` an import executes (empty if it is not local)."""
+    if level:
+        base_dir = Path(importer).parent
+        for _ in range(level - 1):
+            base_dir = base_dir.parent
+    else:
+        base_dir = root_dir
+
+    found = []
+    parts = module.split(".") if module else []
+    # Importing a.b.c also executes a/__init__.py and a/b/__init__.py.
+    for i in range(1, len(parts)):
+        init_file = base_dir.joinpath(*parts[:i]) / "__init__.py"
+        if init_file.is_file():
+            found.append(init_file)
+    for candidate in _module_candidates(base_dir, module):
+        if candidate.is_file():
+            found.append(candidate)
+            break
+    return found
+
+
+def walk_local_modules(script_path, scan=scan_source):
+    """Yield ``(file, scan_result)`` for the script and every local module it imports."""
+    script = Path(script_path).resolve()
+    root_dir = script.parent
+    seen = {script}
+    pending = [script]
+
+    while pending:
+        current = pending.pop()
+        info = scan(current)
+        yield current, info
+        targets = list(info['imports'])
+        targets.extend((name, 0) for name in info.get('dynamic_imports', ()))
+        for module, level in targets:
+            for found in resolve_local_module(module, level, current, root_dir):
+                found = found.resolve()
+                if found not in seen:
+                    seen.add(found)
+                    pending.append(found)
+
+
+def path_under_root(file_path, root_dir):
+    """Return ``file_path`` relative to ``root_dir``, or as is when it resolves outside it (via a symlink)."""
+    try:
+        return file_path.relative_to(root_dir)
+    except ValueError:
+        return file_path
+
+
+def local_module_files(script_path):
+    """Return the script and every local module it transitively imports, sorted."""
+    return sorted(file_path for file_path, _ in walk_local_modules(script_path))
@@ -0,0 +1,184 @@
+import os
+import sys
+import json
+import time
+import shutil
+import fnmatch
+import hashlib
+import threading
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from process_tree import BuildCancelled, raise_if_cancelled, run_cancellable
+
+# =================================================================================
+# Parallel UPX stage for onedir builds (no Qt imports)
+#
+# PyInstaller runs UPX over each binary one after the other. For --onedir builds
+# Py2Exe can instead disable PyInstaller's UPX step and compress the collected
+# binaries afterwards, several UPX processes at a time. Compressed outputs are
+# cached by input hash, so unchanged libraries are never recompressed.
+# =================================================================================
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py2exe", "upx")
+UPX_ARGS = ["-9", "-q"]
+
+# Binaries known to break, or to gain nothing, when UPX-compressed.
+DEFAULT_EXCLUDES = [
+    "vcruntime*.dll", "msvcp*.dll", "ucrtbase.dll", "api-ms-win-*.dll",
+    "python3*.dll", "libpython3*",
+    "qwindows.dll", "*/plugins/platforms/*",
+    "ld-linux*", "libc.so*", "libstdc++*",
+]
+
+_BINARY_SUFFIXES = (".so", ".dll", ".pyd", ".dylib")
+_MAGIC_NUMBERS = (b"\x7fELF", b"MZ", b"\xcf\xfa\xed\xfe", b"\xce\xfa\xed\xfe")
+
+
+def upx_executable(upx_dir):
+    return Path(upx_dir) / ("upx.exe" if sys.platform == "win32" else "upx")
+
+
+def upx_version(upx_exe):
+    try:
+        result = subprocess.run([str(upx_exe), "--version"], capture_output=True, text=True, timeout=30)
+        return result.stdout.splitlines()[0] if result.stdout else "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _is_binary(path):
+    name = path.name
+    if not (name.endswith(_BINARY_SUFFIXES) or ".so." in name):
+        return False
+    try:
+        with open(path, "rb") as f:
+            return f.read(4).startswith(_MAGIC_NUMBERS)
+    except OSError:
+        return False
+
+
+def find_candidates(bundle_dir, excludes):
+    """Return the binaries in a onedir bundle that should be compressed.
+
+    The main executable is skipped because its appended archive does not survive
+    UPX; symlinks are skipped so each library is compressed once.
+    """
+    bundle_dir = Path(bundle_dir)
+    candidates = []
+    for root, _, files in os.walk(bundle_dir):
+        for file_name in files:
+            path = Path(root) / file_name
+            relative = path.relative_to(bundle_dir).as_posix()
+            if path.is_symlink() or Path(root) == bundle_dir and file_name == bundle_dir.name:
+                continue
+            if any(fnmatch.fnmatch(file_name, pattern) or fnmatch.fnmatch(relative, pattern) for pattern in excludes):
+                continue
+            if _is_binary(path):
+                candidates.append(path)
+    return candidates
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UpxStage:
+    def __init__(self, upx_dir, cache_dir=None, max_workers=None, excludes=(), cancel_event=None):
+        self.upx_exe = upx_executable(upx_dir)
+        self.cancel_event = cancel_event
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.excludes = list(DEFAULT_EXCLUDES) + list(excludes)
+        self.version = None
+
+    def _cache_entry(self, file_hash):
+        key = hashlib.sha256(f"{file_hash}|{self.version}|{' '.join(UPX_ARGS)}".encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / key
+
+    def compress(self, path):
+        """Compress one binary in place, using the cache when possible.
+
+        Returns a dict with ``original_size``, ``size``, ``seconds`` (UPX time,
+        recorded on first compression and reused for cache hits) and ``cached``.
+        """
+        raise_if_cancelled(self.cancel_event)
+        original_size = path.stat().st_size
+        entry = self._cache_entry(_file_hash(path))
+        meta_file = entry.with_suffix(".json")
+        if meta_file.is_file():
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            if meta['compressed']:
+                shutil.copy2(entry, path)
+            return {'original_size': original_size, 'size': path.stat().st_size,
+                    'seconds': meta['seconds'], 'cached': True}
+
+        output = path.with_name(path.name + ".upx-tmp")
+        start = time.perf_counter()
+        try:
+            returncode = run_cancellable([str(self.upx_exe), *UPX_ARGS, "-o", str(output), str(path)], self.cancel_event)
+        except BuildCancelled:
+            output.unlink(missing_ok=True)
+            raise
+        seconds = time.perf_counter() - start
+        compressed = returncode == 0 and output.is_file()
+
+        # Identical binaries may be compressed concurrently; publish entries atomically.
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        staging = entry.with_name(f".{entry.name}.{threading.get_ident()}")
+        if compressed:
+            shutil.copymode(path, output)
+            shutil.copy2(output, staging)
+            os.replace(staging, entry)
+            os.replace(output, path)
+        else:
+            # Not packable (already packed, unsupported format, ...): remember that too.
+            output.unlink(missing_ok=True)
+        staging.write_text(json.dumps({'compressed': compressed, 'seconds': seconds}), encoding="utf-8")
+        os.replace(staging, meta_file)
+        return {'original_size': original_size, 'size': path.stat().st_size, 'seconds': seconds, 'cached': False}
+
+    def run(self, bundle_dir, on_output):
+        self.version = upx_version(self.upx_exe)
+        if self.version is None:
+            on_output(f"[WARNING] UPX not found at {self.upx_exe}; parallel UPX stage skipped\n")
+            return None
+
+        candidates = find_candidates(bundle_dir, self.excludes)
+        on_output(f"[PROCESS] Compressing {len(candidates)} binaries with UPX using {self.max_workers} parallel processes...\n")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(self.compress, candidates))
+        wall_time = time.perf_counter() - start
+
+        serial_time = sum(result['seconds'] for result in results)
+        cached = sum(1 for result in results if result['cached'])
+        before = sum(result['original_size'] for result in results)
+        after = sum(result['size'] for result in results)
+        on_output(f"[INFO] UPX: {len(results)} binaries ({cached} from cache), "
+                  f"{before / 1024 / 1024:.1f} MiB -> {after / 1024 / 1024:.1f} MiB\n")
+        on_output(f"[INFO] UPX stage took {wall_time:.1f}s vs ~{serial_time:.1f}s serial "
+                  f"(saved ~{max(0.0, serial_time - wall_time):.1f}s)\n")
+        return {'files': len(results), 'cached': cached, 'wall_time': wall_time, 'serial_time': serial_time,
+                'original_size': before, 'size': after}
+
+
+def uses_parallel_upx(options):
+    return bool(options.get('parallel_upx') and options.get('upx_dir')
+                and not options.get('noupx') and not options.get('one_file'))
+
+
+def run_upx_stage(options, on_output, cancel_event=None):
+    """Compress the onedir bundle of a finished build."""
+    name = options.get('name') or "MyApp"
+    bundle_dir = Path(options.get('distpath') or "dist") / name
+    if not bundle_dir.is_dir():
+        on_output(f"[WARNING] Bundle directory {bundle_dir} not found; parallel UPX stage skipped\n")
+        return None
+    stage = UpxStage(options['upx_dir'], excludes=options.get('upx_exclude') or (), cancel_event=cancel_event)
+    return stage.run(bundle_dir, on_output)
@@ -0,0 +1,343 @@
+import os
+import json
+import time
+import queue
+import signal
+import itertools
+import threading
+import subprocess
+from types import SimpleNamespace
+
+from build_core import OutputBatcher
+from python_env import pyinstaller_command, pyinstaller_interpreter
+from process_tree import CANCEL_POLL_INTERVAL, TERMINATE_GRACE, process_group_kwargs, raise_if_cancelled
+
+# =================================================================================
+# Warm PyInstaller worker (no Qt imports)
+#
+# Starting `pyinstaller` pays for the interpreter start and for importing
+# PyInstaller and its building, analysis and hook modules on every build. With
+# the 'warm_worker' option, execute_build() instead sends the PyInstaller
+# arguments to a long-lived worker process per interpreter that has all of that
+# imported already. The worker forks one child per build, so builds never share
+# state and several can run at once; each child leads its own session, which
+# cancellation stops as a whole like any other build process.
+#
+# Worker and client talk over the worker's stdin/stdout, one JSON message per
+# line; the children's combined output is streamed back as 'output' events.
+# A worker exits when its client does, and is replaced when PyInstaller is
+# reinstalled underneath it. Needs os.fork(), so POSIX only.
+# =================================================================================
+
+READY_TIMEOUT = 60
+# Time a cancelled child gets after SIGKILL for the worker to report its exit.
+_EXIT_TIMEOUT = 5.0
+
+# Runs in the target interpreter. stdout is kept for the protocol; fd 1 is
+# pointed at stderr so a stray print() cannot corrupt it.
+_WORKER_SCRIPT = r"""
+import os, sys, json, time, codecs, signal, logging, selectors, traceback
+
+channel = os.fdopen(os.dup(1), "wb", buffering=0)
+os.dup2(2, 1)
+
+
+def send(message):
+    channel.write(json.dumps(message).encode("utf-8") + b"\n")
+
+
+try:
+    import PyInstaller
+    import PyInstaller.__main__
+    import PyInstaller.building.build_main
+    import PyInstaller.depend.analysis
+    import PyInstaller.utils.hooks
+except Exception as e:
+    send({"type": "error", "message": f"{type(e).__name__}: {e}"})
+    sys.exit(1)
+
+
+def run_child(request, write_fd):
+    code = 1
+    try:
+        os.setsid()
+        null = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(null, 0)
+        os.dup2(write_fd, 1)
+        os.dup2(write_fd, 2)
+        os.chdir(request["cwd"])
+        # PyInstaller's log lines carry the milliseconds since logging was imported.
+        logging._startTime = time.time()
+        sys.argv = ["pyinstaller", *request["args"]]
+        try:
+            PyInstaller.__main__.run(request["args"])
+            code = 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+selector = selectors.DefaultSelector()
+selector.register(0, selectors.EVENT_READ)
+builds = {}
+pending = b""
+send({"type": "ready", "pid": os.getpid(), "version": PyInstaller.__version__,
+      "package": os.path.dirname(PyInstaller.__file__)})
+
+while True:
+    for key, _ in selector.select():
+        if key.fd == 0:
+            data = os.read(0, 65536)
+            if not data:
+                # The client is gone; nobody is left to receive the results.
+                for build_id, pid, decoder in builds.values():
+                    try:
+                        os.killpg(pid, signal.SIGKILL)
+                    except OSError:
+                        pass
+                sys.exit(0)
+            pending += data
+            while b"\n" in pending:
+                line, _, pending = pending.partition(b"\n")
+                request = json.loads(line)
+                read_fd, write_fd = os.pipe()
+                pid = os.fork()
+                if pid == 0:
+                    channel.close()
+                    os.close(read_fd)
+                    for fd in builds:
+                        os.close(fd)
+                    run_child(request, write_fd)
+                os.close(write_fd)
+                builds[read_fd] = (request["id"], pid, codecs.getincrementaldecoder("utf-8")(errors="replace"))
+                selector.register(read_fd, selectors.EVENT_READ)
+                send({"type": "started", "id": request["id"], "pid": pid})
+            continue
+
+        build_id, pid, decoder = builds[key.fd]
+        data = os.read(key.fd, 65536)
+        text = decoder.decode(data, final=not data)
+        if text:
+            send({"type": "output", "id": build_id, "text": text})
+        if not data:
+            selector.unregister(key.fd)
+            os.close(key.fd)
+            del builds[key.fd]
+            _, status, rusage = os.wait4(pid, 0)
+            send({"type": "exit", "id": build_id, "returncode": os.waitstatus_to_exitcode(status),
+                  "rusage": [rusage.ru_utime, rusage.ru_stime, rusage.ru_maxrss]})
+"""
+
+
+def warm_worker_supported():
+    return hasattr(os, "fork") and hasattr(os, "wait4")
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class WarmWorker:
+    def __init__(self, interpreter):
+        """Start a worker for ``interpreter``; raises RuntimeError if it cannot import PyInstaller."""
+        self.interpreter = interpreter
+        self.builds = 0
+        self.saved = 0.0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._events = {}
+        self._control = queue.Queue()
+        started = time.monotonic()
+        self.process = subprocess.Popen([interpreter, "-c", _WORKER_SCRIPT], stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                        **process_group_kwargs())
+        threading.Thread(target=self._read_events, daemon=True, name="py2exe-warm-worker").start()
+        try:
+            ready = self._control.get(timeout=READY_TIMEOUT)
+        except queue.Empty:
+            ready = {'type': "error", 'message': f"not ready after {READY_TIMEOUT}s"}
+        if ready['type'] != "ready":
+            self.close()
+            raise RuntimeError(ready.get('message') or "the worker exited during startup")
+        # What every cold `pyinstaller` start costs before it does any work.
+        self.startup = time.monotonic() - started
+        self.version = ready['version']
+        self.package = ready['package']
+        self._package_mtime = _mtime(self.package)
+
+    def _read_events(self):
+        for line in self.process.stdout:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            with self._lock:
+                events = self._events.get(event.get('id'))
+            (events or self._control).put(event)
+        with self._lock:
+            waiting = list(self._events.values())
+        for events in [self._control, *waiting]:
+            events.put({'type': "closed"})
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def stale(self):
+        """True when PyInstaller was upgraded or removed since the worker imported it."""
+        return _mtime(self.package) != self._package_mtime
+
+    def close(self):
+        # The worker kills its running children when its stdin closes.
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=TERMINATE_GRACE)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+    def _send(self, message):
+        with self._lock:
+            self.process.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+            self.process.stdin.flush()
+
+    def _stop_child(self, pid, events):
+        for sig, timeout in ((signal.SIGTERM, TERMINATE_GRACE), (signal.SIGKILL, _EXIT_TIMEOUT)):
+            try:
+                os.killpg(pid, sig)
+            except ProcessLookupError:
+                return
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                try:
+                    if events.get(timeout=CANCEL_POLL_INTERVAL)['type'] in ("exit", "closed"):
+                        return
+                except queue.Empty:
+                    pass
+
+    def run(self, args, on_output, cancel_event=None, timeline=None):
+        """Run PyInstaller with ``args`` in a fresh fork; same contract as build_core.run_command."""
+        build_id = next(self._ids)
+        events = queue.Queue()
+        with self._lock:
+            self._events[build_id] = events
+        batcher = OutputBatcher(on_output)
+        pid = None
+        requested = time.monotonic()
+        try:
+            try:
+                self._send({'type': "build", 'id': build_id, 'args': list(args), 'cwd': os.getcwd()})
+            except OSError as e:
+                raise RuntimeError(f"the warm PyInstaller worker is gone: {e}") from e
+            while True:
+                timeout = batcher.time_until_flush()
+                try:
+                    event = events.get(timeout=CANCEL_POLL_INTERVAL if timeout is None
+                                       else min(timeout, CANCEL_POLL_INTERVAL))
+                except queue.Empty:
+                    raise_if_cancelled(cancel_event)
+                    if not self.alive() and events.empty():
+                        raise RuntimeError("the warm PyInstaller worker exited during the build")
+                    if batcher.time_until_flush() == 0.0:
+                        batcher.flush()
+                    continue
+                if event['type'] == "started":
+                    pid = event['pid']
+                    latency = time.monotonic() - requested
+                    # The first build waited for the worker to start, so it saved nothing.
+                    saved = max(0.0, self.startup - latency) if self.builds else 0.0
+                    self.builds += 1
+                    self.saved += saved
+                    if self.builds == 1:
+                        on_output(f"[INFO] Forked from the new warm PyInstaller worker in {latency * 1000:.0f} ms "
+                                  f"(0 ms saved on its first build)\n")
+                    else:
+                        on_output(f"[INFO] Forked from the warm PyInstaller worker in {latency * 1000:.0f} ms "
+                                  f"instead of a {self.startup * 1000:.0f} ms cold start ({saved * 1000:.0f} ms "
+                                  f"saved; {self.saved:.1f}s over {self.builds - 1} warm build(s))\n")
+                    if timeline is not None:
+                        timeline.process_started()
+                elif event['type'] == "output":
+                    batcher.write(event['text'])
+                    if timeline is not None:
+                        timeline.feed(event['text'])
+                elif event['type'] == "exit":
+                    batcher.flush(final=True)
+                    if timeline is not None:
+                        utime, stime, maxrss = event['rusage']
+                        timeline.process_finished(SimpleNamespace(ru_utime=utime, ru_stime=stime, ru_maxrss=maxrss))
+                    return event['returncode']
+                elif event['type'] == "closed":
+                    raise RuntimeError("the warm PyInstaller worker exited during the build")
+                raise_if_cancelled(cancel_event)
+        except BaseException:
+            # Cancelled or interrupted: never leave PyInstaller running on its own.
+            if pid is not None:
+                self._stop_child(pid, events)
+            batcher.flush(final=True)
+            raise
+        finally:
+            with self._lock:
+                self._events.pop(build_id, None)
+
+
+_workers = {}
+_workers_lock = threading.Lock()
+
+
+def get_worker(python, on_output):
+    """Return the running worker for ``python``, starting (or restarting) it if needed.
+
+    Raises FileNotFoundError for a missing interpreter and RuntimeError when
+    the worker cannot start.
+    """
+    interpreter = pyinstaller_interpreter(python)
+    with _workers_lock:
+        worker = _workers.get(interpreter)
+        if worker is not None and worker.alive() and not worker.stale():
+            return worker
+        if worker is not None:
+            on_output("[INFO] PyInstaller changed since the warm worker started; restarting it\n")
+            worker.close()
+        worker = _workers[interpreter] = WarmWorker(interpreter)
+    on_output(f"[INFO] Started a warm PyInstaller {worker.version} worker for {interpreter} in "
+              f"{worker.startup * 1000:.0f} ms; later builds fork from it\n")
+    return worker
+
+
+def run_warm_command(cmd, python, on_output, cancel_event=None, timeline=None):
+    """Run a ``build_command`` argv on the warm worker for ``python``.
+
+    Returns None, after logging why, when the worker is unavailable, so the
+    caller can start PyInstaller directly instead.
+    """
+    if not warm_worker_supported():
+        on_output("[WARNING] The warm PyInstaller worker needs os.fork(); starting PyInstaller directly\n")
+        return None
+    try:
+        worker = get_worker(python, on_output)
+    except RuntimeError as e:
+        on_output(f"[WARNING] Could not start the warm PyInstaller worker ({e}); starting PyInstaller directly\n")
+        return None
+    args = cmd[len(pyinstaller_command(python)):]
+    return worker.run(args, on_output, cancel_event, timeline)
+
+
+def shutdown_workers():
+    with _workers_lock:
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        worker.close()
@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+
+# =================================================================================
+# Benchmark: log syntax highlighting
+#
+# Highlights a 100k-line build log with the original six-regex highlighter and
+# with LogSyntaxHighlighter, then compares a theme switch done with a full
+# rehighlight() against restyle_visible().
+#
+#   python bench_highlighter.py [line_count]
+# =================================================================================
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Py2exe"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QRegularExpression
+from PySide6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat
+from PySide6.QtWidgets import QApplication
+
+from Py2exe import LogSyntaxHighlighter, ThemeManager, create_log_view, attach_log_highlighter
+
+
+class LegacyLogSyntaxHighlighter(QSyntaxHighlighter):
+    # The highlighter as it was before the single-pass rewrite.
+    def __init__(self, parent, theme_colors):
+        super().__init__(parent)
+        self.highlighting_rules = []
+        self.update_theme(theme_colors)
+
+    def update_theme(self, theme_colors):
+        self.highlighting_rules = []
+        keywords = {
+            'error': r'\[ERROR\]',
+            'success': r'\[SUCCESS\]',
+            'warning': r'\[WARNING\]',
+            'info': r'\[INFO\]',
+            'process': r'\[PROCESS\]',
+            'config': r'\[CONFIG\]',
+        }
+        for key, pattern in keywords.items():
+            text_format = QTextCharFormat()
+            text_format.setForeground(QColor(theme_colors.get(key, theme_colors['text'])))
+            text_format.setFontWeight(QFont.Weight.Bold)
+            self.highlighting_rules.append((QRegularExpression(pattern), text_format))
+
+    def highlightBlock(self, text):
+        for pattern, text_format in self.highlighting_rules:
+            it = pattern.globalMatch(text)
+            while it.hasNext():
+                match = it.next()
+                self.setFormat(match.capturedStart(), match.capturedLength(), text_format)
+
+
+def make_log(line_count):
+    samples = [
+        "{i} INFO: Analyzing hidden import 'package.module_{i}'",
+        "{i} WARNING: Hidden import 'optional_{i}' not found",
+        "[CONFIG] Hidden imports: module_{i}",
+        "[INFO] Processing module {i}",
+        "  File \"lib/site-packages/pkg/mod_{i}.py\", line 12",
+    ]
+    return "\n".join(samples[i % len(samples)].format(i=i) for i in range(line_count))
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    app = QApplication.instance() or QApplication([])
+    light, dark = ThemeManager.THEMES["light"], ThemeManager.THEMES["dark"]
+    text = make_log(line_count)
+
+    for label, highlighter_class in (("before (6 regex passes)", LegacyLogSyntaxHighlighter),
+                                     ("after (single pass)", LogSyntaxHighlighter)):
+        view = create_log_view(line_count + 1)
+        view.setPlainText(text)
+        highlighter = highlighter_class(view.document(), light)
+        elapsed = timed(highlighter.rehighlight)
+        print(f"highlight {line_count} lines, {label}: {elapsed:.2f}s = {line_count / elapsed:,.0f} lines/s")
+
+    view = create_log_view(line_count + 1)
+    view.resize(420, 700)
+    view.show()
+    view.setPlainText(text)
+    highlighter = attach_log_highlighter(view, light)
+    app.processEvents()
+
+    def full_switch():
+        highlighter.update_theme(dark)
+        highlighter.rehighlight()
+
+    def lazy_switch():
+        highlighter.update_theme(light)
+        highlighter.restyle_visible(view)
+
+    print(f"theme switch, full rehighlight (before): {timed(full_switch) * 1000:.1f} ms")
+    print(f"theme switch, visible blocks only (after): {timed(lazy_switch) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
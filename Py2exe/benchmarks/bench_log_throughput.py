@@ -0,0 +1,117 @@
+import os
+import sys
+import time
+import subprocess
+
+# =================================================================================
+# Benchmark: build log throughput
+#
+# Measures lines/sec through the log path a build uses: the subprocess reader in
+# build_core (batched delivery) and the GUI log view append (one edit per chunk).
+#
+#   python bench_log_throughput.py [line_count]
+#
+# Absolute rates depend on the machine, so the targets are relative to per-line
+# baselines measured in the same run: run_command keeps at least 80% of a
+# readline loop's rate with 100x fewer callbacks, and the log view takes batches
+# at least 5x faster than line-by-line appends. Reference run (1-core Xeon VM,
+# 100k lines): run_command 236k lines/s in 101 callbacks; log view 1.3k lines/s
+# per line vs 16.7k lines/s batched.
+# =================================================================================
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Py2exe"))
+
+from build_core import run_command
+
+LINE = "{i} INFO: Analyzing hidden import 'package.module_{i}' from hook-package.py\n"
+CORE_MIN_RATIO = 0.8
+CORE_CALLBACK_REDUCTION = 100
+GUI_MIN_SPEEDUP = 5
+# Line-by-line appends are slow; the GUI baseline only runs on this many lines.
+GUI_BASELINE_LINES = 10_000
+
+
+def _generator(line_count):
+    return f"import sys\nfor i in range({line_count}):\n    sys.stdout.write({LINE!r}.format(i=i))\n"
+
+
+def bench_core_per_line(line_count):
+    """A readline loop with one callback per line, as run_command worked before batching."""
+    lines = []
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", _generator(line_count)], stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in process.stdout:
+        lines.append(line)
+    process.wait()
+    return len(lines), time.perf_counter() - start
+
+
+def bench_core(line_count):
+    generator = _generator(line_count)
+    chunks = []
+    start = time.perf_counter()
+    run_command([sys.executable, "-c", generator], chunks.append)
+    elapsed = time.perf_counter() - start
+    return chunks, elapsed
+
+
+def bench_gui(chunks, line_count):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QTextCursor
+    from Py2exe import LogSyntaxHighlighter, ThemeManager, append_to_log_view, create_log_view
+
+    app = QApplication.instance() or QApplication([])
+    results = {}
+
+    def legacy_append(view, text):
+        view.moveCursor(QTextCursor.MoveOperation.End)
+        view.insertPlainText(text)
+        view.verticalScrollBar().setValue(view.verticalScrollBar().maximum())
+
+    lines = [line for chunk in chunks for line in chunk.splitlines(keepends=True)][:GUI_BASELINE_LINES]
+    for label, pieces, append in (("per-line (before)", lines, legacy_append),
+                                  ("batched (after)", chunks, append_to_log_view)):
+        view = create_log_view()
+        LogSyntaxHighlighter(view.document(), ThemeManager.THEMES["light"])
+        view.show()
+        start = time.perf_counter()
+        for piece in pieces:
+            append(view, piece)
+            app.processEvents()
+        line_total = len(pieces) if append is legacy_append else line_count
+        results[label] = (len(pieces), line_total, time.perf_counter() - start)
+        view.close()
+    return results
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    baseline_callbacks, elapsed = bench_core_per_line(line_count)
+    baseline_rate = line_count / elapsed
+    print(f"readline loop: {line_count} lines in {elapsed:.2f}s = {baseline_rate:,.0f} lines/s "
+          f"({baseline_callbacks} callbacks)")
+    chunks, elapsed = bench_core(line_count)
+    rate = line_count / elapsed
+    ok = rate >= CORE_MIN_RATIO * baseline_rate and len(chunks) * CORE_CALLBACK_REDUCTION <= baseline_callbacks
+    print(f"run_command: {line_count} lines in {elapsed:.2f}s = {rate:,.0f} lines/s ({len(chunks)} callbacks) "
+          f"[target >= {CORE_MIN_RATIO:.0%} of the readline rate with {CORE_CALLBACK_REDUCTION}x fewer "
+          f"callbacks: {'ok' if ok else 'MISSED'}]")
+
+    try:
+        results = bench_gui(chunks, line_count)
+    except ImportError:
+        print("log view: skipped (PySide6 not installed)")
+        return
+    rates = {}
+    for label, (updates, lines, elapsed) in results.items():
+        rates[label] = lines / elapsed
+        print(f"log view {label}: {lines} lines in {updates} updates in {elapsed:.2f}s = {rates[label]:,.0f} lines/s")
+    speedup = rates["batched (after)"] / rates["per-line (before)"]
+    print(f"log view speedup {speedup:.1f}x [target >= {GUI_MIN_SPEEDUP}x: "
+          f"{'ok' if speedup >= GUI_MIN_SPEEDUP else 'MISSED'}]")
+
+
+if __name__ == "__main__":
+    main()